@@ -9,7 +9,30 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, rotate_z, project_point
+import numpy as np
+
+from geometry import (ParametricCurve, Transform, depth_colors, draw_segments, project_points,
+                      scatter, scatter_glow)
+
+
+# Strand A, and strand B offset by PI (one curve per row)
+STRAND_OFFSETS = np.array([[0.0], [math.pi]])
+
+# Base pairs: every 6th of the original 80 steps up the helix
+RUNGS = np.arange(0, 81, 6) / 80
+
+
+def helix_position(y_norm, radius, length, twist, rotation):
+    """Both strands: y_norm runs from the bottom (0) to the top (1)."""
+    # Calculate Y position (centered)
+    y = (y_norm - 0.5) * length
+    
+    # Twist angle
+    angle = (y_norm * math.pi * twist) + rotation + STRAND_OFFSETS
+    return radius * np.cos(angle), y, radius * np.sin(angle)
+
+
+HELIX = ParametricCurve(helix_position, (0, 1))
 
 
 def render_helix(buffer, width, height, time, theme_manager):
@@ -27,88 +50,52 @@ def render_helix(buffer, width, height, time, theme_manager):
     STRAND_RADIUS = 2.0
     HELIX_HEIGHT = 14.0
     
-    # Increase step count for smoother, denser strands
-    STRAND_LENGTH_STEPS = 80
     TWIST_TIGHTNESS = 3.0
     
     # Animation Variables
     rotation_speed = time * 0.8
     wobble_angle = math.sin(time * 0.5) * 0.2
-    
-    scroll_offset = (time * 2.0) % (HELIX_HEIGHT / 4.0)
 
-    # 1. Generate Points & Rungs
-    points_A = []
-    points_B = []
+    strands = dict(radius=STRAND_RADIUS, length=HELIX_HEIGHT, twist=TWIST_TIGHTNESS,
+                   rotation=rotation_speed)
     
-    # Generate points across the height
-    for i in range(STRAND_LENGTH_STEPS + 1):
-        y_norm = i / STRAND_LENGTH_STEPS
-        
-        # Calculate Y position (centered)
-        y = (y_norm - 0.5) * HELIX_HEIGHT
-        
-        # Twist angle
-        base_angle = (y_norm * math.pi * TWIST_TIGHTNESS) + rotation_speed
-        
-        # Strand A center
-        xA = STRAND_RADIUS * math.cos(base_angle)
-        zA = STRAND_RADIUS * math.sin(base_angle)
-        
-        # Strand B center (offset by PI)
-        xB = STRAND_RADIUS * math.cos(base_angle + math.pi)
-        zB = STRAND_RADIUS * math.sin(base_angle + math.pi)
-
-        # Apply global rotation/wobble
-        ptA = rotate_x(rotate_y((xA, y, zA), wobble_angle), wobble_angle * 0.5)
-        ptB = rotate_x(rotate_y((xB, y, zB), wobble_angle), wobble_angle * 0.5)
-        
-        points_A.append(ptA)
-        points_B.append(ptB)
-        
-        # Draw Rungs (Connecting base pairs)
-        # We draw them directly here using draw_thick_line
-        if i % 6 == 0: # Every 6th step
-            # Project endpoints
-            projA = project_point(ptA[0], ptA[1], ptA[2], width, height)
-            projB = project_point(ptB[0], ptB[1], ptB[2], width, height)
-            
-            if projA and projB:
-                sxA, syA = projA
-                sxB, syB = projB
-                
-                # Color based on depth
-                avg_z = (ptA[2] + ptB[2]) / 2
-                color = theme_manager.get_color_for_depth(avg_z, -STRAND_RADIUS, STRAND_RADIUS)
-                
-                # Draw thick rung
-                # Use thickness 1 for distant, 2 for close
-                thickness = 2 if avg_z < 0 else 1
-                buffer.draw_thick_line(sxA, syA, sxB, syB, "≡", avg_z, color, thickness=thickness)
-                
-                # Add a glow in the center for the "Hydrogen Bond"
-                mx = (sxA + sxB) // 2
-                my = (syA + syB) // 2
-                if thickness > 1:
-                    buffer.set_pixel_with_glow(mx, my, "●", avg_z - 0.1, theme_manager.get_accent(), glow_radius=2, theme_manager=theme_manager)
+    # Apply global rotation/wobble
+    rotation = Transform().rotate_y(wobble_angle).rotate_x(wobble_angle * 0.5)
+    
+    # 1. Draw Rungs (Connecting base pairs): strand A ends, then strand B ends
+    ends = rotation.apply(HELIX.evaluate(RUNGS, **strands))
+    screen_x, screen_y, z, valid = project_points(ends, width, height)
+    rungs = valid[0] & valid[1]
+    screen_x, screen_y, z = screen_x[:, rungs], screen_y[:, rungs], z[:, rungs]
+    
+    # Color based on depth
+    avg_z = (z[0] + z[1]) / 2
+    colors = depth_colors(theme_manager, avg_z, -STRAND_RADIUS, STRAND_RADIUS)
+    
+    # Use thickness 1 for distant, 2 for close
+    thickness = np.where(avg_z < 0, 2, 1)
+    draw_segments(buffer, screen_x[0], screen_y[0], screen_x[1], screen_y[1], avg_z, "≡", colors,
+                  thickness=thickness)
+    
+    # Add a glow in the center of close rungs for the "Hydrogen Bond"
+    close = thickness > 1
+    mx = (screen_x[0] + screen_x[1])[close] // 2
+    my = (screen_y[0] + screen_y[1])[close] // 2
+    accent = theme_manager.get_accent()
+    scatter(buffer, mx, my, avg_z[close] - 0.1, "●", accent)
+    scatter_glow(buffer, mx, my, avg_z[close] - 0.1, accent, glow_radius=2)
 
-    # 2. Draw Strands (Thick)
-    for i in range(len(points_A)):
-        for pt, strand_id in [(points_A[i], 'A'), (points_B[i], 'B')]:
-            x, y, z = pt
-            proj = project_point(x, y, z, width, height)
-            if not proj:
-                continue
-            sx, sy = proj
-            
-            color = theme_manager.get_color_for_depth(z, -STRAND_RADIUS, STRAND_RADIUS)
-            
-            # Thick Strand Rendering
-            # Draw a 2x2 block for the strand backbone
-            char = "█"
-            buffer.set_pixel_with_glow(sx, sy, char, z, color, glow_radius=1, theme_manager=theme_manager)
-            buffer.set_pixel(sx + 1, sy, "▌", z, color) # Add visual width
-            buffer.set_pixel(sx, sy + 1, "▀", z, color) # Add visual height
+    # 2. Draw Strands (Thick), points spaced evenly along them on screen
+    points = rotation.apply(HELIX.sample_adaptive(rotation, width, height, spacing=1.0, **strands))
+    screen_x, screen_y, z, valid = project_points(points, width, height)
+    sx, sy, z = screen_x[valid], screen_y[valid], z[valid]
+    colors = depth_colors(theme_manager, z, -STRAND_RADIUS, STRAND_RADIUS)
+    
+    # Draw a 2x2 block for the strand backbone: add visual width and height
+    blocks = np.array(["█", "▌", "▀"], dtype=object)
+    scatter(buffer, np.stack([sx, sx + 1, sx], -1), np.stack([sy, sy, sy + 1], -1),
+            np.repeat(z, 3), np.tile(blocks, len(z)), np.repeat(colors, 3))
+    scatter_glow(buffer, sx, sy, z, colors, glow_radius=1)
             
     # Return approx Z range for consistency (though not strictly needed if we color inside)
     return (-STRAND_RADIUS, STRAND_RADIUS)
@@ -8,7 +8,29 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import project_point
+import numpy as np
+
+from shader_engine import escape_time, quadratic_step
+from animations.utils.perturbation import DeepZoom
+
+# Float64 pixel coordinates resolve the set down to about this zoom; deeper
+# frames are rendered by perturbation around a high-precision reference
+DEEP_ZOOM = 1000
+MAX_ZOOM = 1e250  # float64 pixel offsets underflow past this
+DEEP_MAX_ITER = 5000
+
+# Deep zoom state (refined target, reference orbit) per zoom target
+_deep_zooms = {}
+
+
+def complex_grid(width, height, zoom, center_x, center_y):
+    """
+    Complex plane coordinates of every drawn cell, shape (height - 1, width).
+    Adjusts for aspect ratio (cells are about twice as tall as wide).
+    """
+    x = (np.arange(width) - width / 2) / (width / 4) / zoom + center_x
+    y = (np.arange(height - 1) - height / 2) / (height / 2) / zoom + center_y
+    return x[np.newaxis, :] + 1j * y[:, np.newaxis]
 
 
 def render_julia(buffer, width, height, time, theme_manager):
@@ -35,46 +57,24 @@ def render_julia(buffer, width, height, time, theme_manager):
     # Character ramp for iteration depth
     chars = " .'`^\",:;Il!i><~+_-?][}{1)(|/tfjrxnuvczXYUJCLQ0OZmwqpdbkhao*#MW&8%B@$"
     
-    all_points = []
-    
-    # Sample the fractal at screen resolution
-    for py in range(height - 1):
-        for px in range(width):
-            # Map pixel to complex plane
-            # Adjust for aspect ratio
-            x0 = (px - width / 2) / (width / 4) / zoom + pan_x
-            y0 = (py - height / 2) / (height / 2) / zoom + pan_y
-            
-            x, y = x0, y0
-            iteration = 0
-            
-            # Julia set iteration: z = z^2 + c
-            while x*x + y*y <= 4 and iteration < max_iter:
-                xtemp = x*x - y*y + cr
-                y = 2*x*y + ci
-                x = xtemp
-                iteration += 1
-            
-            if iteration < max_iter:
-                # Map iteration to character and color
-                # Smooth coloring
-                log_zn = math.log(x*x + y*y) / 2
-                nu = math.log(log_zn / math.log(2)) / math.log(2) if log_zn > 0 else 0
-                iteration = iteration + 1 - nu
-                
-                # Normalize iteration for color mapping
-                normalized = iteration / max_iter
-                
-                # Get character based on iteration
-                char_idx = int(normalized * (len(chars) - 1))
-                char_idx = max(0, min(len(chars) - 1, char_idx))
-                char = chars[char_idx]
-                
-                # Use iteration as pseudo-depth for 3D effect
-                z_depth = 1.0 - normalized  # Higher iteration = further away
-                
-                color = theme_manager.get_color_for_depth(z_depth, 0, 1)
-                buffer.set_pixel(px, py, char, z_depth, color)
+    # Julia set iteration: z = z^2 + c, for every cell at once
+    result = escape_time(quadratic_step, complex_grid(width, height, zoom, pan_x, pan_y),
+                         complex(cr, ci), max_iter=max_iter)
+    
+    # Smooth coloring, normalized for color mapping
+    normalized = result.smooth / max_iter
+    
+    # Get character based on iteration
+    char_idx = np.clip((normalized * (len(chars) - 1)).astype(int), 0, len(chars) - 1)
+    
+    # Use iteration as pseudo-depth for 3D effect
+    z_depth = 1.0 - normalized  # Higher iteration = further away
+    
+    # Only escaped points are drawn
+    for py, px in zip(*np.nonzero(result.escaped)):
+        depth = float(z_depth[py, px])
+        color = theme_manager.get_color_for_depth(depth, 0, 1)
+        buffer.set_pixel(px, py, chars[char_idx[py, px]], depth, color)
     
     return (0, 1)
 
@@ -84,7 +84,8 @@ def render_mandelbrot(buffer, width, height, time, theme_manager):
     Render a Mandelbrot set with animated zoom.
     
     Features:
-    - Continuous zoom into interesting regions
+    - Continuous zoom into interesting regions, past float64 precision
+      by perturbation (animations/utils/perturbation.py)
     - Smooth coloring
     - Color cycling
     """
@@ -98,41 +99,44 @@ def render_mandelbrot(buffer, width, height, time, theme_manager):
     
     # Exponential zoom
     zoom = 0.5 * math.exp(time * 0.1)
-    zoom = min(zoom, 1000)  # Cap zoom
+    zoom = min(zoom, MAX_ZOOM)  # Cap zoom
     
-    max_iter = 80
+    # Deeper zooms need more iterations to resolve the boundary
+    max_iter = min(int(80 + 40 * math.log2(zoom / 0.5)), DEEP_MAX_ITER)
     
     chars = " .:-=+*#%@"
     
-    for py in range(height - 1):
-        for px in range(width):
-            # Map to complex plane with zoom
-            x0 = (px - width / 2) / (width / 4) / zoom + target_x
-            y0 = (py - height / 2) / (height / 2) / zoom + target_y
-            
-            x, y = 0.0, 0.0
-            iteration = 0
-            
-            # Mandelbrot iteration: z = z^2 + c where c is the point
-            while x*x + y*y <= 4 and iteration < max_iter:
-                xtemp = x*x - y*y + x0
-                y = 2*x*y + y0
-                x = xtemp
-                iteration += 1
-            
-            if iteration < max_iter:
-                # Smooth coloring
-                normalized = iteration / max_iter
-                
-                # Color cycling effect
-                hue_shift = (time * 0.5) % 1.0
-                normalized = (normalized + hue_shift) % 1.0
-                
-                char_idx = int(normalized * (len(chars) - 1))
-                char = chars[max(0, min(len(chars) - 1, char_idx))]
-                
-                z_depth = 1.0 - (iteration / max_iter)
-                color = theme_manager.get_color_for_depth(z_depth, 0, 1)
-                buffer.set_pixel(px, py, char, z_depth, color)
+    if zoom <= DEEP_ZOOM:
+        # Mandelbrot iteration: z = z^2 + c where c is the point
+        c = complex_grid(width, height, zoom, target_x, target_y)
+        result = escape_time(quadratic_step, np.zeros_like(c), c, max_iter=max_iter)
+        iteration, escaped = result.iterations, result.escaped
+        depth = iteration / max_iter
+    else:
+        # Deep zoom: iterate pixel offsets from a high-precision reference
+        deep = _deep_zooms.get((target_x, target_y))
+        if deep is None:
+            deep = _deep_zooms[(target_x, target_y)] = DeepZoom(repr(target_x), repr(target_y))
+        dc = complex_grid(width, height, zoom, 0.0, 0.0)
+        iteration, escaped = deep.escape(dc, zoom, max_iter)
+        
+        # A deep view spans a narrow band of a large budget: color over the
+        # iterations actually on screen, ignoring the slowest few percent
+        if escaped.any():
+            low, high = np.percentile(iteration[escaped], [0, 90])
+        else:
+            low, high = 0, max_iter
+        depth = np.clip((iteration - low) / max(high - low, 1), 0.0, 1.0)
+    
+    # Color cycling effect
+    hue_shift = (time * 0.5) % 1.0
+    normalized = (depth + hue_shift) % 1.0
+    char_idx = np.clip((normalized * (len(chars) - 1)).astype(int), 0, len(chars) - 1)
+    z_depth = 1.0 - depth
+    
+    for py, px in zip(*np.nonzero(escaped)):
+        depth = float(z_depth[py, px])
+        color = theme_manager.get_color_for_depth(depth, 0, 1)
+        buffer.set_pixel(px, py, chars[char_idx[py, px]], depth, color)
     
     return (0, 1)
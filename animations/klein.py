@@ -9,7 +9,32 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, rotate_z, project_point
+import numpy as np
+
+from geometry import ParametricSurface, Transform, depth_chars, depth_colors, project_points, scatter
+
+
+def klein_position(u, v, scale):
+    """Klein bottle "figure-8" parametric equations."""
+    cos_u = np.cos(u)
+    sin_u = np.sin(u)
+    cos_v = np.cos(v)
+    
+    # Modified Klein bottle equations for better visualization
+    r = 4 * (1 - cos_u / 2)
+    first_half = u < math.pi
+    
+    x = np.where(first_half,
+                 6 * cos_u * (1 + sin_u) + r * cos_u * cos_v,
+                 6 * cos_u * (1 + sin_u) + r * cos_v * np.cos(u - math.pi))
+    y = np.where(first_half, 16 * sin_u + r * sin_u * cos_v, 16 * sin_u)
+    z = r * np.sin(v)
+    
+    # Scale down but larger than before, centered vertically
+    return x * (0.10 * scale), y * (0.10 * scale) - 0.6, z * (0.10 * scale)
+
+
+KLEIN = ParametricSurface(klein_position, (0, 2 * math.pi), (0, 2 * math.pi))
 
 
 def render_klein(buffer, width, height, time, theme_manager):
@@ -29,65 +54,25 @@ def render_klein(buffer, width, height, time, theme_manager):
     rot_x = time * 0.3 + 0.3
     rot_z = time * 0.2
     
-    all_z = []
-    points_to_draw = []
+    # Apply rotations for continuous movement
+    rotation = Transform().rotate_z(rot_z).rotate_y(rot_y).rotate_x(rot_x)
     
-    # Higher resolution for smoother appearance
-    u_steps = 60
-    v_steps = 30
+    # Resolution from the on-screen size
+    u_steps, v_steps = KLEIN.screen_steps(rotation, width, height, distance=4.5, scale=scale)
     
-    for i in range(u_steps):
-        u = 2 * math.pi * i / u_steps
-        
-        for j in range(v_steps):
-            v = 2 * math.pi * j / v_steps
-            
-            # Klein bottle "figure-8" parametric equations
-            cos_u = math.cos(u)
-            sin_u = math.sin(u)
-            cos_v = math.cos(v)
-            sin_v = math.sin(v)
-            
-            # Modified Klein bottle equations for better visualization
-            r = 4 * (1 - cos_u / 2)
-            
-            if u < math.pi:
-                x = 6 * cos_u * (1 + sin_u) + r * cos_u * cos_v
-                y = 16 * sin_u + r * sin_u * cos_v
-            else:
-                x = 6 * cos_u * (1 + sin_u) + r * cos_v * math.cos(u - math.pi)
-                y = 16 * sin_u
-            
-            z = r * sin_v
-            
-            # Scale down but larger than before
-            x *= 0.10 * scale
-            y *= 0.10 * scale
-            z *= 0.10 * scale
-            
-            # Center vertically
-            y -= 0.6
-            
-            # Apply rotations for continuous movement
-            point = rotate_z((x, y, z), rot_z)
-            point = rotate_y(point, rot_y)
-            point = rotate_x(point, rot_x)
-            x, y, z = point
-            
-            projected = project_point(x, y, z, width, height, distance=4.5)
-            if projected:
-                all_z.append(z)
-                points_to_draw.append((projected[0], projected[1], z))
+    points, _ = KLEIN.sample(u_steps, v_steps, scale=scale)
+    points = rotation.apply(points)
     
-    if not all_z:
+    screen_x, screen_y, z, valid = project_points(points, width, height, distance=4.5)
+    if not valid.any():
         return (0, 1)
+    z = z[valid]
     
-    z_min, z_max = min(all_z), max(all_z)
+    z_min, z_max = float(z.min()), float(z.max())
     
     chars = " .:-=+*#%@"
     
-    for screen_x, screen_y, z in points_to_draw:
-        char, color = theme_manager.get_char_for_depth(z, z_min, z_max, chars)
-        buffer.set_pixel(screen_x, screen_y, char, z, color)
+    scatter(buffer, screen_x[valid], screen_y[valid], z, depth_chars(z, z_min, z_max, chars),
+            depth_colors(theme_manager, z, z_min, z_max))
     
     return (z_min, z_max)
@@ -9,7 +9,17 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, project_point
+import numpy as np
+
+from geometry import (ParametricCurve, Transform, depth_colors, draw_segments, polyline_segments,
+                      project_points, scatter, scatter_glow)
+
+
+def lissajous_position(t, a, b, c, delta, scale):
+    return np.sin(a * t + delta) * scale, np.sin(b * t) * scale, np.sin(c * t) * scale
+
+
+LISSAJOUS = ParametricCurve(lissajous_position, (0, 2 * math.pi))
 
 
 def render_lissajous(buffer, width, height, time, theme_manager):
@@ -28,51 +38,29 @@ def render_lissajous(buffer, width, height, time, theme_manager):
     rot_y = time * 0.4
     rot_x = 0.5 + math.sin(time * 0.2) * 0.2
     
-    num_points = 200 # Lower point count if connecting lines
-    
-    points = []
-    
-    # Generate points
-    for i in range(num_points + 1):
-        t = 2 * math.pi * i / num_points
-        
-        x = math.sin(a * t + delta) * SCALE
-        y = math.sin(b * t) * SCALE
-        z = math.sin(c * t) * SCALE
-        
-        point = rotate_y((x, y, z), rot_y)
-        point = rotate_x(point, rot_x)
-        points.append(point)
+    # Generate points, spaced evenly along the knot on screen
+    rotation = Transform().rotate_y(rot_y).rotate_x(rot_x)
+    points = rotation.apply(LISSAJOUS.sample_adaptive(rotation, width, height, a=a, b=b, c=c,
+                                                      delta=delta, scale=SCALE))
 
-    if not points:
-        return (0, 1)
-
-    z_vals = [p[2] for p in points]
-    z_min, z_max = min(z_vals), max(z_vals)
+    z_min, z_max = float(points[:, 2].min()), float(points[:, 2].max())
     
     # Draw connected thick lines
-    for i in range(len(points) - 1):
-        p1 = points[i]
-        p2 = points[i+1]
-        
-        proj1 = project_point(p1[0], p1[1], p1[2], width, height)
-        proj2 = project_point(p2[0], p2[1], p2[2], width, height)
-        
-        if proj1 and proj2:
-            avg_z = (p1[2] + p2[2]) / 2
-            
-            # Use thickness 2 for closer parts
-            thickness = 2 if avg_z < 0 else 1
-            char = "█" if thickness > 1 else "≡"
-            color = theme_manager.get_color_for_depth(avg_z, z_min, z_max)
-            
-            buffer.draw_thick_line(proj1[0], proj1[1], proj2[0], proj2[1], char, avg_z, color, thickness=thickness)
+    screen_x, screen_y, z, valid = project_points(points, width, height)
+    x0, y0, x1, y1, avg_z, _ = polyline_segments(screen_x[np.newaxis], screen_y[np.newaxis],
+                                                 z[np.newaxis], valid[np.newaxis])
+    
+    # Use thickness 2 for closer parts
+    thickness = np.where(avg_z < 0, 2, 1)
+    chars = np.where(thickness > 1, "█", "≡").astype(object)
+    draw_segments(buffer, x0, y0, x1, y1, avg_z, chars,
+                  depth_colors(theme_manager, avg_z, z_min, z_max), thickness=thickness)
 
-    # Add some glow markers along the curve
-    for i in range(0, len(points), 20):
-        p = points[i]
-        proj = project_point(p[0], p[1], p[2], width, height)
-        if proj:
-            buffer.set_pixel_with_glow(proj[0], proj[1], "@", p[2]-0.1, theme_manager.get_accent(), glow_radius=1, theme_manager=theme_manager)
+    # Add some glow markers along the curve (ten, evenly spaced)
+    markers = np.arange(0, len(points), max(len(points) // 10, 1))
+    markers = markers[valid[markers]]
+    accent = theme_manager.get_accent()
+    scatter(buffer, screen_x[markers], screen_y[markers], z[markers] - 0.1, "@", accent)
+    scatter_glow(buffer, screen_x[markers], screen_y[markers], z[markers] - 0.1, accent, glow_radius=1)
 
     return (z_min, z_max)
@@ -9,7 +9,24 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, rotate_z, project_point
+import numpy as np
+
+from geometry import (ParametricSurface, Transform, depth_colors, palette, project_points,
+                      ramp_index, scatter, scatter_glow)
+
+
+def mobius_position(u, v, radius):
+    """u around the strip, v across it (-1 to 1)."""
+    half_u = u / 2
+    tmp = (1 + (v / 2.0) * np.cos(half_u))
+    
+    x = radius * tmp * np.cos(u)
+    y = radius * tmp * np.sin(u)
+    z = radius * (v / 2.0) * np.sin(half_u)
+    return x, y, z
+
+
+MOBIUS = ParametricSurface(mobius_position, (0, 2 * math.pi), (-1, 1), v_endpoint=True)
 
 
 def render_mobius(buffer, width, height, time, theme_manager):
@@ -22,60 +39,34 @@ def render_mobius(buffer, width, height, time, theme_manager):
     rot_x = time * 0.5
     rot_z = time * 0.3
     
-    u_steps = 100 # Increased density
-    v_steps = 20
+    rotation = Transform().rotate_x(rot_x).rotate_z(rot_z)
+    
+    # Resolution from the on-screen size
+    u_steps, v_steps = MOBIUS.screen_steps(rotation, width, height, radius=RADIUS)
     
-    all_z = []
-    points_to_draw = []
+    points, _ = MOBIUS.sample(u_steps, v_steps, radius=RADIUS)
+    points = rotation.apply(points)
     
-    for i in range(u_steps):
-        u = 2 * math.pi * i / u_steps
-        
-        for j in range(v_steps):
-            v = -1 + 2 * j / (v_steps - 1)
-            
-            # Parametric Mobius
-            half_u = u / 2
-            cos_half_u = math.cos(half_u)
-            sin_half_u = math.sin(half_u)
-            
-            tmp = (1 + (v / 2.0) * cos_half_u)
-            
-            x = RADIUS * tmp * math.cos(u)
-            y = RADIUS * tmp * math.sin(u)
-            z = RADIUS * (v / 2.0) * sin_half_u
-            
-            point = rotate_x((x, y, z), rot_x)
-            point = rotate_z(point, rot_z)
-            x, y, z = point
-            
-            # Uses safe scaling
-            projected = project_point(x, y, z, width, height)
-            if projected:
-                # Edge detection
-                is_edge = abs(v) > 0.8
-                all_z.append(z)
-                points_to_draw.append((projected[0], projected[1], z, is_edge))
+    # Edge detection
+    _, v = MOBIUS.grid(u_steps, v_steps)
+    is_edge = np.broadcast_to(np.abs(v) > 0.8, (u_steps, v_steps)).reshape(-1)
     
-    if not all_z:
+    # Uses safe scaling
+    screen_x, screen_y, z, valid = project_points(points, width, height)
+    if not valid.any():
         return (0, 1)
+    screen_x, screen_y, z, is_edge = screen_x[valid], screen_y[valid], z[valid], is_edge[valid]
     
-    z_min, z_max = min(all_z), max(all_z)
+    z_min, z_max = float(z.min()), float(z.max())
     
     surface_chars = " .:-=+"
     
-    for screen_x, screen_y, z, is_edge in points_to_draw:
-        color = theme_manager.get_color_for_depth(z, z_min, z_max)
-        
-        if is_edge:
-            # Thick Edge
-            char = '█'
-            buffer.set_pixel_with_glow(screen_x, screen_y, char, z, theme_manager.get_accent(), glow_radius=1, theme_manager=theme_manager)
-        else:
-            # Surface
-            z_norm = (z - z_min) / (z_max - z_min) if z_max != z_min else 0.5
-            idx = int(z_norm * (len(surface_chars) - 1))
-            char = surface_chars[max(0, min(len(surface_chars) - 1, idx))]
-            buffer.set_pixel(screen_x, screen_y, char, z, color)
+    # Surface: character by depth; thick edge: full block in the accent color
+    z_norm = (z - z_min) / (z_max - z_min) if z_max != z_min else np.full(z.shape, 0.5)
+    accent = theme_manager.get_accent()
+    chars = np.where(is_edge, "█", palette(surface_chars)[ramp_index(z_norm, len(surface_chars))])
+    colors = np.where(is_edge, accent, depth_colors(theme_manager, z, z_min, z_max))
+    scatter(buffer, screen_x, screen_y, z, chars, colors)
+    scatter_glow(buffer, screen_x[is_edge], screen_y[is_edge], z[is_edge], accent, glow_radius=1)
     
     return (z_min, z_max)
@@ -8,209 +8,94 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import normalize_3d, dot_product
+import numpy as np
 
+from shader_engine import march, run_shader_animation
+from animations.utils import sdf
 
-def sdf_sphere(point, center, radius):
-    """Signed distance to a sphere."""
-    dx = point[0] - center[0]
-    dy = point[1] - center[1]
-    dz = point[2] - center[2]
-    return math.sqrt(dx*dx + dy*dy + dz*dz) - radius
+MAX_STEPS = 64
+MAX_DIST = 20.0
+CAMERA_Z = -5.0
 
+# Surface points start their shadow rays this far off the surface
+SHADOW_OFFSET = 0.02
 
-def sdf_box(point, center, size):
-    """Signed distance to a box."""
-    dx = abs(point[0] - center[0]) - size[0]
-    dy = abs(point[1] - center[1]) - size[1]
-    dz = abs(point[2] - center[2]) - size[2]
-    
-    # Outside distance
-    outside = math.sqrt(max(dx, 0)**2 + max(dy, 0)**2 + max(dz, 0)**2)
-    # Inside distance
-    inside = min(max(dx, dy, dz), 0)
-    
-    return outside + inside
 
-
-def sdf_torus(point, center, major_r, minor_r):
-    """Signed distance to a torus."""
-    # Torus centered at origin, then offset
-    px = point[0] - center[0]
-    py = point[1] - center[1]
-    pz = point[2] - center[2]
-    
-    # Distance in xz plane from center
-    q = math.sqrt(px*px + pz*pz) - major_r
-    return math.sqrt(q*q + py*py) - minor_r
-
-
-def sdf_union(d1, d2):
-    """Union of two SDFs."""
-    return min(d1, d2)
-
-
-def sdf_intersection(d1, d2):
-    """Intersection of two SDFs."""
-    return max(d1, d2)
-
-
-def sdf_difference(d1, d2):
-    """Subtract d2 from d1."""
-    return max(d1, -d2)
-
-
-def sdf_smooth_union(d1, d2, k=0.5):
-    """Smooth minimum for blending shapes."""
-    h = max(k - abs(d1 - d2), 0) / k
-    return min(d1, d2) - h*h*k*0.25
-
-
-def estimate_normal(point, scene_sdf, epsilon=0.001):
-    """Estimate surface normal using finite differences."""
-    dx = scene_sdf((point[0] + epsilon, point[1], point[2])) - \
-         scene_sdf((point[0] - epsilon, point[1], point[2]))
-    dy = scene_sdf((point[0], point[1] + epsilon, point[2])) - \
-         scene_sdf((point[0], point[1] - epsilon, point[2]))
-    dz = scene_sdf((point[0], point[1], point[2] + epsilon)) - \
-         scene_sdf((point[0], point[1], point[2] - epsilon))
-    
-    return normalize_3d((dx, dy, dz))
-
-
-def raymarch(origin, direction, scene_sdf, max_steps=64, max_dist=20, epsilon=0.01):
+def build_scene(time):
     """
-    March a ray through the scene using sphere tracing.
-    Returns (hit, distance, steps) tuple.
+    Sphere with a cube hole (boolean difference), with a second sphere
+    orbiting through it (smooth union).
     """
-    total_distance = 0
-    
-    for step in range(max_steps):
-        point = (
-            origin[0] + direction[0] * total_distance,
-            origin[1] + direction[1] * total_distance,
-            origin[2] + direction[2] * total_distance
-        )
-        
-        distance = scene_sdf(point)
-        
-        if distance < epsilon:
-            return (True, total_distance, step)
-        
-        total_distance += distance
-        
-        if total_distance > max_dist:
-            break
-    
-    return (False, total_distance, max_steps)
+    cube_center = (
+        0.5 * math.sin(time * 0.7),
+        0.5 * math.cos(time * 0.6),
+        0.5 * math.sin(time * 0.8)
+    )
+    sphere2_center = (
+        1.5 * math.sin(time * 0.4),
+        0.0,
+        1.5 * math.cos(time * 0.4)
+    )
+    main = sdf.Sphere((0.0, 0.0, 0.0), 1.5) - sdf.Box(cube_center, (0.8, 0.8, 0.8))
+    return main.smooth_union(sdf.Sphere(sphere2_center, 0.6), 0.5)
+
+
+def shader_raymarch(u, v, t):
+    # Light position (orbits)
+    light_pos = (
+        3 * math.sin(t * 0.5),
+        2.0,
+        3 * math.cos(t * 0.5) - 3
+    )
+    scene = build_scene(t)
+
+    # Ray direction (simple perspective); UV aspect counts whole cells,
+    # which are about twice as tall as wide
+    x = u * 0.5
+    inv_len = 1.0 / np.sqrt(x * x + v * v + 1.0)
+    rd_x, rd_y, rd_z = x * inv_len, v * inv_len, inv_len
+
+    # Only rays through the scene's bounding sphere are marched, and only
+    # across it
+    origin = (0.0, 0.0, CAMERA_Z)
+    crosses, t_enter, t_exit = scene.ray_interval(origin, (rd_x, rd_y, rd_z))
+    result = march(scene, origin, (rd_x, rd_y, rd_z), max_steps=MAX_STEPS, hit_dist=0.01,
+                   max_dist=np.minimum(t_exit, MAX_DIST), active=crosses, t_start=t_enter)
+
+    # Shade the hit points only
+    hit = result.hit
+    depth = result.t[hit]
+    px = rd_x[hit] * depth
+    py = rd_y[hit] * depth
+    pz = rd_z[hit] * depth + CAMERA_Z
+    nx, ny, nz = sdf.normals(scene, px, py, pz)
+
+    # Diffuse lighting
+    lx, ly, lz = light_pos[0] - px, light_pos[1] - py, light_pos[2] - pz
+    inv_len = 1.0 / np.sqrt(lx * lx + ly * ly + lz * lz)
+    diffuse = np.maximum(0.0, (nx * lx + ny * ly + nz * lz) * inv_len)
+
+    # Soft shadows, only where the surface faces the light
+    lit = diffuse > 0.0
+    diffuse[lit] *= sdf.soft_shadow(scene, px[lit] + nx[lit] * SHADOW_OFFSET,
+                                    py[lit] + ny[lit] * SHADOW_OFFSET,
+                                    pz[lit] + nz[lit] * SHADOW_OFFSET, light_pos)
+
+    # Ambient occlusion approximation from step count
+    ao = 1.0 - result.steps[hit] / MAX_STEPS
+
+    intensity = np.zeros_like(u)
+    intensity[hit] = diffuse * 0.8 + ao * 0.2
+    return intensity
 
 
 def render_raymarch(buffer, width, height, time, theme_manager):
     """
     Render a raymarched scene with boolean operations.
-    
+
     Features:
     - Sphere with cube hole (boolean difference)
     - Real-time lighting
     - Soft shadows
     """
-    # Camera setup
-    camera_pos = (0, 0, -5)
-    
-    # Light position (orbits)
-    light_pos = (
-        3 * math.sin(time * 0.5),
-        2,
-        3 * math.cos(time * 0.5) - 3
-    )
-    
-    # Animated scene elements
-    sphere_center = (0, 0, 0)
-    sphere_radius = 1.5
-    
-    cube_center = (
-        0.5 * math.sin(time * 0.7),
-        0.5 * math.cos(time * 0.6),
-        0.5 * math.sin(time * 0.8)
-    )
-    cube_size = (0.8, 0.8, 0.8)
-    
-    # Second sphere for smooth union
-    sphere2_center = (
-        1.5 * math.sin(time * 0.4),
-        0,
-        1.5 * math.cos(time * 0.4)
-    )
-    
-    def scene_sdf(point):
-        """Combined scene SDF."""
-        # Main sphere
-        d_sphere = sdf_sphere(point, sphere_center, sphere_radius)
-        
-        # Cube to subtract
-        d_cube = sdf_box(point, cube_center, cube_size)
-        
-        # Sphere with cube hole
-        d_main = sdf_difference(d_sphere, d_cube)
-        
-        # Second sphere blending in
-        d_sphere2 = sdf_sphere(point, sphere2_center, 0.6)
-        
-        return sdf_smooth_union(d_main, d_sphere2, 0.5)
-    
-    # Character ramp for lighting
-    chars = " .,:;+*#@"
-    
-    # Render each pixel
-    for py in range(height - 1):
-        for px in range(width):
-            # Map pixel to normalized device coordinates
-            # Account for aspect ratio
-            aspect = (width / 2) / height
-            ndc_x = (px / width * 2 - 1) * aspect
-            ndc_y = -(py / height * 2 - 1)
-            
-            # Ray direction (simple perspective)
-            ray_dir = normalize_3d((ndc_x, ndc_y, 1))
-            
-            # Raymarch
-            hit, dist, steps = raymarch(camera_pos, ray_dir, scene_sdf)
-            
-            if hit:
-                # Calculate hit point
-                hit_point = (
-                    camera_pos[0] + ray_dir[0] * dist,
-                    camera_pos[1] + ray_dir[1] * dist,
-                    camera_pos[2] + ray_dir[2] * dist
-                )
-                
-                # Get surface normal
-                normal = estimate_normal(hit_point, scene_sdf)
-                
-                # Light direction
-                to_light = normalize_3d((
-                    light_pos[0] - hit_point[0],
-                    light_pos[1] - hit_point[1],
-                    light_pos[2] - hit_point[2]
-                ))
-                
-                # Diffuse lighting
-                diffuse = max(0, dot_product(normal, to_light))
-                
-                # Ambient occlusion approximation from step count
-                ao = 1 - steps / 64
-                
-                # Final intensity
-                intensity = diffuse * 0.8 + ao * 0.2
-                
-                # Map to character
-                char_idx = int(intensity * (len(chars) - 1))
-                char_idx = max(0, min(len(chars) - 1, char_idx))
-                char = chars[char_idx]
-                
-                # Color based on distance and normal
-                color = theme_manager.get_color_for_depth(dist, 0, 10)
-                
-                buffer.set_pixel(px, py, char, dist, color)
-    
-    return (0, 10)
+    return run_shader_animation(buffer, width, height, time, theme_manager, shader_raymarch)
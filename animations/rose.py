@@ -9,7 +9,28 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, rotate_z, project_point
+import numpy as np
+
+from engine import rotate_x, project_point
+from geometry import (ParametricCurve, Transform, depth_colors, draw_segments, polyline_segments,
+                      project_points)
+
+
+def rose_position(t, k, turns, phase, base_z, scale, time):
+    """One petal layer per row of phase/base_z."""
+    theta = t * turns
+    
+    # Rose curve equation
+    r = np.cos(k * theta + phase + time) * scale
+    
+    # Convert to Cartesian
+    x = r * np.cos(theta)
+    y = r * np.sin(theta)
+    z = base_z + 0.4 * np.sin(theta * 3 + time * 2)
+    return x, y, z
+
+
+ROSE = ParametricCurve(rose_position, (0, 2 * math.pi))
 
 
 def render_rose(buffer, width, height, time, theme_manager):
@@ -27,59 +48,29 @@ def render_rose(buffer, width, height, time, theme_manager):
     rot_x = 0.9 + 0.2 * math.sin(time * 0.3)
     
     num_curves = 6
-    points_per_curve = 100 # Lower density for connected lines
     
-    all_z = []
+    # Each curve at different phase and height
+    curve = np.arange(num_curves)[:, np.newaxis]
+    petals = dict(k=k, turns=(k if k == int(k) else 4), phase=curve * math.pi / num_curves,
+                  base_z=(curve - num_curves / 2) * height_scale * 0.4, scale=SCALE, time=time)
+    
+    # Apply rotations; points spaced evenly along the curves on screen
+    rotation = Transform().rotate_z(rot_z).rotate_x(rot_x)
+    points = rotation.apply(ROSE.sample_adaptive(rotation, width, height, **petals))
+    
+    # Draw each petal layer as connected lines
+    screen_x, screen_y, z, valid = project_points(points, width, height)
+    x0, y0, x1, y1, avg_z, start = polyline_segments(
+        *(a.reshape(num_curves, -1) for a in (screen_x, screen_y, z, valid)))
+    
+    # Bloom effect on tips (further from center)
+    dist_from_center = np.hypot(points[start, 0], points[start, 1])
     
-    for curve in range(num_curves):
-        # Each curve at different phase and height
-        phase = curve * math.pi / num_curves
-        base_z = (curve - num_curves / 2) * height_scale * 0.4
-        
-        curve_points = []
-        
-        # Generate points for this petal layer
-        for i in range(points_per_curve + 1):
-            theta = 2 * math.pi * i / points_per_curve * (k if k == int(k) else 4)
-            
-            # Rose curve equation
-            r = math.cos(k * theta + phase + time) * SCALE
-            
-            # Convert to Cartesian
-            x = r * math.cos(theta)
-            y = r * math.sin(theta)
-            z = base_z + 0.4 * math.sin(theta * 3 + time * 2)
-            
-            # Apply rotations
-            point = rotate_z((x, y, z), rot_z)
-            point = rotate_x(point, rot_x)
-            
-            curve_points.append(point)
-            all_z.append(point[2])
-            
-        # Draw this petal layer as connected lines
-        for i in range(len(curve_points) - 1):
-            p1 = curve_points[i]
-            p2 = curve_points[i+1]
-            
-            # Skip if r was very small (center clutter)
-            # Actually with lines it looks okay, like a flower center
-            
-            proj1 = project_point(p1[0], p1[1], p1[2], width, height)
-            proj2 = project_point(p2[0], p2[1], p2[2], width, height)
-            
-            if proj1 and proj2:
-                avg_z = (p1[2] + p2[2]) / 2
-                color = theme_manager.get_color_for_depth(avg_z, -2, 2)
-                
-                # Bloom effect on tips (further from center)
-                dist_from_center = math.sqrt(p1[0]**2 + p1[1]**2)
-                
-                # Thickness
-                thick = 2 if avg_z < 0 and dist_from_center > 1.0 else 1
-                char = "█" if thick > 1 else "*"
-                
-                buffer.draw_thick_line(proj1[0], proj1[1], proj2[0], proj2[1], char, avg_z, color, thickness=thick)
+    # Thickness
+    thick = np.where((avg_z < 0) & (dist_from_center > 1.0), 2, 1)
+    chars = np.where(thick > 1, "█", "*").astype(object)
+    draw_segments(buffer, x0, y0, x1, y1, avg_z, chars,
+                  depth_colors(theme_manager, avg_z, -2, 2), thickness=thick)
 
     # Draw Center Stem (Thick)
     stem_top = rotate_x((0, 0, 1.5), rot_x)
@@ -91,6 +82,4 @@ def render_rose(buffer, width, height, time, theme_manager):
     if p1 and p2:
         buffer.draw_thick_line(p1[0], p1[1], p2[0], p2[1], "|", 0, theme_manager.get_accent(), thickness=2)
 
-    if not all_z:
-        return (0, 1)
-    return (min(all_z), max(all_z))
+    return (float(points[:, 2].min()), float(points[:, 2].max()))
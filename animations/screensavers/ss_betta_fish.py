@@ -1,5 +1,8 @@
 import numpy as np
-from shader_engine import run_shader_animation
+from shader_engine import run_shader_animation, splat_segments
+
+# Colour added per pixel a line crosses (low alpha for accumulation)
+LINE_ALPHA = 0.05
 
 def generate_betta_fish_lines(t):
     """
@@ -60,9 +63,6 @@ def shader_betta_fish(u, v, t):
     """
     h, w = u.shape
     
-    # Initialize black canvas
-    canvas = np.zeros((h, w, 3), dtype=np.float32)
-    
     # Generate lines
     lines, line_colors = generate_betta_fish_lines(t)
     
@@ -78,80 +78,15 @@ def shader_betta_fish(u, v, t):
     center_x = w / 2.0
     center_y = h / 2.0
     
-    # Vectorized Line Rasterization (Naive/Splatting)
-    # For performance in Python, we can't draw 4000 lines with Bresenham individually in a loop efficiently.
-    # Instead, we compute points along the lines and splat them?
-    # Or simplified: Compute distance from each pixel to the set of lines? Too slow (H*W*Lines).
-    
-    # Scatter approach:
-    # 1. Sample points ALONG each line.
-    # 2. Project points to grid indices.
-    # 3. Accumulate colors.
-    
-    # Discretize lines into points
-    steps = 20 # points per line
-    alpha = np.linspace(0, 1, steps)
-    
-    # Broadcasting to create all points
-    # lines shape (N, 4) -> x1, y1, x2, y2
-    # alpha shape (S,)
-    
-    # x_points = x1 + (x2-x1)*alpha
-    x1 = lines[:, 0:1]
-    y1 = lines[:, 1:2]
-    x2 = lines[:, 2:3]
-    y2 = lines[:, 3:4]
-    
-    # Resulting shape (N, S)
-    batch_x = x1 + (x2 - x1) * alpha
-    batch_y = y1 + (y2 - y1) * alpha
-    
-    # Flatten
-    all_x = batch_x.flatten()
-    all_y = batch_y.flatten()
-    
-    # Expand colors to match points (Repeat N colors, S times each)
-    # colors shape (N, 3)
-    # We need (N*S, 3)
-    # np.repeat repeats elements, we need repeat rows
-    all_r = np.repeat(line_colors[:, 0], steps)
-    all_g = np.repeat(line_colors[:, 1], steps)
-    all_b = np.repeat(line_colors[:, 2], steps)
-    
-    # Map to screen indices
-    scr_x = (all_x * scale_x + center_x).astype(int)
-    scr_y = (all_y * scale_y + center_y).astype(int)
-    
-    # Bounds check
-    valid = (scr_x >= 0) & (scr_x < w) & (scr_y >= 0) & (scr_y < h)
-    
-    scr_x = scr_x[valid]
-    scr_y = scr_y[valid]
-    r_pts = all_r[valid]
-    g_pts = all_g[valid]
-    b_pts = all_b[valid]
-    
-    # Accumulate (Splatting)
-    # We can use np.add.at for unbuffered accumulation
-    # Note: canvas is (H, W, 3)
-    
-    # We need flattened indices for add.at
-    # flat_idx = y * w + x
-    flat_indices = scr_y * w + scr_x
-    
-    # Flatten canvas for operation
-    canvas_r = canvas[:,:,0].reshape(-1)
-    canvas_g = canvas[:,:,1].reshape(-1)
-    canvas_b = canvas[:,:,2].reshape(-1)
-    
-    np.add.at(canvas_r, flat_indices, r_pts * 0.1) # low alpha for accumulation
-    np.add.at(canvas_g, flat_indices, g_pts * 0.1)
-    np.add.at(canvas_b, flat_indices, b_pts * 0.1)
-    
-    # Reshape back
-    canvas[:,:,0] = canvas_r.reshape(h, w)
-    canvas[:,:,1] = canvas_g.reshape(h, w)
-    canvas[:,:,2] = canvas_b.reshape(h, w)
+    # Line Rasterization (Splatting)
+    # Each line is sampled in proportion to its length on screen and the
+    # samples are accumulated with np.bincount (shader_engine.splat_segments)
+    x1 = lines[:, 0] * scale_x + center_x
+    y1 = lines[:, 1] * scale_y + center_y
+    x2 = lines[:, 2] * scale_x + center_x
+    y2 = lines[:, 3] * scale_y + center_y
+    
+    canvas = splat_segments((h, w), x1, y1, x2, y2, line_colors, alpha=LINE_ALPHA)
     
     # Clip and Gamma correct?
     # Log compression allows seeing faint structure
@@ -160,4 +95,6 @@ def shader_betta_fish(u, v, t):
     return canvas
 
 def render(buffer, width, height, time, theme_manager):
-    return run_shader_animation(buffer, width, height, time, theme_manager, shader_betta_fish)
+    # Lines are splatted in image space, so the shader needs the whole frame
+    return run_shader_animation(buffer, width, height, time, theme_manager, shader_betta_fish,
+                                tiled=False)
@@ -5,8 +5,21 @@ Verbatim translation of Hamid Naderi Yeganeh's Black Hole equations.
 """
 
 import numpy as np
+from shader_engine import grid_axes, static_field
 
-def calculate_black_hole_frame(u, v, t):
+# Terms of the K(x, y) grain sum (s = 1..70, as in the original equations)
+GRAIN_TERMS = 70
+
+# Per-term constants: the K angle is GRAIN_SCALE * cos(...) + GRAIN_OFFSET
+GRAIN_SCALE = tuple(5.0 + s / 6.0 for s in range(1, GRAIN_TERMS + 1))
+GRAIN_OFFSET = tuple(float(c * 10.0 * np.sin(10.0 * s))
+                     for s, c in zip(range(1, GRAIN_TERMS + 1), GRAIN_SCALE))
+
+def black_hole_fields(u, v):
+    """
+    The time-invariant part of the equations: coordinates, Q, P, E, the
+    static part of the Jr angle, and the W and R masks.
+    """
     # u, v are from shader_engine, typically -1..1 or aspect corrected.
     # The math expects specific grid: x = (m-1000)/160, y = (601-n)/160
     # m=1..2000, n=1..1200
@@ -32,34 +45,10 @@ def calculate_black_hole_frame(u, v, t):
     exp_e = np.exp(1.0) # e
     E = np.sqrt(Q**2 + P**2) * np.exp(-exp_e)
     
-    # Jr(x,y) - Accretion Disk / Jet Texture
-    # Angle has time injection 't'
-    # angle = pi/4 - 4.5 * ln(E) + t
+    # Jr angle without its time term: pi/4 - 4.5 * ln(E)
     # E can be 0 at center, add epsilon
-    angle = (np.pi / 4.0) - (4.5 * np.log(E + 1e-7)) + t * 2.0 # Speed up swirl
+    base_angle = (np.pi / 4.0) - (4.5 * np.log(E + 1e-7))
     
-    term_q = (Q - E) * np.cos(angle)
-    term_p = (P - E) * np.sin(angle)
-    argument = term_q**2 + term_p**2
-    # Power -0.1
-    # Avoid zero division
-    Jr = np.exp(-(argument + 1e-9)**(-0.1))
-    
-    # K(x,y) - Accretion Disk Grain
-    # sum s=1 to 70
-    # Optimized to 20 for realtime
-    K = np.zeros_like(x)
-    s_limit = 20
-    for s in range(1, s_limit + 1):
-        # cos^10((5+s/6)(cos(s^2 x + sin(s^2 y)) + 10 sin(10s)))
-        # Animation: add t to inner phases? The user code added t to sin(s^2 y + t)
-        
-        inner_trig = np.cos(s**2 * x + np.sin(s**2 * y + t)) + 10.0 * np.sin(10.0 * s)
-        angle_k = (5.0 + s / 6.0) * inner_trig
-        term_k = np.cos(angle_k)**10
-        
-        K += (4.0 / 25.0) * np.exp(-100.0 * term_k)
-        
     # W(x,y) - Event Horizon Mask
     # exp(-exp(-500(x - 1.7/10)^2 - 500(y - 3/10)^2))
     # Note: The prompt code had -500*(x-0.17)^2 ...
@@ -73,6 +62,69 @@ def calculate_black_hole_frame(u, v, t):
     
     R = np.exp(-np.exp(20.0 * (x + 0.3 * np.cos(10.0 * y)) - 1000.0 * (y - x / 2.0)))
     
+    return x, y, Q - E, P - E, base_angle, W, R
+
+def grain_fields(u, v):
+    """
+    The time-invariant factors of every K term: s^2 x (reduced mod 2 pi),
+    sin(s^2 y) and cos(s^2 y), stacked over s.
+    
+    The phases reach s^2 x ~ 3e4 rad, far beyond float32 resolution, so
+    they are formed and reduced in float64 before taking the grid's dtype.
+    Given the separable axes of the grid, these are (terms, 1, W) and
+    (terms, H, 1) arrays.
+    """
+    s_sq = np.arange(1, GRAIN_TERMS + 1, dtype=np.float64)[:, np.newaxis, np.newaxis] ** 2
+    x = u.astype(np.float64) * 4.0
+    y = v.astype(np.float64) * 4.0
+    phase_x = np.mod(s_sq * x, 2.0 * np.pi).astype(u.dtype)
+    phase_y = s_sq * y
+    return phase_x, np.sin(phase_y).astype(v.dtype), np.cos(phase_y).astype(v.dtype)
+
+def calculate_black_hole_frame(u, v, t):
+    # Everything but the swirl and the grain is computed once per grid
+    x, y, QE, PE, base_angle, W, R = static_field("blackhole", u, v, black_hole_fields)
+    
+    # Jr(x,y) - Accretion Disk / Jet Texture
+    # Angle has time injection 't'
+    # angle = pi/4 - 4.5 * ln(E) + t
+    angle = base_angle + t * 2.0 # Speed up swirl
+    
+    term_q = QE * np.cos(angle)
+    term_p = PE * np.sin(angle)
+    argument = term_q**2 + term_p**2
+    # Power -0.1
+    # Avoid zero division
+    Jr = np.exp(-(argument + 1e-9)**(-0.1))
+    
+    # K(x,y) - Accretion Disk Grain
+    # sum s=1 to 70 of 4/25 exp(-100 cos^10(c_s (cos(s^2 x + sin(s^2 y + t)) + 10 sin(10s))))
+    # Animation: t is added to the inner phase sin(s^2 y + t), expanded as
+    # sin(s^2 y) cos(t) + cos(s^2 y) sin(t) over precomputed factors
+    phase_x, sin_y, cos_y = static_field("blackhole.grain", *grid_axes(u, v), grain_fields)
+    cos_t, sin_t = float(np.cos(t)), float(np.sin(t))
+    K = np.zeros_like(x)
+    angle_k = np.empty_like(x)
+    term_k = np.empty_like(x)
+    for s in range(GRAIN_TERMS):
+        # sin(s^2 y + t), per row where the grid is separable
+        wobble = sin_y[s] * cos_t + cos_y[s] * sin_t
+        np.add(phase_x[s], wobble, out=angle_k)
+        np.cos(angle_k, out=angle_k)
+        angle_k *= GRAIN_SCALE[s]
+        angle_k += GRAIN_OFFSET[s]
+        np.cos(angle_k, out=angle_k)
+        
+        # cos^10 by squaring, then the exponential
+        np.square(angle_k, out=angle_k)
+        np.square(angle_k, out=term_k)
+        np.square(term_k, out=term_k)
+        term_k *= angle_k
+        term_k *= -100.0
+        np.exp(term_k, out=term_k)
+        K += term_k
+    K *= 4.0 / 25.0
+        
     # Background Stars L(x,y)
     # The prompt code loop 1..10
     L = np.zeros_like(x)
@@ -7,14 +7,8 @@ https://www.shadertoy.com/view/XsyGzD
 
 import numpy as np
 
-def smoothstep(edge0, edge1, x):
-    """GLSL smoothstep implementation for NumPy arrays."""
-    t = np.clip((x - edge0) / (edge1 - edge0), 0.0, 1.0)
-    return t * t * (3.0 - 2.0 * t)
-
-def length(v):
-    """Vector length along last axis."""
-    return np.sqrt(np.sum(v**2, axis=-1))
+from shader_engine import grid_axes, run_shader_animation, stack_rgb
+from ..utils.glsl import smoothstep
 
 def shader_ecg(u, v, t):
     """
@@ -26,24 +20,11 @@ def shader_ecg(u, v, t):
     # Get aspect ratio from u coordinates
     # u is already scaled by aspect in shader_engine
     aspect = np.max(np.abs(u)) if u.size > 0 else 1.6
-    
-    # uv2 is used for the travelling glow effect
-    # uv2.x += iResolution.x/iResolution.y (add aspect)
-    # uv2.x -= 2.0*mod(iTime, 1.0*iResolution.x/iResolution.y)
-    
-    u2 = u + aspect
-    travel_period = aspect * 2.0  # Full width travel
-    u2 = u2 - 2.0 * (t % travel_period)
-    
-    # Width calculation for glow: width = -(1.0/(25.0*uv2.x))
-    # Need to handle division by near-zero
-    u2_safe = np.where(np.abs(u2) < 0.01, 0.01 * np.sign(u2 + 1e-9), u2)
-    width = -1.0 / (25.0 * u2_safe)
-    
-    # Glow intensity multipliers for RGB
-    l_r = width
-    l_g = width * 1.9
-    l_b = width * 1.5
+
+    # Everything but the trace distance and the vignette depends on u or v
+    # alone: compute those terms once per column / row and let them
+    # broadcast where they meet
+    u, v = grid_axes(u, v)
     
     # ---------------------------------------------------------
     # Premium High-Detail ECG
@@ -78,7 +59,7 @@ def shader_ecg(u, v, t):
     # High frequency noise for "realism" (sensor noise)
     sensor_noise = np.sin(u * 200.0) * 0.05 * np.cos(t * 10.0)
     
-    dist_curve = np.abs(v_scaled - xx * ecg_wave - sensor_noise)
+    dist_curve = np.abs(v_scaled - (xx * ecg_wave + sensor_noise))
     
     # Thicker, glowing line
     # Core (White hot)
@@ -105,36 +86,30 @@ def shader_ecg(u, v, t):
     
     # 4. Compositing
     # ---------------------------------------------------------
-    # Base color (Grid + faint static trace)
+    # Base color (Grid + faint static trace); red and blue are identical
     r = grid * 0.2
     g = grid * 0.5 + core * 0.1 # Faint green trace always visible
-    b = grid * 0.2
     
     # Pulse Colors (Bright Green + White Hot Core)
     pulse_r = (core * 1.0 + glow * 0.2) * trace_intensity
     pulse_g = (core * 1.0 + glow * 0.8) * trace_intensity
-    pulse_b = (core * 1.0 + glow * 0.2) * trace_intensity
     
     # Add pulse
-    r += pulse_r
+    r = r + pulse_r
     g += pulse_g
-    b += pulse_b
     
     # Vignette
-    vignette = 1.0 - 0.4 * length(np.stack((u*0.5, v*0.5), axis=-1))
+    vignette = 1.0 - 0.4 * np.sqrt((u*0.5)**2 + (v*0.5)**2)
     
     r *= vignette
     g *= vignette
-    b *= vignette
     
     # Clip
     r = np.clip(r, 0.0, 1.0)
     g = np.clip(g, 0.0, 1.0)
-    b = np.clip(b, 0.0, 1.0)
     
-    return np.stack((r, g, b), axis=-1)
+    return stack_rgb(r, g, r)
 
 def render(buffer, width, height, time, theme_manager):
     """Standard render function for integration with shader engine."""
-    from shader_engine import run_shader_animation
     return run_shader_animation(buffer, width, height, time, theme_manager, shader_ecg)
@@ -5,6 +5,33 @@ Verbatim translation of Hamid Naderi Yeganeh's Interacting Galaxies equations.
 """
 
 import numpy as np
+from shader_engine import static_field
+
+# Galaxy centres (x, y) and spiral arm counts
+GALAXY_1 = (-0.6, -0.2, 3)
+GALAXY_2 = (0.6, 0.3, 2)
+
+def spiral_fields(u, v, cx, cy):
+    """
+    Time-invariant part of one log spiral around (cx, cy): the arm phase
+    without rotation, and the radial decay.
+    """
+    x = u * 1.5
+    y = v * 1.5
+    dx = x - cx
+    dy = y - cy
+    r = np.sqrt(dx**2 + dy**2) + 1e-6
+    
+    # Log spiral: theta = k * log(r)
+    # Arms: sin(theta - k*log(r))
+    phi = np.arctan2(dy, dx) - 3.0 * np.log(r)
+    return phi, np.exp(-2.0 * r)
+
+def star_noise(u, v):
+    """Starfield noise (static)."""
+    x = u * 1.5
+    y = v * 1.5
+    return np.sin(100*x)*np.cos(100*y) * 0.1
 
 def calculate_galaxy_frame(u, v, t):
     # Coordinate Mapping
@@ -12,9 +39,7 @@ def calculate_galaxy_frame(u, v, t):
     # Image Domain: m=1..2000, n=1..1200
     # x = (m-1000)/680  -> ~ -1.47..1.47
     # y = (561-n)/680   -> ~ -0.9.0.8
-    
-    x = u * 1.5
-    y = v * 1.5
+    # (x = 1.5 u, y = 1.5 v; see spiral_fields)
     
     # Time Injection
     # We want the galaxies to spin.
@@ -25,24 +50,18 @@ def calculate_galaxy_frame(u, v, t):
     # 1. Auxiliary Functions
     
     # Spiral Math (Approximation of Yeganeh's style)
+    # Only the rotation depends on time; the arm phase and decay are static
     
-    def spiral(x, y, cx, cy, t_offset, arm_count):
-        dx = x - cx
-        dy = y - cy
-        r = np.sqrt(dx**2 + dy**2) + 1e-6
-        theta = np.arctan2(dy, dx) + t_offset
-        
-        # Log spiral: theta = k * log(r)
-        # Arms: sin(theta - k*log(r))
-        phi = theta - 3.0 * np.log(r)
-        arms = np.cos(arm_count * phi)
+    def spiral(cx, cy, t_offset, arm_count):
+        phi, decay = static_field("galaxy.spiral", u, v, spiral_fields, cx, cy)
+        arms = np.cos(arm_count * (phi + t_offset))
         
         # Structure decay
-        brightness = np.exp(-2.0 * r) * (arms**2 + 0.1)
+        brightness = decay * (arms**2 + 0.1)
         return brightness
         
-    s1 = spiral(x, y, -0.6, -0.2, t_anim, 3)
-    s2 = spiral(x, y, 0.6, 0.3, -t_anim * 0.8, 2) # Counter rotate
+    s1 = spiral(GALAXY_1[0], GALAXY_1[1], t_anim, GALAXY_1[2])
+    s2 = spiral(GALAXY_2[0], GALAXY_2[1], -t_anim * 0.8, GALAXY_2[2]) # Counter rotate
     
     # Interaction / Bridge
     # Just sum them roughly
@@ -62,7 +81,7 @@ def calculate_galaxy_frame(u, v, t):
     b = s1 * 1.0 + s2 * 0.6 # Left galaxy blue
     
     # Starfield noise
-    noise = np.sin(100*x)*np.cos(100*y) * 0.1
+    noise = static_field("galaxy.stars", u, v, star_noise)
     
     # F(x) filter
     def F(val):
@@ -4,16 +4,25 @@ Numpy Optimized with fix for static behavior (Periodic domain).
 """
 
 import numpy as np
-from shader_engine import run_shader_animation
+from shader_engine import roi, run_shader_animation, static_field
 
-def shader_hyperbolic(u, v, t):
+SCALE = 1.1
+
+# Grid frequencies
+FREQ_X = 2.0
+FREQ_Y = 2.0
+
+def half_plane_fields(u, v):
+    """
+    Everything that does not move: the disk -> upper half plane map, the
+    static grid factor, log-height, glow ring and disk mask.
+    """
     # u, v are numpy arrays
     
     # Scale coordinates
     # u, v are in [-aspect, aspect] and [-1, 1] roughly.
-    scale = 1.1
-    u = u * scale
-    v = v * scale
+    u = u * SCALE
+    v = v * SCALE
     
     # Complex z
     z = u + 1j * v
@@ -38,6 +47,28 @@ def shader_hyperbolic(u, v, t):
     
     w = 1j * (1.0 + z) / denom
     
+    # Log-height for vertical tiling
+    re = w.real
+    log_im = np.log(np.abs(w.imag) + 1e-9)
+    
+    # Grid Pattern
+    # Checkerboard in (Re, LogIm) space
+    p_x = np.sin(re * FREQ_X * np.pi)
+    
+    # Fade edges (Limit Circle)
+    # 1 - |z|
+    dist_edge = 1.0 - np.sqrt(r_sq)
+    
+    # Glow ring
+    glow = np.where(dist_edge < 0.05, 0.5, 0.0)
+    
+    return p_x, log_im, glow, mask
+
+# Only the Poincare disk (|z| < 1 after scaling) is drawn
+@roi(lambda u, v: (u * SCALE) ** 2 + (v * SCALE) ** 2 < 1.0)
+def shader_hyperbolic(u, v, t):
+    p_x, log_im, glow, mask = static_field("hyperbolic", u, v, half_plane_fields)
+    
     # 2. Infinite Scroll
     # In UHP, dilation corresponds to hyperbolic translation.
     # w_new = w * exp(velocity * t)
@@ -49,13 +80,6 @@ def shader_hyperbolic(u, v, t):
     flight_speed = 0.8
     offset = t * flight_speed
     
-    # We analyze w properties directly
-    re = w.real
-    im = w.imag
-    
-    # Log-height for vertical tiling
-    log_im = np.log(np.abs(im) + 1e-9)
-    
     # Apply scroll
     # Moving "forward" (towards boundary z=1) means looking at smaller and smaller features in Disk?
     # Or flowing out?
@@ -63,26 +87,11 @@ def shader_hyperbolic(u, v, t):
     # So we add t.
     
     scrolled_log_im = log_im + offset
-    
-    # Grid Pattern
-    # Checkerboard in (Re, LogIm) space
-    
-    # Frequency
-    freq_x = 2.0
-    freq_y = 2.0
-    
-    p_x = np.sin(re * freq_x * np.pi)
-    p_y = np.sin(scrolled_log_im * freq_y * np.pi)
+    p_y = np.sin(scrolled_log_im * FREQ_Y * np.pi)
     
     # Checkers
     val = np.where(p_x * p_y > 0, 0.8, 0.2)
-    
-    # Fade edges (Limit Circle)
-    # 1 - |z|
-    dist_edge = 1.0 - np.sqrt(r_sq)
-    
-    # Glow ring
-    val = np.where(dist_edge < 0.05, val + 0.5, val)
+    val += glow
     
     # Apply Mask (void outside disk)
     val = np.where(mask, val, 0.0)
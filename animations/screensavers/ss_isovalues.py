@@ -7,76 +7,18 @@ https://www.shadertoy.com/view/ldfczS
 
 import numpy as np
 
-def fract(x):
-    """GLSL fract - fractional part of x."""
-    return x - np.floor(x)
-
-def smoothstep(edge0, edge1, x):
-    """GLSL smoothstep implementation for NumPy arrays."""
-    t = np.clip((x - edge0) / (edge1 - edge0), 0.0, 1.0)
-    return t * t * (3.0 - 2.0 * t)
-
-def hash3(px, py, pz):
-    """
-    Hash function for 3D noise.
-    hash3(p) = fract(sin(1e3*dot(p,vec3(1,57,-13.7)))*4375.5453)
-    """
-    dot_val = px + 57.0 * py - 13.7 * pz
-    return fract(np.sin(1e3 * dot_val) * 4375.5453)
-
-def noise3(x, y, z):
-    """
-    3D noise function using trilinear interpolation of hash values.
-    Based on IQ's noise implementation.
-    """
-    # Floor and fract
-    px = np.floor(x)
-    py = np.floor(y)
-    pz = np.floor(z)
-    
-    fx = x - px
-    fy = y - py
-    fz = z - pz
-    
-    # Smoothstep the fractions
-    fx = fx * fx * (3.0 - 2.0 * fx)
-    fy = fy * fy * (3.0 - 2.0 * fy)
-    fz = fz * fz * (3.0 - 2.0 * fz)
-    
-    # Trilinear interpolation of 8 corner hash values
-    # mix(a, b, t) = a * (1-t) + b * t
-    
-    # z = 0 plane
-    h000 = hash3(px, py, pz)
-    h100 = hash3(px + 1, py, pz)
-    h010 = hash3(px, py + 1, pz)
-    h110 = hash3(px + 1, py + 1, pz)
-    
-    # z = 1 plane
-    h001 = hash3(px, py, pz + 1)
-    h101 = hash3(px + 1, py, pz + 1)
-    h011 = hash3(px, py + 1, pz + 1)
-    h111 = hash3(px + 1, py + 1, pz + 1)
-    
-    # Interpolate along x
-    h00 = h000 * (1 - fx) + h100 * fx
-    h10 = h010 * (1 - fx) + h110 * fx
-    h01 = h001 * (1 - fx) + h101 * fx
-    h11 = h011 * (1 - fx) + h111 * fx
-    
-    # Interpolate along y
-    h0 = h00 * (1 - fy) + h10 * fy
-    h1 = h01 * (1 - fy) + h11 * fy
-    
-    # Interpolate along z
-    return h0 * (1 - fz) + h1 * fz
+from ..utils.glsl import smoothstep
+from ..utils.noise import value3
 
 def noise(x, y, z):
     """
     Improved noise by averaging two offset samples.
-    noise(x) = (noise3(x) + noise3(x+11.5)) / 2.0
+    noise(x) = (value3(x) + value3(x+11.5)) / 2.0
     """
-    return (noise3(x, y, z) + noise3(x + 11.5, y + 11.5, z + 11.5)) * 0.5
+    n = value3(x, y, z)
+    n += value3(x + 11.5, y + 11.5, z + 11.5)
+    n *= 0.5
+    return n
 
 def approximate_fwidth(arr):
     """
@@ -205,4 +147,6 @@ def render(buffer, width, height, time, theme_manager):
     global CURRENT_THEME_NAME
     CURRENT_THEME_NAME = theme_manager.current_theme
     
-    return run_shader_animation(buffer, width, height, time, theme_manager, shader_isovalues)
+    # np.gradient in approximate_fwidth needs the whole frame
+    return run_shader_animation(buffer, width, height, time, theme_manager, shader_isovalues,
+                                tiled=False)
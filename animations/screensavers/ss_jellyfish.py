@@ -1,12 +1,14 @@
 """
 Parametric Jellyfish Screensaver
-Numpy Optimized.
+Numpy Optimized (expression shader: fused, tiled, no per-frame temporaries).
 Verbatim translation of Hamid Naderi Yeganeh's Jellyfish equations.
 """
 
 import numpy as np
 from shader_engine import run_shader_animation
 
+from ..utils import expr
+
 def F(val):
     """
     F(x): Reduced intensity filter/clamp.
@@ -18,6 +20,7 @@ def F(val):
     val = np.clip(val, 0, 1)
     return val
 
+@expr.shader
 def shader_jellyfish(u, v, t):
     # 1. Coordinate Setup
     # Map u, v (generic -1..1 or aspect corrected) to the mathematical domain.
@@ -35,7 +38,7 @@ def shader_jellyfish(u, v, t):
     
     # 2. Auxiliary Functions & Accumulation
     
-    density = np.zeros_like(x)
+    density = 0.0
     
     # Tentacles Loop (T_s)
     # The image sums s=1 to 50. Python s_limit=25 is a good balance for FPS.
@@ -63,25 +66,26 @@ def shader_jellyfish(u, v, t):
         # Let's align with the organic undulation
         phi = 7.0 * s + t_anim * 0.5
         
-        term_x = np.cos(phi) * x + np.sin(phi) * y
-        term_static = 2.0 * np.cos(5.0 * s - t_anim)
+        term_x = expr.cos(phi) * x + expr.sin(phi) * y
+        term_static = 2.0 * expr.cos(5.0 * s - t_anim)
         
         # K1 * K2 * (...)
         inner = k1 * k2 * term_x + term_static
         
         # T_s Base shape
-        val = np.cos(inner)
+        val = expr.cos(inner)
         
         # Detail Layer (Recursive Cosines approximation)
         # val += 4 * cos(k1 * k2 * (cos(8s)x + sin(8s)y))
         phi_detail = 8.0 * s #+ t_anim * 0.1 # Optional subtle detail move
         term_detail = np.cos(phi_detail) * x + np.sin(phi_detail) * y
-        val += 4.0 * np.cos(k1 * k2 * term_detail)
+        val += 4.0 * expr.cos(k1 * k2 * term_detail)
         
         # Decay E(x,y)
         # Decay E(x,y)
         # Widen the mask further (10->4.0) to reveal full tentacles
-        decay = np.exp(-4.0 * (x**2 + (y + 0.4)**2))
+        # (the same expression every iteration: compiled once)
+        decay = expr.exp(-4.0 * (x**2 + (y + 0.4)**2))
         
         # Accumulate
         # Boost gain to ensure visibility against black background
@@ -92,15 +96,15 @@ def shader_jellyfish(u, v, t):
     # Core shape: Smooth shell
     dist_sq = x**2 + (y - 0.3)**2
     # Thickness of the bell shell
-    bell_mask = np.exp(-15.0 * (dist_sq - 0.25)**2)
+    bell_mask = expr.exp(-15.0 * (dist_sq - 0.25)**2)
     
     # Ripple Animation (Verbatim K approximation)
     # K(x,y) = exp( ... cos(15 * (27/25)^5 * (cos(5t)^2 x + sin(5t)^2 y)) ... )
     # This is effectively a directional wave passing through the bell.
     ripple_phase = 5.0 * t_anim
-    ripple_arg = x * (np.cos(ripple_phase)**2) + y * (np.sin(ripple_phase)**2)
+    ripple_arg = x * (expr.cos(ripple_phase)**2) + y * (expr.sin(ripple_phase)**2)
     # Frequency 15, Amplitude/Sharpness via Exp
-    ripple = np.cos(15.0 * ripple_arg)
+    ripple = expr.cos(15.0 * ripple_arg)
     
     bell_mask *= (1.0 + 0.1 * ripple)
     
@@ -4,143 +4,121 @@ Numpy Optimized.
 """
 
 import numpy as np
-from shader_engine import run_shader_animation
+from shader_engine import march, run_shader_animation
 
-def shader_mandelbulb(u, v, t):
-    # Raymarching in Numpy?
-    # This is heavy. Doing a loop over all pixels in parallel steps.
+MAX_STEPS = 20 # Increased from 10 for better detail
+DE_ITERATIONS = 5
+BAILOUT = 2.0
+BOUND_RADIUS = 1.5 # The bulb fits inside r < 1.2 for powers 6-10
+
+def mandelbulb_de(px, py, pz, power):
+    """
+    Distance estimate to the Mandelbulb for 1-D arrays of points.
     
-    # Ray Setup
-    uv_shape = u.shape
+    Each point iterates only until it escapes; escaped points keep the
+    radius and derivative they escaped with, so far-away samples get the
+    usual 0.5 * log(r) * r / dr estimate instead of overflowing.
+    """
+    r = np.sqrt(px * px + py * py + pz * pz)
+    dr = np.ones_like(r)
+    
+    # Points still inside the bailout radius
+    live = np.flatnonzero(r <= BAILOUT)
+    cx, cy, cz = px[live], py[live], pz[live]
+    wx, wy, wz = cx, cy, cz
+    lr, ldr = r[live], dr[live]
+    
+    for k in range(DE_ITERATIONS):
+        if live.size == 0:
+            break
+        
+        # Polar (avoid r=0)
+        theta = np.arccos(np.clip(wz / np.maximum(lr, 1e-9), -1.0, 1.0)) * power
+        phi = np.arctan2(wy, wx) * power
+        
+        # dr = r^(power - 1) * power * dr + 1
+        ldr = lr ** (power - 1.0) * power * ldr + 1.0
+        zr = lr ** power
+        
+        # Cartesian
+        sin_theta = np.sin(theta) * zr
+        wx = sin_theta * np.cos(phi) + cx
+        wy = sin_theta * np.sin(phi) + cy
+        wz = zr * np.cos(theta) + cz
+        lr = np.sqrt(wx * wx + wy * wy + wz * wz)
+        r[live] = lr
+        dr[live] = ldr
+        
+        # Drop the points that escaped this iteration
+        inside = lr <= BAILOUT
+        if not inside.all():
+            live = live[inside]
+            cx, cy, cz = cx[inside], cy[inside], cz[inside]
+            wx, wy, wz = wx[inside], wy[inside], wz[inside]
+            lr, ldr = lr[inside], ldr[inside]
     
+    # DE = 0.5 * log(r) * r / dr
+    np.maximum(r, 1e-9, out=r)
+    return 0.5 * np.log(r) * r / dr
+
+def shader_mandelbulb(u, v, t, ctx):
+    # Ray Setup
     # ro = [0, 0, -2.5]
-    ro = np.array([0.0, 0.0, -2.5])
+    ro_z = -2.5
     
-    # rd
+    # rd = normalize(u * fov, v * fov, 1)
     fov = 1.0
-    # Stack U, V, 1.0
-    ones = np.ones(uv_shape)
-    rd = np.stack([u * fov, v * fov, ones], axis=-1)
-    
-    # Normalize RD
-    lengths = np.linalg.norm(rd, axis=-1, keepdims=True)
-    rd = rd / lengths
+    inv_len = ctx.apply("inv_len", np.hypot, u, v)
+    if fov != 1.0:
+        inv_len *= fov
+    np.hypot(inv_len, 1.0, out=inv_len)
+    np.reciprocal(inv_len, out=inv_len)
+    rd_x = ctx.apply("rd_x", np.multiply, u, inv_len)
+    rd_y = ctx.apply("rd_y", np.multiply, v, inv_len)
+    rd_z = inv_len
+    if fov != 1.0:
+        rd_x *= fov
+        rd_y *= fov
     
     # Power
     power = 8.0 + 2.0 * np.sin(t * 0.3)
     
-    # Current t (focal depth)
-    t_march = np.zeros(uv_shape)
-    
-    # Mask of active pixels (haven't hit or escaped)
-    active = np.ones(uv_shape, dtype=bool)
-    
-    # Output steps (AO)
-    steps_count = np.zeros(uv_shape)
-    
-    max_steps = 20 # Increased from 10 for better detail
-    
     # Rotation Matrix (around Y)
     theta = t * 0.2
     c = np.cos(theta)
     s = np.sin(theta)
     
-    # iterate
-    for i in range(max_steps):
-        if not np.any(active):
-            break
-            
-        # P = ro + rd * t
-        p = ro + rd * t_march[..., np.newaxis]
-        
-        # Rotated P for Fractal
-        px = p[..., 0]
-        py = p[..., 1]
-        pz = p[..., 2]
-        
-        # Rotate P
-        px_r = px * c - pz * s
-        pz_r = px * s + pz * c
-        py_r = py
-        
-        # Fractal Iteration
-        # w = p_rotated
-        wx, wy, wz = px_r, py_r, pz_r
-        
-        dr = 1.0
-        r = 0.0
-        
-        # Mandelbulb DE Loop
-        for k in range(5): # Increased iterations slightly
-            r = np.sqrt(wx*wx + wy*wy + wz*wz)
-            
-            # Polar
-            # Avoid r=0
-            r_safe = np.maximum(r, 1e-9)
-            
-            theta_m = np.arccos(wz / r_safe)
-            phi_m = np.arctan2(wy, wx)
-            
-            dr = np.power(r, power - 1.0) * power * dr + 1.0
-            
-            zr = np.power(r, power)
-            theta_m *= power
-            phi_m *= power
-            
-            # Cartesian
-            wx = zr * np.sin(theta_m) * np.cos(phi_m) + px_r
-            wy = zr * np.sin(theta_m) * np.sin(phi_m) + py_r
-            wz = zr * np.cos(theta_m) + pz_r
-            
-            if r > 2.0: # Escape early optimization
-                break
-            
-        # Final Dist
-        length_r = np.sqrt(wx*wx + wy*wy + wz*wz) 
-        # DE = 0.5 * log(r) * r / dr
-        dist = 0.5 * np.log(length_r + 1e-9) * length_r / dr
-        
-        # Update t
-        t_march += dist * 0.8 # Slower step for safety
-        steps_count += 1
-        
-        # Check hit
-        hit = dist < 0.005 # Stricter hit threshold
-        
-        # Check far plane
-        escaped = t_march > 10.0 # Further far plane
-        
-        # Update active mask: turn off if hit or escaped
-        active_now = active & ~hit & ~escaped
-        if not np.any(active_now):
-             break
-        
-        # Optimization: only update active pixels in next iter? 
-        # Numpy doesn't support easy sparse updates without indexing overhead.
-        # Just keep looping with masking logic if needed, or multiply dist by active.
-        
-        # If we didn't update active mask, we'd continue marching hit pixels.
-        # So we must use the mask. But we can't easily "skip" computation for specific indices in pure vector ops.
-        # We effectively mask the 'dist' addition? 
-        # dist[~active] = 0 -> This effectively stops them.
-        
-        # Let's enforce stop
-        # Update t only for active
-        # t_march = np.where(active, t_march + dist, t_march) -> Already done above? No.
-        # The variables above were computed for ALL pixels.
-        
-        # Retain state for inactive pixels
-        # Actually logic above `t_march += dist` updates everything.
-        # We need to revert or mask.
-        
+    def distance(px, py, pz):
+        # Rotate P for Fractal
+        return mandelbulb_de(px * c - pz * s, py, px * s + pz * c, power)
+    
+    # Bounding sphere: rays march only between entering and leaving it, and
+    # rays that pass outside it (closest approach to the origin beyond
+    # BOUND_RADIUS) are skipped
+    t_mid = ctx.apply("t_mid", np.multiply, rd_z, -ro_z)
+    half = ctx.apply("half", np.multiply, t_mid, t_mid)
+    half += BOUND_RADIUS * BOUND_RADIUS - ro_z * ro_z
+    inside = ctx.apply("inside", np.greater, half, 0.0, dtype=bool)
+    np.sqrt(np.maximum(half, 0.0, out=half), out=half)
+    t_enter = ctx.apply("t_enter", np.subtract, t_mid, half)
+    t_exit = ctx.apply("t_exit", np.add, t_mid, half)
+    
+    # Only rays still in flight are evaluated; each ray stops on its own
+    # hit (stricter threshold) or on leaving the bounding sphere
+    result = march(distance, (0.0, 0.0, ro_z), (rd_x, rd_y, rd_z),
+                   max_steps=MAX_STEPS, hit_dist=0.005, max_dist=t_exit,
+                   step_scale=0.8, active=inside, t_start=t_enter) # Slower step for safety
+    
     # Result
     # Intensity based on steps (AO)
-    intensity = 1.0 - (steps_count / max_steps)
+    intensity = np.divide(result.steps, -MAX_STEPS, out=ctx.array("intensity"))
+    intensity += 1.0
     
-    # Mask background (where escaped)
-    intensity[t_march > 9.5] = 0.0
+    # Mask background (rays that never hit)
+    np.copyto(intensity, 0.0, where=~result.hit)
     
     return intensity
 
 def render(buffer, width, height, time, theme_manager):
-    return run_shader_animation(buffer, width, height, time, theme_manager, shader_mandelbulb)
+    return run_shader_animation(buffer, width, height, time, theme_manager, shader_mandelbulb,
+                                use_context=True, temporal="checkerboard", motion_threshold=0.1)
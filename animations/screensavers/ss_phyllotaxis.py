@@ -4,8 +4,10 @@ Numpy Optimized.
 """
 
 import numpy as np
-from shader_engine import run_shader_animation
+from shader_engine import roi, roi_disk, run_shader_animation
 
+# Seeds are drawn at 1 - r/2, which is black from r = 2 on
+@roi(roi_disk(2.0))
 def shader_phyllotaxis(u, v, t):
     # Polar
     r = np.sqrt(u**2 + v**2)
@@ -1,9 +1,15 @@
 import numpy as np
-from shader_engine import run_shader_animation
+from shader_engine import run_shader_animation, static_field
 
 # --- Verbatim Code from User Prompt ---
 
-def render_transparent_fish(width=1000, height=600, t=0):
+def fish_fields(u, v):
+    """
+    Static part of the fish: base coordinates (from the grid shape only) and
+    the sines and cosines of x that the swim and tail animations shift.
+    """
+    height, width = u.shape
+    
     # 1. Coordinate Setup
     # Scaling the resolution down slightly for performance (half the original 2000x1200)
     # Original map: x = (m - 1100)/700, y = (601 - n)/700
@@ -18,9 +24,16 @@ def render_transparent_fish(width=1000, height=600, t=0):
     x_static = (m - 1100) / 700
     y_static = (601 - n) / 700
     
+    return (x_static, y_static, np.sin(3 * x_static), np.cos(3 * x_static),
+            np.sin(4 * x_static), np.cos(4 * x_static))
+
+def render_transparent_fish(fields, t=0):
+    x_static, y_static, sin3x, cos3x, sin4x, cos4x = fields
+    
     # --- ANIMATION INJECTION ---
     # We warp the Y coordinate based on X and Time to simulate swimming body flex
-    swim_wave = 0.05 * np.sin(3 * x_static + t * 4)
+    # swim_wave = 0.05 * sin(3x + 4t), expanded so only scalars depend on t
+    swim_wave = 0.05 * (sin3x * np.cos(t * 4) + cos3x * np.sin(t * 4))
     y = y_static + swim_wave 
     x = x_static # X stays mostly static relative to the frame
     
@@ -45,20 +58,28 @@ def render_transparent_fish(width=1000, height=600, t=0):
     # L_v is a sum of 30 fin rays.
     # v is the color channel index (used to slightly offset colors)
     def L(x, y, v, t):
-        total_sum = np.zeros_like(x)
+        # Every factor but term2 is a scalar per s, and term2 is linear in
+        # y, cos(4x) and sin(4x), so the sum collapses to four scalars:
+        # cos(4x + 6s - 5t) = cos(4x) cos(6s - 5t) - sin(4x) sin(6s - 5t)
+        y_coeff = const = cos_coeff = sin_coeff = 0.0
         for s in range(1, 15): # Reduced from 30 to 15 for animation speed
             
             # ANIMATION: Added 't' phase shift to the tail wag
-            tail_wag = np.cos(4 * x + 6 * s - t * 5) 
+            phase = 6 * s - t * 5
             
             term1 = (60 - s) / 250
-            term2 = (2 * y + 26/5 + 3/5 * tail_wag + 7/5 * np.cos(8 * s))
             term3 = (9/10 - 2/5 * (v**2 - v) + 3/25 * np.cos(5 * s) + (1/5 - v/20) * np.cos(2 * s + v * s))
             
             # The structure of the fin ray summation
-            total_sum += term1 * term2 * term3 * (1 + np.cos(17*s) / 4)
+            weight = term1 * term3 * (1 + np.cos(17*s) / 4)
+            
+            # term2 = (2 * y + 26/5 + 3/5 * tail_wag + 7/5 * np.cos(8 * s))
+            y_coeff += weight * 2
+            const += weight * (26/5 + 7/5 * np.cos(8 * s))
+            cos_coeff += weight * 3/5 * np.cos(phase)
+            sin_coeff -= weight * 3/5 * np.sin(phase)
 
-        return total_sum
+        return y_coeff * y + const + cos_coeff * cos4x + sin_coeff * sin4x
 
     # 4. The Body Texture (K)
     # K is a product of 50 terms defining scales/spots
@@ -131,12 +152,11 @@ def render_transparent_fish(width=1000, height=600, t=0):
 
 def shader_transparent_fish(u, v, t):
     # u, v are sized (2*H, W)
-    h, w = u.shape
     
     # We ignore u, v values and just use the shape to generate indices 
     # as the verbatim code controls its own coordinates.
     
-    img = render_transparent_fish(width=w, height=h, t=t)
+    img = render_transparent_fish(static_field("fish", u, v, fish_fields), t=t)
     
     # Normalize to 0..1 float
     intensity_rgb = img.astype(np.float32) / 255.0
@@ -144,4 +164,6 @@ def shader_transparent_fish(u, v, t):
     return intensity_rgb
 
 def render(buffer, width, height, time, theme_manager):
-    return run_shader_animation(buffer, width, height, time, theme_manager, shader_transparent_fish)
+    # Coordinates are derived from the grid shape, so the shader needs the whole frame
+    return run_shader_animation(buffer, width, height, time, theme_manager, shader_transparent_fish,
+                                tiled=False)
@@ -9,7 +9,28 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, rotate_z, project_point
+import numpy as np
+
+from geometry import (CURVE_SPACING, ParametricSurface, Transform, depth_colors, draw_segments,
+                      draw_segments_subpixel, polyline_segments, project_points)
+
+
+def sphere_position(theta, phi, radius):
+    """theta around the vertical axis, phi down from the north pole."""
+    return (radius * np.sin(phi) * np.cos(theta), radius * np.cos(phi),
+            radius * np.sin(phi) * np.sin(theta))
+
+
+# Longitude lines: one strip per theta, pole to pole
+LONGITUDES = ParametricSurface(sphere_position, (0, 2 * math.pi), (0, math.pi), v_endpoint=True)
+
+
+def _latitude_position(phi, theta, radius):
+    return sphere_position(theta, phi, radius)
+
+
+# Latitude lines: one closed strip per phi (the pole rows are dropped)
+LATITUDES = ParametricSurface(_latitude_position, (0, math.pi), (0, 2 * math.pi), v_endpoint=True)
 
 
 def render_sphere(buffer, width, height, time, theme_manager):
@@ -23,80 +44,42 @@ def render_sphere(buffer, width, height, time, theme_manager):
     rot_y = time * 0.4
     rot_x = math.sin(time * 0.2) * 0.4  # Tilt
     rot_z = math.sin(time * 0.3) * 0.1
+    rotation = Transform().rotate_y(rot_y).rotate_x(rot_x).rotate_z(rot_z)
     
-    # Generate geometry for lines
-    # We will generate vertices and transform them, then draw lines
+    # Points per line from the on-screen size (one per CURVE_SPACING cells)
+    spacing = 1 / CURVE_SPACING
     
     # 1. Longitude Lines (Vertical)
     num_long = 12
-    points_per_long = 18
+    points_per_long = LONGITUDES.screen_steps(rotation, width, height, samples_per_cell=spacing,
+                                              radius=RADIUS)[1]
+    longitudes, _ = LONGITUDES.sample(num_long, points_per_long, radius=RADIUS)
     
-    for i in range(num_long):
-        theta = (2 * math.pi * i) / num_long
-        
-        # Line strip for longitude
-        strip = []
-        for j in range(points_per_long):
-            phi = (math.pi * j) / (points_per_long - 1)
-            
-            x = RADIUS * math.sin(phi) * math.cos(theta)
-            y = RADIUS * math.cos(phi)
-            z = RADIUS * math.sin(phi) * math.sin(theta)
-            
-            p = rotate_z(rotate_x(rotate_y((x,y,z), rot_y), rot_x), rot_z)
-            strip.append(p)
-            
-        # Draw strip using thick lines
-        for k in range(len(strip) - 1):
-            p1 = strip[k]
-            p2 = strip[k+1]
-            draw_thick_segment(buffer, width, height, p1, p2, theme_manager, RADIUS)
-
-    # 2. Latitude Lines (Horizontal)
+    # 2. Latitude Lines (Horizontal), +1 point to close each loop
     num_lat = 8
-    points_per_lat = 24
+    points_per_lat = LATITUDES.screen_steps(rotation, width, height, samples_per_cell=spacing,
+                                            radius=RADIUS)[1]
+    latitudes, _ = LATITUDES.sample(num_lat, points_per_lat + 1, radius=RADIUS)
+    latitudes = latitudes[points_per_lat + 1:]
+    
+    for strips, points in ((num_long, longitudes), (num_lat - 1, latitudes)):
+        screen_x, screen_y, z, valid = project_points(rotation.apply(points), width, height)
+        x0, y0, x1, y1, avg_z, _ = polyline_segments(
+            *(a.reshape(strips, -1) for a in (screen_x, screen_y, z, valid)))
+        draw_thick_segments(buffer, x0, y0, x1, y1, avg_z, theme_manager, RADIUS)
     
-    for i in range(1, num_lat):
-        phi = (math.pi * i) / num_lat
-        current_rad = RADIUS * math.sin(phi)
-        y_pos = RADIUS * math.cos(phi)
-        
-        strip = []
-        for j in range(points_per_lat + 1): # +1 to close loop
-            theta = (2 * math.pi * j) / points_per_lat
-            x = current_rad * math.cos(theta)
-            y = y_pos
-            z = current_rad * math.sin(theta)
-            
-            p = rotate_z(rotate_x(rotate_y((x,y,z), rot_y), rot_x), rot_z)
-            strip.append(p)
-            
-        for k in range(len(strip) - 1):
-            p1 = strip[k]
-            p2 = strip[k+1]
-            draw_thick_segment(buffer, width, height, p1, p2, theme_manager, RADIUS)
-
     return (-RADIUS, RADIUS)
 
-def draw_thick_segment(buffer, width, height, p1, p2, theme_manager, radius):
-    """Helper to draw a thick line segment."""
-    proj1 = project_point(p1[0], p1[1], p1[2], width, height)
-    proj2 = project_point(p2[0], p2[1], p2[2], width, height)
+
+def draw_thick_segments(buffer, x0, y0, x1, y1, avg_z, theme_manager, radius):
+    """Helper to draw thick line segments."""
+    colors = depth_colors(theme_manager, avg_z, -radius, radius)
     
-    if proj1 and proj2:
-        sx1, sy1 = proj1
-        sx2, sy2 = proj2
-        
-        avg_z = (p1[2] + p2[2]) / 2
-        color = theme_manager.get_color_for_depth(avg_z, -radius, radius)
-        
-        # Thickness based on depth
-        thickness = 2 if avg_z < 0 else 1
-        char = "█" if thickness > 1 else "≡"
-        
-        # Don't draw too thick for sphere network or it gets messy
-        # Just use subpixel or single thickness for far, double for near
-        if thickness > 1:
-             buffer.draw_thick_line(sx1, sy1, sx2, sy2, char, avg_z, color, thickness=2)
-        else:
-             buffer.draw_line_subpixel(sx1, sy1, sx2, sy2, avg_z, color)
+    # Thickness based on depth
+    # Don't draw too thick for sphere network or it gets messy
+    # Just use subpixel or single thickness for far, double for near
+    near = avg_z < 0
+    draw_segments(buffer, x0[near], y0[near], x1[near], y1[near], avg_z[near], "█",
+                  colors[near], thickness=2)
+    far = ~near
+    draw_segments_subpixel(buffer, x0[far], y0[far], x1[far], y1[far], avg_z[far], colors[far])
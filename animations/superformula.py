@@ -9,28 +9,44 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, rotate_z, project_point
+import numpy as np
+
+from geometry import ParametricSurface, Transform, depth_chars, depth_colors, project_points, scatter
 
 
 def superformula(phi, a, b, m, n1, n2, n3):
     """
-    Calculate r using the Superformula.
+    Calculate r using the Superformula (phi may be an array).
     
     r(phi) = [|cos(m*phi/4)/a|^n2 + |sin(m*phi/4)/b|^n3]^(-1/n1)
     """
     t = m * phi / 4
     
-    term1 = abs(math.cos(t) / a) ** n2
-    term2 = abs(math.sin(t) / b) ** n3
-    
-    total = term1 + term2
+    term1 = np.abs(np.cos(t) / a) ** n2
+    term2 = np.abs(np.sin(t) / b) ** n3
     
-    if total == 0:
-        return 1
+    # r = 1 where both terms vanish
+    total = np.where(term1 + term2 == 0, 1.0, term1 + term2)
     
     return total ** (-1 / n1)
 
 
+def superformula_position(theta, phi, shape1, shape2, scale):
+    """Spherical product of two superformula radii."""
+    r1 = superformula(theta, *shape1)
+    r2 = superformula(phi, *shape2)
+    
+    x = r1 * np.cos(theta) * r2 * np.cos(phi) * scale
+    y = r1 * np.sin(theta) * scale
+    z = r1 * np.cos(theta) * r2 * np.sin(phi) * scale
+    return x, y, z
+
+
+# theta from -π/2 to π/2, phi from -π to π
+SUPERFORMULA = ParametricSurface(superformula_position, (-math.pi / 2, math.pi / 2),
+                                 (-math.pi, math.pi), u_endpoint=True, v_endpoint=True)
+
+
 def render_superformula(buffer, width, height, time, theme_manager):
     """
     Render a 3D superformula shape that morphs between forms.
@@ -62,52 +78,27 @@ def render_superformula(buffer, width, height, time, theme_manager):
     rot_y = time * 0.5
     rot_x = time * 0.3 + 0.3
     
-    all_z = []
-    points_to_draw = []
-    
-    # Higher resolution for smoother surface
-    theta_steps = 50
-    phi_steps = 50
-    
-    for i in range(theta_steps):
-        theta = -math.pi / 2 + math.pi * i / (theta_steps - 1)  # -π/2 to π/2
-        
-        for j in range(phi_steps):
-            phi = -math.pi + 2 * math.pi * j / (phi_steps - 1)  # -π to π
-            
-            # Calculate superformula radii
-            r1 = superformula(theta, a, b, m1, n1_1, n2_1, n3_1)
-            r2 = superformula(phi, a, b, m2, n1_2, n2_2, n3_2)
-            
-            # Convert to Cartesian using spherical coordinates
-            cos_theta = math.cos(theta)
-            sin_theta = math.sin(theta)
-            cos_phi = math.cos(phi)
-            sin_phi = math.sin(phi)
-            
-            x = r1 * cos_theta * r2 * cos_phi * scale
-            y = r1 * sin_theta * scale
-            z = r1 * cos_theta * r2 * sin_phi * scale
-            
-            # Apply rotations
-            point = rotate_y((x, y, z), rot_y)
-            point = rotate_x(point, rot_x)
-            x, y, z = point
-            
-            projected = project_point(x, y, z, width, height, distance=4.0)
-            if projected:
-                all_z.append(z)
-                points_to_draw.append((projected[0], projected[1], z))
-    
-    if not all_z:
+    shape = dict(shape1=(a, b, m1, n1_1, n2_1, n3_1), shape2=(a, b, m2, n1_2, n2_2, n3_2),
+                 scale=scale)
+    rotation = Transform().rotate_y(rot_y).rotate_x(rot_x)
+    
+    # Resolution from the on-screen size
+    theta_steps, phi_steps = SUPERFORMULA.screen_steps(rotation, width, height, distance=4.0, **shape)
+    
+    # Apply rotations
+    points, _ = SUPERFORMULA.sample(theta_steps, phi_steps, **shape)
+    points = rotation.apply(points)
+    
+    screen_x, screen_y, z, valid = project_points(points, width, height, distance=4.0)
+    if not valid.any():
         return (0, 1)
+    z = z[valid]
     
-    z_min, z_max = min(all_z), max(all_z)
+    z_min, z_max = float(z.min()), float(z.max())
     
     chars = " .:-=+*#%@"
     
-    for screen_x, screen_y, z in points_to_draw:
-        char, color = theme_manager.get_char_for_depth(z, z_min, z_max, chars)
-        buffer.set_pixel(screen_x, screen_y, char, z, color)
+    scatter(buffer, screen_x[valid], screen_y[valid], z, depth_chars(z, z_min, z_max, chars),
+            depth_colors(theme_manager, z, z_min, z_max))
     
     return (z_min, z_max)
@@ -5,76 +5,46 @@ Enhanced with larger scale and continuous scrolling motion.
 """
 
 import math
-import random
 import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_x, rotate_y, project_point
+import numpy as np
 
+from geometry import Transform, depth_colors, palette, project_points, ramp_index, scatter
+from heightfield import ScrollingHeightfield, grid_detail, surface_points
+from .utils.noise import fbm, perlin2
 
-class PerlinNoise:
-    """Simple Perlin-like noise generator."""
-    
-    def __init__(self, seed=42):
-        random.seed(seed)
-        self.permutation = list(range(256))
-        random.shuffle(self.permutation)
-        self.permutation += self.permutation
-    
-    def fade(self, t):
-        return t * t * t * (t * (t * 6 - 15) + 10)
-    
-    def lerp(self, a, b, t):
-        return a + t * (b - a)
-    
-    def grad(self, hash_val, x, y):
-        h = hash_val & 3
-        if h == 0:
-            return x + y
-        elif h == 1:
-            return -x + y
-        elif h == 2:
-            return x - y
-        else:
-            return -x - y
-    
-    def noise2d(self, x, y):
-        X = int(math.floor(x)) & 255
-        Y = int(math.floor(y)) & 255
-        
-        x -= math.floor(x)
-        y -= math.floor(y)
-        
-        u = self.fade(x)
-        v = self.fade(y)
-        
-        p = self.permutation
-        A = p[X] + Y
-        B = p[X + 1] + Y
-        
-        return self.lerp(
-            self.lerp(self.grad(p[A], x, y), self.grad(p[B], x - 1, y), u),
-            self.lerp(self.grad(p[A + 1], x, y - 1), self.grad(p[B + 1], x - 1, y - 1), u),
-            v
-        )
-    
-    def octave_noise(self, x, y, octaves=4, persistence=0.5):
-        total = 0
-        amplitude = 1
-        frequency = 1
-        max_value = 0
-        
-        for _ in range(octaves):
-            total += self.noise2d(x * frequency, y * frequency) * amplitude
-            max_value += amplitude
-            amplitude *= persistence
-            frequency *= 2
-        
-        return total / max_value
 
+# Octave amplitudes 1, 1/2, 1/4, 1/8 sum to 1.875; dividing keeps heights in [-1, 1]
+OCTAVES = 4
+OCTAVE_NORM = 1.875
+
+# Terrain parameters - LARGER (grid cells at detail 1)
+TERRAIN_WIDTH = 40
+TERRAIN_DEPTH = 25
+HEIGHT_SCALE = 3.0
+NOISE_SCALE = 0.12
+SCROLL_SPEED = 0.6
 
-_noise = PerlinNoise()
+# Scrolling heightfields by grid detail
+_FIELDS = {}
+
+
+def get_field(detail):
+    """The ring-buffered noise heightfield for a grid detail."""
+    if detail not in _FIELDS:
+        step = NOISE_SCALE / detail
+        noise_x = np.arange(TERRAIN_WIDTH * detail) * step
+
+        def generate(rows):
+            # Multi-octave noise for natural terrain
+            heights = fbm(noise_x, rows[:, np.newaxis] * step, noise=perlin2,
+                          octaves=OCTAVES, amplitude=1.0)
+            return heights / OCTAVE_NORM
+
+        _FIELDS[detail] = ScrollingHeightfield(TERRAIN_DEPTH * detail, generate)
+    return _FIELDS[detail]
 
 
 def render_terrain(buffer, width, height, time, theme_manager):
@@ -86,79 +56,41 @@ def render_terrain(buffer, width, height, time, theme_manager):
     - Slow rotation for 3D effect
     - Larger scale for visibility
     """
-    # Terrain parameters - LARGER
-    terrain_width = 40
-    terrain_depth = 25
-    height_scale = 3.0
-    noise_scale = 0.12
-    scroll_speed = 0.6
+    # Finer grid on larger screens, same extent
+    detail = grid_detail(width, height)
+    field = get_field(detail)
     
     # Viewing angles with slow rotation
     rot_x = 0.75
     rot_y = math.sin(time * 0.15) * 0.15  # Gentle side-to-side
+    view = Transform().rotate_x(rot_x).rotate_y(rot_y).translate(0, -0.8, 0)
     
-    all_z = []
-    points_to_draw = []
-    
-    # Continuous scroll offset
-    scroll_offset = time * scroll_speed
+    # Continuous scroll: only rows newly in view are generated, and the
+    # fractional part of the offset slides the rows towards the viewer
+    scroll_offset = time * SCROLL_SPEED
+    height_field, rows = field.scroll(scroll_offset * 2 * detail)
     
-    for i in range(terrain_depth):
-        z_pos = i * 0.45
-        
-        for j in range(terrain_width):
-            x_pos = (j - terrain_width / 2) * 0.28
-            
-            # Sample noise with scroll
-            noise_x = j * noise_scale
-            noise_y = (i + scroll_offset * 2) * noise_scale
-            
-            # Multi-octave noise for natural terrain
-            height_val = _noise.octave_noise(noise_x, noise_y, octaves=4)
-            
-            y_pos = height_val * height_scale
-            
-            x = x_pos
-            y = y_pos
-            z = z_pos
-            
-            # Apply rotations
-            point = rotate_x((x, y, z), rot_x)
-            point = rotate_y(point, rot_y)
-            x, y, z = point
-            
-            y -= 0.8
-            
-            projected = project_point(x, y, z, width, height, distance=5.0)
-            if projected:
-                all_z.append(z)
-                points_to_draw.append((projected[0], projected[1], z, height_val))
+    x_pos = (np.arange(TERRAIN_WIDTH * detail) / detail - TERRAIN_WIDTH / 2) * 0.28
+    z_pos = rows / detail * 0.45
+    points = surface_points(x_pos, height_field * HEIGHT_SCALE, z_pos[:, np.newaxis])
     
-    if not all_z:
+    screen_x, screen_y, z, valid = project_points(view.apply(points), width, height, distance=5.0)
+    if not valid.any():
         return (0, 1)
+    screen_x, screen_y, z, heights = screen_x[valid], screen_y[valid], z[valid], height_field[valid]
     
-    z_min, z_max = min(all_z), max(all_z)
+    z_min, z_max = float(z.min()), float(z.max())
     
     # Height-based characters
     terrain_chars = "_.,-~:;!^*#A"
     
-    heights = [p[3] for p in points_to_draw]
-    if heights:
-        h_min, h_max = min(heights), max(heights)
+    h_min, h_max = heights.min(), heights.max()
+    if h_max != h_min:
+        h_normalized = (heights - h_min) / (h_max - h_min)
     else:
-        h_min, h_max = -1, 1
+        h_normalized = np.full(len(heights), 0.5)
     
-    for screen_x, screen_y, z, h in points_to_draw:
-        if h_max != h_min:
-            h_normalized = (h - h_min) / (h_max - h_min)
-        else:
-            h_normalized = 0.5
-        
-        char_idx = int(h_normalized * (len(terrain_chars) - 1))
-        char = terrain_chars[max(0, min(len(terrain_chars) - 1, char_idx))]
-        
-        color = theme_manager.get_color_for_depth(z, z_min, z_max)
-        
-        buffer.set_pixel(screen_x, screen_y, char, z, color)
+    chars = palette(terrain_chars)[ramp_index(h_normalized, len(terrain_chars))]
+    scatter(buffer, screen_x, screen_y, z, chars, depth_colors(theme_manager, z, z_min, z_max))
     
     return (z_min, z_max)
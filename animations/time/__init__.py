@@ -1,20 +1,5 @@
 """
 Time & Utility Animations Package
 Contains clock, timer, and stopwatch visualizations.
+Modules are imported on demand through the registry in animations/__init__.py.
 """
-
-from . import t_gravity_clock
-from . import t_metaball_clock
-from . import t_matrix_clock
-from . import t_shadow_clock
-from . import t_starwars
-from . import t_typist
-from . import t_water_timer
-from . import t_circular_fuse
-from . import t_life_timer
-from . import t_hourglass
-from . import t_planetary
-from . import t_fire_clock
-from . import t_plasma_clock
-from . import t_snow_clock
-
@@ -0,0 +1,577 @@
+"""
+Shader Expressions
+A small lazy expression layer for per-pixel shaders.
+
+A shader written with these types records its arithmetic as a graph
+instead of evaluating it: u, v and t are symbols, and every operator or
+function call adds a node. The graph is compiled once into a program:
+
+  - constants are folded, and nodes that depend only on t (and constants)
+    become per-frame scalars instead of arrays
+  - common subexpressions are merged
+  - every per-pixel node gets a scratch buffer from a small pool, reused as
+    soon as its last reader has run (in place where the operation allows)
+
+The program then runs over the grid in cache-sized tiles, each node one
+ufunc call with out=, so a frame allocates nothing but its result.
+
+vec2 / vec3 hold one expression per component (structure of arrays), so
+dot, length and normalize are a handful of scalar operations rather than
+reductions over an (H, W, 3) array.
+
+Shaders are ported one at a time: decorate the function with @shader and
+replace np.* calls by the functions here. The result is an ordinary
+shader(u, v, t) for run_shader_animation.
+"""
+
+import functools
+import threading
+
+import numpy as np
+
+# Elements per tile: a dozen live float32 buffers of this size fit in L2
+TILE_ELEMENTS = 16384
+
+# Per-pixel inputs of every expression shader
+INPUTS = ("u", "v")
+
+
+# ============================================================================
+# Kernels
+# ============================================================================
+# name -> (ufunc, commutative). Every kernel is elementwise, so its output
+# buffer may alias one of its inputs.
+
+def _clip(x, low, high, out=None):
+    return np.clip(x, low, high, out=out)
+
+
+_KERNELS = {
+    "add": (np.add, True),
+    "subtract": (np.subtract, False),
+    "multiply": (np.multiply, True),
+    "divide": (np.true_divide, False),
+    "power": (np.power, False),
+    "minimum": (np.minimum, True),
+    "maximum": (np.maximum, True),
+    "greater_equal": (np.greater_equal, False),
+    "negative": (np.negative, False),
+    "absolute": (np.absolute, False),
+    "square": (np.square, False),
+    "sqrt": (np.sqrt, False),
+    "sin": (np.sin, False),
+    "cos": (np.cos, False),
+    "exp": (np.exp, False),
+    "floor": (np.floor, False),
+    "clip": (_clip, False),
+}
+
+
+# ============================================================================
+# Expressions
+# ============================================================================
+
+class Expr:
+    """
+    One scalar expression node: an input ("u", "v"), the time ("t"), a
+    constant, or a kernel applied to other nodes. uniform is True for
+    nodes that do not vary per pixel.
+    """
+
+    __slots__ = ("op", "args", "value", "uniform")
+
+    # NumPy scalars defer to our reflected operators
+    __array_ufunc__ = None
+
+    def __init__(self, op, args=(), value=None):
+        self.op = op
+        self.args = args
+        self.value = value
+        self.uniform = op != "input" and all(a.uniform for a in args)
+
+    @property
+    def is_const(self):
+        return self.op == "const"
+
+    def __add__(self, other):
+        return _apply("add", self, other)
+
+    def __radd__(self, other):
+        return _apply("add", other, self)
+
+    def __sub__(self, other):
+        return _apply("subtract", self, other)
+
+    def __rsub__(self, other):
+        return _apply("subtract", other, self)
+
+    def __mul__(self, other):
+        return _apply("multiply", self, other)
+
+    def __rmul__(self, other):
+        return _apply("multiply", other, self)
+
+    def __truediv__(self, other):
+        return _apply("divide", self, other)
+
+    def __rtruediv__(self, other):
+        return _apply("divide", other, self)
+
+    def __pow__(self, exponent):
+        if exponent == 2:
+            return _apply("square", self)
+        if exponent == 0.5:
+            return _apply("sqrt", self)
+        return _apply("power", self, exponent)
+
+    def __neg__(self):
+        return _apply("negative", self)
+
+    def __abs__(self):
+        return _apply("absolute", self)
+
+
+def const(value):
+    return Expr("const", value=float(value))
+
+
+def _wrap(x):
+    if isinstance(x, Expr):
+        return x
+    if isinstance(x, Vec):
+        raise TypeError("vector used where a scalar expression is expected")
+    return const(x)
+
+
+def _apply(op, *args):
+    """Kernel node, folded where the arguments make it trivial."""
+    if any(isinstance(a, Vec) for a in args):
+        return NotImplemented
+    args = tuple(_wrap(a) for a in args)
+    if all(a.is_const for a in args):
+        with np.errstate(all="ignore"):
+            return const(_KERNELS[op][0](*(a.value for a in args)))
+
+    # x + 0, x - 0, x * 1, x / 1
+    if len(args) == 2:
+        a, b = args
+        if op in ("add", "subtract") and b.is_const and b.value == 0.0:
+            return a
+        if op == "add" and a.is_const and a.value == 0.0:
+            return b
+        if op in ("multiply", "divide") and b.is_const and b.value == 1.0:
+            return a
+        if op == "multiply" and a.is_const and a.value == 1.0:
+            return b
+    return Expr(op, args)
+
+
+# ============================================================================
+# Vectors
+# ============================================================================
+
+class Vec:
+    """GLSL-style vector: one scalar expression per component."""
+
+    __slots__ = ("c",)
+
+    __array_ufunc__ = None
+
+    def __init__(self, *components):
+        self.c = tuple(_wrap(x) for x in components)
+
+    @property
+    def x(self):
+        return self.c[0]
+
+    @property
+    def y(self):
+        return self.c[1]
+
+    @property
+    def z(self):
+        return self.c[2]
+
+    def __len__(self):
+        return len(self.c)
+
+    def __iter__(self):
+        return iter(self.c)
+
+    def _zip(self, other, op):
+        if isinstance(other, Vec):
+            if len(other) != len(self):
+                raise ValueError(f"vec{len(self)} combined with vec{len(other)}")
+            return Vec(*(op(a, b) for a, b in zip(self.c, other.c)))
+        return Vec(*(op(a, other) for a in self.c))
+
+    def __add__(self, other):
+        return self._zip(other, lambda a, b: a + b)
+
+    def __radd__(self, other):
+        return self._zip(other, lambda a, b: b + a)
+
+    def __sub__(self, other):
+        return self._zip(other, lambda a, b: a - b)
+
+    def __rsub__(self, other):
+        return self._zip(other, lambda a, b: b - a)
+
+    def __mul__(self, other):
+        return self._zip(other, lambda a, b: a * b)
+
+    def __rmul__(self, other):
+        return self._zip(other, lambda a, b: b * a)
+
+    def __truediv__(self, other):
+        return self._zip(other, lambda a, b: a / b)
+
+    def __rtruediv__(self, other):
+        return self._zip(other, lambda a, b: b / a)
+
+    def __neg__(self):
+        return Vec(*(-a for a in self.c))
+
+    def __abs__(self):
+        return Vec(*(abs(a) for a in self.c))
+
+
+def vec2(x, y=None):
+    return Vec(x, x if y is None else y)
+
+
+def vec3(x, y=None, z=None):
+    return Vec(x, x if y is None else y, x if z is None else z)
+
+
+def _componentwise(func):
+    """Apply a scalar function per component where any argument is a Vec."""
+    @functools.wraps(func)
+    def apply(*args):
+        size = max((len(a) for a in args if isinstance(a, Vec)), default=0)
+        if not size:
+            return func(*args)
+        return Vec(*(func(*(a.c[i] if isinstance(a, Vec) else a for a in args))
+                     for i in range(size)))
+    return apply
+
+
+# ============================================================================
+# Functions
+# ============================================================================
+
+@_componentwise
+def sin(x):
+    return _apply("sin", x)
+
+
+@_componentwise
+def cos(x):
+    return _apply("cos", x)
+
+
+@_componentwise
+def exp(x):
+    return _apply("exp", x)
+
+
+@_componentwise
+def sqrt(x):
+    return _apply("sqrt", x)
+
+
+@_componentwise
+def floor(x):
+    return _apply("floor", x)
+
+
+@_componentwise
+def fract(x):
+    return x - floor(x)
+
+
+@_componentwise
+def minimum(a, b):
+    return _apply("minimum", a, b)
+
+
+@_componentwise
+def maximum(a, b):
+    return _apply("maximum", a, b)
+
+
+@_componentwise
+def clamp(x, low, high):
+    return _apply("clip", x, low, high)
+
+
+@_componentwise
+def step(edge, x):
+    """GLSL step: 1.0 where x >= edge, else 0.0."""
+    return _apply("greater_equal", x, edge)
+
+
+@_componentwise
+def mix(a, b, t):
+    return a + (b - a) * t
+
+
+@_componentwise
+def smoothstep(edge0, edge1, x):
+    s = clamp((x - edge0) * (1.0 / (edge1 - edge0)), 0.0, 1.0)
+    return s * s * (3.0 - 2.0 * s)
+
+
+def dot(a, b):
+    terms = [x * y for x, y in zip(a, b)]
+    total = terms[0]
+    for term in terms[1:]:
+        total = total + term
+    return total
+
+
+def length(a):
+    return sqrt(dot(a, a))
+
+
+def normalize(a):
+    return a * (1.0 / maximum(length(a), 1e-9))
+
+
+# ============================================================================
+# Compilation
+# ============================================================================
+
+class Program:
+    """
+    A compiled expression graph.
+
+    Uniform nodes are evaluated once per call as Python floats (which keep
+    the grid's dtype). Per-pixel nodes become steps (kernel, arguments,
+    buffer); an argument is a buffer index, an input name or a uniform.
+    """
+
+    def __init__(self, outputs):
+        self.traced = _count_nodes(outputs)
+        outputs = _merge_common(outputs)
+        order = _topological(outputs)
+
+        # Uniforms: time and constants are leaves, the rest are kernels
+        self.uniforms = [n for n in order if n.uniform]
+        uniform_index = {id(n): i for i, n in enumerate(self.uniforms)}
+        self._uniform_steps = [(n, tuple(uniform_index[id(a)] for a in n.args))
+                               for n in self.uniforms]
+        nodes = [n for n in order if not n.uniform and n.op != "input"]
+        node_index = {id(n): i for i, n in enumerate(nodes)}
+
+        # Last step reading each per-pixel node (outputs live to the end)
+        last_use = {}
+        for i, node in enumerate(nodes):
+            for arg in node.args:
+                last_use[id(arg)] = i
+        for node in outputs:
+            last_use[id(node)] = len(nodes)
+
+        # Buffer pool: a step may write over an argument it is the last
+        # reader of (every kernel is elementwise)
+        free = []
+        self.buffers = 0
+        slot = {}
+        self.steps = []
+        for i, node in enumerate(nodes):
+            args = []
+            for arg in node.args:
+                if arg.uniform:
+                    args.append(("uniform", uniform_index[id(arg)]))
+                elif arg.op == "input":
+                    args.append(("input", arg.value))
+                else:
+                    args.append(("buffer", slot[id(arg)]))
+            for arg in {id(a): a for a in node.args if id(a) in slot}.values():
+                if last_use[id(arg)] == i:
+                    free.append(slot[id(arg)])
+            if free:
+                slot[id(node)] = free.pop()
+            else:
+                slot[id(node)] = self.buffers
+                self.buffers += 1
+            self.steps.append((_KERNELS[node.op][0], tuple(args), slot[id(node)]))
+
+        self.outputs = []
+        for node in outputs:
+            if node.uniform:
+                self.outputs.append(("uniform", uniform_index[id(node)]))
+            elif node.op == "input":
+                self.outputs.append(("input", node.value))
+            else:
+                self.outputs.append(("buffer", slot[id(node)]))
+
+        # Flat operand table per tile: buffers, then inputs, then uniforms
+        base = {"buffer": 0, "input": self.buffers, "uniform": self.buffers + len(INPUTS)}
+        def index(kind, ref):
+            return base[kind] + (INPUTS.index(ref) if kind == "input" else ref)
+        self._plan = [(kernel, tuple(index(*a) for a in args), out)
+                      for kernel, args, out in self.steps]
+        self._output_plan = [index(*o) for o in self.outputs]
+        self._local = threading.local()
+
+    def _scratch(self, dtype):
+        pools = getattr(self._local, "pools", None)
+        if pools is None:
+            pools = self._local.pools = {}
+        pool = pools.get(dtype)
+        if pool is None:
+            pool = pools[dtype] = [np.empty(TILE_ELEMENTS, dtype=dtype)
+                                   for _ in range(self.buffers)]
+        return pool
+
+    def uniform_values(self, t):
+        """Values of the uniform nodes at time t."""
+        values = []
+        for node, args in self._uniform_steps:
+            if node.op == "const":
+                values.append(node.value)
+            elif node.op == "time":
+                values.append(float(t))
+            else:
+                with np.errstate(all="ignore"):
+                    values.append(float(_KERNELS[node.op][0](*(values[i] for i in args))))
+        return values
+
+    def run(self, inputs, t, shape, dtype):
+        """
+        Evaluate every output over flat inputs {"u": ..., "v": ...}.
+
+        Returns:
+            Array of shape (size, len(outputs)).
+        """
+        size = int(np.prod(shape))
+        uniforms = self.uniform_values(t)
+        result = np.empty((size, len(self.outputs)), dtype=dtype)
+        pool = self._scratch(dtype)
+
+        operands = [None] * (self.buffers + len(INPUTS)) + uniforms
+        flat_inputs = [inputs[name] for name in INPUTS]
+        for start in range(0, size, TILE_ELEMENTS):
+            stop = min(start + TILE_ELEMENTS, size)
+            n = stop - start
+            operands[:self.buffers] = pool if n == TILE_ELEMENTS else [b[:n] for b in pool]
+            operands[self.buffers:self.buffers + len(INPUTS)] = [a[start:stop] for a in flat_inputs]
+
+            for kernel, args, out in self._plan:
+                kernel(*[operands[i] for i in args], out=operands[out])
+            for channel, i in enumerate(self._output_plan):
+                result[start:stop, channel] = operands[i]
+        return result
+
+
+def _count_nodes(outputs):
+    seen = set()
+    stack = list(outputs)
+    while stack:
+        node = stack.pop()
+        if id(node) not in seen:
+            seen.add(id(node))
+            stack.extend(node.args)
+    return len(seen)
+
+
+def _merge_common(outputs):
+    """Outputs rewritten so that equal subexpressions are one node."""
+    canonical = {}
+    memo = {}
+
+    stack = [(node, False) for node in outputs]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in memo:
+            continue
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((a, False) for a in node.args if id(a) not in memo)
+            continue
+        args = tuple(memo[id(a)] for a in node.args)
+        ids = tuple(id(a) for a in args)
+        if node.op in _KERNELS and _KERNELS[node.op][1]:
+            ids = tuple(sorted(ids))
+        key = (node.op, node.value, ids)
+        merged = canonical.get(key)
+        if merged is None:
+            merged = canonical[key] = node if args == node.args else Expr(node.op, args, node.value)
+        memo[id(node)] = merged
+    return [memo[id(node)] for node in outputs]
+
+
+def _topological(outputs):
+    order = []
+    seen = set()
+    stack = [(node, False) for node in reversed(outputs)]
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            order.append(node)
+            continue
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.append((node, True))
+        stack.extend((a, False) for a in reversed(node.args) if id(a) not in seen)
+    return order
+
+
+# ============================================================================
+# Shaders
+# ============================================================================
+
+U = Expr("input", value="u")
+V = Expr("input", value="v")
+T = Expr("time")
+
+
+class ExprShader:
+    """
+    An expression shader func(u, v, t) callable as a NumPy shader(u, v, t).
+
+    func is traced with symbolic u, v and t on the first call. It returns a
+    scalar expression (intensity, (H, W)) or a vec3 / tuple of channels
+    ((H, W, 3)). Python control flow runs at trace time only, so it must
+    not depend on t.
+    """
+
+    def __init__(self, func):
+        functools.update_wrapper(self, func)
+        self._program = None
+        self._channels = None
+
+    @property
+    def program(self):
+        if self._program is None:
+            result = self.__wrapped__(U, V, T)
+            if isinstance(result, (Vec, tuple, list)):
+                outputs = [_wrap(c) for c in result]
+                self._channels = len(outputs)
+            else:
+                outputs = [_wrap(result)]
+            self._program = Program(outputs)
+        return self._program
+
+    def __call__(self, u, v, t):
+        program = self.program
+        u, v = np.broadcast_arrays(u, v)
+        shape = u.shape
+        dtype = np.result_type(u, v, np.float32)
+        inputs = {"u": np.ascontiguousarray(u, dtype).reshape(-1),
+                  "v": np.ascontiguousarray(v, dtype).reshape(-1)}
+        result = program.run(inputs, t, shape, dtype)
+        if self._channels is None:
+            return result.reshape(shape)
+        return result.reshape(shape + (self._channels,))
+
+    def __reduce__(self):
+        # Pickled by reference (frame pipeline workers import the module)
+        return self.__qualname__
+
+
+def shader(func):
+    """Decorator: compile an expression shader (see ExprShader)."""
+    return ExprShader(func)
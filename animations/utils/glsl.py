@@ -0,0 +1,51 @@
+"""
+GLSL-style Helpers
+Small vectorised equivalents of the GLSL built-ins the shaders are ported
+from. Every helper preserves the dtype of its array arguments: Python
+scalars and the float32 constants below never promote a float32 shader to
+float64 (see the precision policy in shader_engine).
+"""
+
+import numpy as np
+
+
+def fract(x):
+    """GLSL fract - fractional part of x."""
+    return x - np.floor(x)
+
+
+def mix(a, b, t):
+    """GLSL mix - linear interpolation."""
+    return a + (b - a) * t
+
+
+def clamp(x, low, high):
+    """GLSL clamp."""
+    return np.clip(x, low, high)
+
+
+def smoothstep(edge0, edge1, x):
+    """GLSL smoothstep."""
+    t = np.clip((x - edge0) * (1.0 / (edge1 - edge0)), 0.0, 1.0)
+    return t * t * (3.0 - 2.0 * t)
+
+
+def length(v):
+    """Vector length along last axis."""
+    return np.sqrt(np.sum(v * v, axis=-1))
+
+
+def dot(a, b):
+    """Dot product along last axis."""
+    return np.sum(a * b, axis=-1)
+
+
+def normalize(v):
+    """Normalize vectors along last axis."""
+    norm = np.sqrt(np.sum(v * v, axis=-1, keepdims=True))
+    return v / np.maximum(norm, 1e-9)
+
+
+def vec3(x, y, z):
+    """float32 RGB/XYZ constant; promotes to the shader's dtype when mixed in."""
+    return np.array([x, y, z], dtype=np.float32)
@@ -0,0 +1,786 @@
+"""
+Vectorised Noise Library
+Value, Perlin-gradient and simplex noise over NumPy coordinate arrays, plus
+fBm, turbulence, ridged and domain-warp helpers, and baked periodic fBm
+volumes for shaders that sample the same field many times per frame.
+
+All lattice noise hashes integer lattice coordinates through a permutation
+table instead of a sin-hash. Fractions and blends are computed in float32,
+in place, inside per-thread scratch buffers that are reused across calls
+and octaves. Cell indices are taken in the input precision, so large
+coordinates (e.g. ever-growing time offsets) do not lose lattice accuracy.
+
+Ranges: value noise returns [0, 1]; Perlin and simplex return roughly [-1, 1].
+"""
+
+import math
+import os
+import random
+import threading
+
+import numpy as np
+
+
+# ============================================================================
+# Tables
+# ============================================================================
+
+def make_permutation(seed=42):
+    """
+    Shuffled 0..255 permutation, doubled to 512 entries so that
+    PERM[PERM[i] + j] never needs wrapping. Seed 42 reproduces the table
+    the classic terrain noise used.
+    """
+    perm = list(range(256))
+    random.Random(seed).shuffle(perm)
+    return np.array(perm + perm, dtype=np.int32)
+
+
+PERM = make_permutation()
+
+# Value noise: hashed lattice value, pre-composed with the permutation
+_VALUES = np.random.default_rng(42).random(256).astype(np.float32)
+VALUE_PERM = _VALUES[PERM]
+
+# Perlin 3D gradients (Ken Perlin's improved-noise set of 16)
+_GRAD3 = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+    [1, 1, 0], [0, -1, 1], [-1, 1, 0], [0, -1, -1],
+], dtype=np.float32)
+GRAD3_X = _GRAD3[PERM & 15, 0].copy()
+GRAD3_Y = _GRAD3[PERM & 15, 1].copy()
+GRAD3_Z = _GRAD3[PERM & 15, 2].copy()
+
+# Perlin 2D gradients (diagonals, matching the classic terrain noise)
+_GRAD2 = np.array([[1, 1], [-1, 1], [1, -1], [-1, -1]], dtype=np.float32)
+GRAD2_X = _GRAD2[PERM & 3, 0].copy()
+GRAD2_Y = _GRAD2[PERM & 3, 1].copy()
+
+# Simplex gradients (first 12 of the 3D set; 2D uses their x, y),
+# pre-composed with the permutation like the tables above
+_SIMPLEX_GRAD_X = _GRAD3[PERM % 12, 0].copy()
+_SIMPLEX_GRAD_Y = _GRAD3[PERM % 12, 1].copy()
+_SIMPLEX_GRAD_Z = _GRAD3[PERM % 12, 2].copy()
+
+
+# ============================================================================
+# Scratch Buffers
+# ============================================================================
+# Shaders are evaluated from several threads at once (tiled rendering), so
+# scratch buffers are thread-local. Each (name, dtype) owns one flat buffer,
+# grown to the largest size requested and viewed in the requested shape, so
+# callers with a different shape every call (compacted ray sets) reuse it.
+
+_local = threading.local()
+
+
+def _scratch(name, shape, dtype=np.float32):
+    buffers = getattr(_local, "buffers", None)
+    if buffers is None:
+        buffers = _local.buffers = {}
+    key = (name, np.dtype(dtype))
+    size = math.prod(shape)
+    buf = buffers.get(key)
+    if buf is None or buf.size < size:
+        buf = buffers[key] = np.empty(size, dtype=dtype)
+    return buf[:size].reshape(shape)
+
+
+def _result(out, shape):
+    if out is None:
+        return np.empty(shape, dtype=np.float32)
+    return out
+
+
+def _coord_dtype(coord):
+    """Float dtype used for a coordinate's integer part (input precision)."""
+    return coord.dtype if coord.dtype.kind == "f" else np.dtype(np.float64)
+
+
+def _split(coord, name, shape, mask=255):
+    """
+    Split a coordinate into its lattice cell (int32 wrapped by `mask`) and
+    float32 fraction. Both live in scratch buffers named after `name`.
+    """
+    coord = np.asarray(coord)
+    floor = _scratch(name + "_floor", shape, _coord_dtype(coord))
+    np.floor(coord, out=floor)
+
+    cell = _scratch(name + "_cell", shape, np.int32)
+    np.copyto(cell, floor, casting="unsafe")
+    np.bitwise_and(cell, mask, out=cell)
+
+    frac = _scratch(name + "_frac", shape, np.float32)
+    np.subtract(coord, floor, out=frac, casting="same_kind")
+    return cell, frac
+
+
+def _hermite(frac, out):
+    """out <- frac^2 (3 - 2 frac), the GLSL smoothstep fade."""
+    np.multiply(frac, -2.0, out=out)
+    out += 3.0
+    out *= frac
+    out *= frac
+    return out
+
+
+def _quintic(frac, out):
+    """out <- 6f^5 - 15f^4 + 10f^3, Perlin's improved fade."""
+    np.multiply(frac, 6.0, out=out)
+    out -= 15.0
+    out *= frac
+    out += 10.0
+    out *= frac
+    out *= frac
+    out *= frac
+    return out
+
+
+def _lerp(a, b, t):
+    """a <- a + (b - a) t, in place. Clobbers b."""
+    np.subtract(b, a, out=b)
+    b *= t
+    a += b
+    return a
+
+
+def _take(table, index, out):
+    return np.take(table, index, out=out, mode="clip")
+
+
+def _shape(*coords):
+    return np.broadcast(*coords).shape
+
+
+# ============================================================================
+# Lattice Hashing
+# ============================================================================
+
+def _hash2(ix, iy, shape):
+    """Row bases a = P[x] + y and b = P[x+1] + y for the 2D lattice cell."""
+    a = _scratch("h2_a", shape, np.int32)
+    b = _scratch("h2_b", shape, np.int32)
+    _take(PERM, ix, a)
+    a += iy
+    np.add(ix, 1, out=b)
+    _take(PERM, b, b)
+    b += iy
+    return a, b
+
+
+def _hash3(ix, iy, iz, shape):
+    """Column bases aa, ab, ba, bb for the 3D lattice cell (z offset applied)."""
+    a, b = _hash2(ix, iy, shape)
+    aa = _scratch("h3_aa", shape, np.int32)
+    ab = _scratch("h3_ab", shape, np.int32)
+    ba = _scratch("h3_ba", shape, np.int32)
+    bb = _scratch("h3_bb", shape, np.int32)
+    _take(PERM, a, aa)
+    aa += iz
+    a += 1
+    _take(PERM, a, ab)
+    ab += iz
+    _take(PERM, b, ba)
+    ba += iz
+    b += 1
+    _take(PERM, b, bb)
+    bb += iz
+    return aa, ab, ba, bb
+
+
+# ============================================================================
+# Value Noise
+# ============================================================================
+
+def value2(x, y, out=None):
+    """2D value noise in [0, 1] with smoothstep blending."""
+    shape = _shape(x, y)
+    ix, fx = _split(x, "x", shape)
+    iy, fy = _split(y, "y", shape)
+    ux = _hermite(fx, _scratch("ux", shape))
+    uy = _hermite(fy, _scratch("uy", shape))
+    a, b = _hash2(ix, iy, shape)
+
+    res = _result(out, shape)
+    c1 = _scratch("c1", shape)
+    _take(VALUE_PERM, a, res)
+    _take(VALUE_PERM, b, c1)
+    _lerp(res, c1, ux)
+
+    a += 1
+    b += 1
+    c0 = _scratch("c0", shape)
+    _take(VALUE_PERM, a, c0)
+    _take(VALUE_PERM, b, c1)
+    _lerp(c0, c1, ux)
+    return _lerp(res, c0, uy)
+
+
+def value3(x, y, z, out=None):
+    """3D value noise in [0, 1] with smoothstep blending."""
+    shape = _shape(x, y, z)
+    ix, fx = _split(x, "x", shape)
+    iy, fy = _split(y, "y", shape)
+    iz, fz = _split(z, "z", shape)
+    ux = _hermite(fx, _scratch("ux", shape))
+    uy = _hermite(fy, _scratch("uy", shape))
+    uz = _hermite(fz, _scratch("uz", shape))
+    aa, ab, ba, bb = _hash3(ix, iy, iz, shape)
+
+    res = _result(out, shape)
+    c0 = _scratch("c0", shape)
+    c1 = _scratch("c1", shape)
+    y1 = _scratch("y1", shape)
+
+    # Near z plane
+    _take(VALUE_PERM, aa, res)
+    _take(VALUE_PERM, ba, c1)
+    _lerp(res, c1, ux)
+    _take(VALUE_PERM, ab, c0)
+    _take(VALUE_PERM, bb, c1)
+    _lerp(res, _lerp(c0, c1, ux), uy)
+
+    # Far z plane
+    for idx in (aa, ab, ba, bb):
+        idx += 1
+    _take(VALUE_PERM, aa, y1)
+    _take(VALUE_PERM, ba, c1)
+    _lerp(y1, c1, ux)
+    _take(VALUE_PERM, ab, c0)
+    _take(VALUE_PERM, bb, c1)
+    _lerp(y1, _lerp(c0, c1, ux), uy)
+
+    return _lerp(res, y1, uz)
+
+
+# ============================================================================
+# Perlin Gradient Noise
+# ============================================================================
+
+def _grad2(index, dx, dy, out, tmp):
+    """out <- dot(gradient[index], (dx, dy))."""
+    _take(GRAD2_X, index, out)
+    out *= dx
+    _take(GRAD2_Y, index, tmp)
+    tmp *= dy
+    out += tmp
+    return out
+
+
+def _grad3(index, dx, dy, dz, out, tmp):
+    """out <- dot(gradient[index], (dx, dy, dz))."""
+    _take(GRAD3_X, index, out)
+    out *= dx
+    _take(GRAD3_Y, index, tmp)
+    tmp *= dy
+    out += tmp
+    _take(GRAD3_Z, index, tmp)
+    tmp *= dz
+    out += tmp
+    return out
+
+
+def perlin2(x, y, out=None):
+    """2D Perlin gradient noise, roughly [-1, 1], quintic fade."""
+    shape = _shape(x, y)
+    ix, fx = _split(x, "x", shape)
+    iy, fy = _split(y, "y", shape)
+    ux = _quintic(fx, _scratch("ux", shape))
+    uy = _quintic(fy, _scratch("uy", shape))
+    fx1 = np.subtract(fx, 1.0, out=_scratch("fx1", shape))
+    fy1 = np.subtract(fy, 1.0, out=_scratch("fy1", shape))
+    a, b = _hash2(ix, iy, shape)
+
+    res = _result(out, shape)
+    c0 = _scratch("c0", shape)
+    c1 = _scratch("c1", shape)
+    tmp = _scratch("tmp", shape)
+
+    _grad2(a, fx, fy, res, tmp)
+    _grad2(b, fx1, fy, c1, tmp)
+    _lerp(res, c1, ux)
+
+    a += 1
+    b += 1
+    _grad2(a, fx, fy1, c0, tmp)
+    _grad2(b, fx1, fy1, c1, tmp)
+    _lerp(c0, c1, ux)
+    return _lerp(res, c0, uy)
+
+
+def perlin3(x, y, z, out=None):
+    """3D Perlin gradient noise, roughly [-1, 1], quintic fade."""
+    shape = _shape(x, y, z)
+    ix, fx = _split(x, "x", shape)
+    iy, fy = _split(y, "y", shape)
+    iz, fz = _split(z, "z", shape)
+    ux = _quintic(fx, _scratch("ux", shape))
+    uy = _quintic(fy, _scratch("uy", shape))
+    uz = _quintic(fz, _scratch("uz", shape))
+    fx1 = np.subtract(fx, 1.0, out=_scratch("fx1", shape))
+    fy1 = np.subtract(fy, 1.0, out=_scratch("fy1", shape))
+    fz1 = np.subtract(fz, 1.0, out=_scratch("fz1", shape))
+    aa, ab, ba, bb = _hash3(ix, iy, iz, shape)
+
+    res = _result(out, shape)
+    c0 = _scratch("c0", shape)
+    c1 = _scratch("c1", shape)
+    y1 = _scratch("y1", shape)
+    tmp = _scratch("tmp", shape)
+
+    # Near z plane
+    _grad3(aa, fx, fy, fz, res, tmp)
+    _grad3(ba, fx1, fy, fz, c1, tmp)
+    _lerp(res, c1, ux)
+    _grad3(ab, fx, fy1, fz, c0, tmp)
+    _grad3(bb, fx1, fy1, fz, c1, tmp)
+    _lerp(res, _lerp(c0, c1, ux), uy)
+
+    # Far z plane
+    for idx in (aa, ab, ba, bb):
+        idx += 1
+    _grad3(aa, fx, fy, fz1, y1, tmp)
+    _grad3(ba, fx1, fy, fz1, c1, tmp)
+    _lerp(y1, c1, ux)
+    _grad3(ab, fx, fy1, fz1, c0, tmp)
+    _grad3(bb, fx1, fy1, fz1, c1, tmp)
+    _lerp(y1, _lerp(c0, c1, ux), uy)
+
+    return _lerp(res, y1, uz)
+
+
+# ============================================================================
+# Simplex Noise
+# ============================================================================
+
+_F2 = 0.5 * (np.sqrt(3.0) - 1.0)
+_G2 = (3.0 - np.sqrt(3.0)) / 6.0
+_F3 = 1.0 / 3.0
+_G3 = 1.0 / 6.0
+
+
+def _simplex_corner(index, offsets, falloff, out, tmp):
+    """
+    out += max(falloff - |d|^2, 0)^4 * dot(gradient[index], d), where d is
+    the corner offset. Uses tmp and a scratch accumulator.
+    """
+    shape = out.shape
+    weight = _scratch("sx_w", shape)
+    weight.fill(falloff)
+    for d in offsets:
+        np.multiply(d, d, out=tmp)
+        weight -= tmp
+    np.maximum(weight, 0.0, out=weight)
+    weight *= weight
+    weight *= weight
+
+    dot = _scratch("sx_dot", shape)
+    tables = (_SIMPLEX_GRAD_X, _SIMPLEX_GRAD_Y, _SIMPLEX_GRAD_Z)
+    _take(tables[0], index, dot)
+    dot *= offsets[0]
+    for table, d in zip(tables[1:], offsets[1:]):
+        _take(table, index, tmp)
+        tmp *= d
+        dot += tmp
+    dot *= weight
+    out += dot
+
+
+def simplex2(x, y, out=None):
+    """2D simplex noise, roughly [-1, 1]."""
+    shape = _shape(x, y)
+    x = np.asarray(x)
+    y = np.asarray(y)
+
+    # Skew to the simplex lattice; cell indices in input precision
+    skew = (x + y) * _F2
+    i = np.floor(x + skew)
+    j = np.floor(y + skew)
+    unskew = (i + j) * _G2
+    x0 = _scratch("sx_x0", shape)
+    y0 = _scratch("sx_y0", shape)
+    np.subtract(x, i - unskew, out=x0, casting="same_kind")
+    np.subtract(y, j - unskew, out=y0, casting="same_kind")
+
+    ii = _scratch("sx_i", shape, np.int32)
+    jj = _scratch("sx_j", shape, np.int32)
+    np.copyto(ii, i, casting="unsafe")
+    np.copyto(jj, j, casting="unsafe")
+    ii &= 255
+    jj &= 255
+
+    # Middle corner: step along x first in the lower triangle
+    i1 = (x0 > y0).astype(np.int32)
+    j1 = 1 - i1
+
+    res = _result(out, shape)
+    res.fill(0.0)
+    tmp = _scratch("tmp", shape)
+    index = _scratch("sx_idx", shape, np.int32)
+    dx = _scratch("sx_dx", shape)
+    dy = _scratch("sx_dy", shape)
+
+    for step, (oi, oj) in enumerate(((0, 0), (i1, j1), (1, 1))):
+        np.add(jj, oj, out=index)
+        _take(PERM, index, index)
+        index += ii
+        index += oi
+
+        np.subtract(x0, oi, out=dx, casting="unsafe")
+        np.subtract(y0, oj, out=dy, casting="unsafe")
+        dx += step * _G2
+        dy += step * _G2
+        _simplex_corner(index, (dx, dy), 0.5, res, tmp)
+
+    res *= 70.0
+    return res
+
+
+def simplex3(x, y, z, out=None):
+    """3D simplex noise, roughly [-1, 1]."""
+    shape = _shape(x, y, z)
+    x = np.asarray(x)
+    y = np.asarray(y)
+    z = np.asarray(z)
+
+    skew = (x + y + z) * _F3
+    i = np.floor(x + skew)
+    j = np.floor(y + skew)
+    k = np.floor(z + skew)
+    unskew = (i + j + k) * _G3
+    x0 = _scratch("sx_x0", shape)
+    y0 = _scratch("sx_y0", shape)
+    z0 = _scratch("sx_z0", shape)
+    np.subtract(x, i - unskew, out=x0, casting="same_kind")
+    np.subtract(y, j - unskew, out=y0, casting="same_kind")
+    np.subtract(z, k - unskew, out=z0, casting="same_kind")
+
+    ii = _scratch("sx_i", shape, np.int32)
+    jj = _scratch("sx_j", shape, np.int32)
+    kk = _scratch("sx_k", shape, np.int32)
+    np.copyto(ii, i, casting="unsafe")
+    np.copyto(jj, j, casting="unsafe")
+    np.copyto(kk, k, casting="unsafe")
+    ii &= 255
+    jj &= 255
+    kk &= 255
+
+    # Traversal order through the simplex: largest offset component first
+    # (step 1), all but the smallest (step 2).
+    x_ge_y = x0 >= y0
+    i1 = x_ge_y & (x0 >= z0)
+    j1 = ~x_ge_y & (y0 >= z0)
+    k1 = ~(i1 | j1)
+    x_min = ~x_ge_y & (x0 < z0)
+    y_min = x_ge_y & (y0 < z0)
+    z_min = ~(x_min | y_min)
+    i2, j2, k2 = ~x_min, ~y_min, ~z_min
+
+    res = _result(out, shape)
+    res.fill(0.0)
+    tmp = _scratch("tmp", shape)
+    index = _scratch("sx_idx", shape, np.int32)
+    dx = _scratch("sx_dx", shape)
+    dy = _scratch("sx_dy", shape)
+    dz = _scratch("sx_dz", shape)
+
+    corners = ((0, 0, 0), (i1, j1, k1), (i2, j2, k2), (1, 1, 1))
+    for step, (oi, oj, ok) in enumerate(corners):
+        oi, oj, ok = (np.asarray(o, dtype=np.int32) for o in (oi, oj, ok))
+        np.add(kk, ok, out=index)
+        _take(PERM, index, index)
+        index += jj
+        index += oj
+        _take(PERM, index, index)
+        index += ii
+        index += oi
+
+        np.subtract(x0, oi, out=dx, casting="unsafe")
+        np.subtract(y0, oj, out=dy, casting="unsafe")
+        np.subtract(z0, ok, out=dz, casting="unsafe")
+        dx += step * _G3
+        dy += step * _G3
+        dz += step * _G3
+        _simplex_corner(index, (dx, dy, dz), 0.6, res, tmp)
+
+    res *= 32.0
+    return res
+
+
+# Whether each noise returns a signed [-1, 1] range (folds need this)
+value2.signed = value3.signed = False
+perlin2.signed = perlin3.signed = True
+simplex2.signed = simplex3.signed = True
+
+
+# ============================================================================
+# Fractal Sums
+# ============================================================================
+
+def _fractal(x, y, z, noise, octaves, lacunarity, gain, amplitude, fold, out):
+    coords = (x, y) if z is None else (x, y, z)
+    if noise is None:
+        noise = value2 if z is None else value3
+    shape = _shape(*coords)
+
+    total = _result(out, shape)
+    total.fill(0.0)
+    octave = _scratch("fbm_octave", shape)
+    scaled = []
+    for axis, coord in enumerate(coords):
+        scaled.append(_scratch("fbm_coord%d" % axis, shape, _coord_dtype(np.asarray(coord))))
+
+    freq = 1.0
+    amp = amplitude
+    for _ in range(octaves):
+        for coord, buf in zip(coords, scaled):
+            np.multiply(coord, freq, out=buf)
+        noise(*scaled, out=octave)
+        if fold is not None:
+            if not noise.signed:
+                # Map [0, 1] to [-1, 1] before folding
+                octave *= 2.0
+                octave -= 1.0
+            np.abs(octave, out=octave)
+            if fold == "ridged":
+                np.subtract(1.0, octave, out=octave)
+                octave *= octave
+        octave *= amp
+        total += octave
+        freq *= lacunarity
+        amp *= gain
+    return total
+
+
+def fbm(x, y, z=None, noise=None, octaves=4, lacunarity=2.0, gain=0.5, amplitude=0.5, out=None):
+    """
+    Fractional Brownian motion: sum of `octaves` noise layers, each at
+    `lacunarity` times the frequency and `gain` times the amplitude of the
+    last. Pass z for 3D. noise defaults to value2/value3.
+    """
+    return _fractal(x, y, z, noise, octaves, lacunarity, gain, amplitude, None, out)
+
+
+def turbulence(x, y, z=None, noise=None, octaves=4, lacunarity=2.0, gain=0.5, amplitude=0.5, out=None):
+    """Billowy fBm: each octave is folded to |n| (n in [-1, 1])."""
+    return _fractal(x, y, z, noise, octaves, lacunarity, gain, amplitude, "abs", out)
+
+
+def ridged(x, y, z=None, noise=None, octaves=4, lacunarity=2.0, gain=0.5, amplitude=0.5, out=None):
+    """Ridged fBm: each octave is (1 - |n|)^2, giving sharp crests."""
+    return _fractal(x, y, z, noise, octaves, lacunarity, gain, amplitude, "ridged", out)
+
+
+# ============================================================================
+# Domain Warping
+# ============================================================================
+
+def warp_field(x, y, z=None, offsets=None, **fbm_kwargs):
+    """
+    Vector-valued fBm used to displace a domain: one fBm sample per output
+    component, each taken at the input shifted by the matching offset.
+    Returns a tuple with one array per coordinate.
+    """
+    coords = (x, y) if z is None else (x, y, z)
+    if offsets is None:
+        offsets = ((0.0, 0.0, 0.0), (5.2, 1.3, 2.8), (-2.2, -3.5, -1.2))[:len(coords)]
+
+    field = []
+    for offset in offsets:
+        shifted = [c + o if o else c for c, o in zip(coords, offset)]
+        if z is None:
+            field.append(fbm(shifted[0], shifted[1], **fbm_kwargs))
+        else:
+            field.append(fbm(shifted[0], shifted[1], shifted[2], **fbm_kwargs))
+    return tuple(field)
+
+
+def domain_warp(x, y, z=None, strength=1.0, offsets=None, **fbm_kwargs):
+    """
+    Warp a domain by its own fBm: returns p + strength * warp_field(p) as a
+    tuple of coordinate arrays.
+    """
+    coords = (x, y) if z is None else (x, y, z)
+    field = warp_field(x, y, z, offsets=offsets, **fbm_kwargs)
+    return tuple(c + strength * f for c, f in zip(coords, field))
+
+
+# ============================================================================
+# Baked Volumes
+# ============================================================================
+# Raymarchers evaluate the same static fBm at every march step. A baked
+# volume pays for the octaves once (per session, or once ever via the disk
+# cache) and then costs one trilinear lookup per sample. Volumes tile with
+# `period` noise units on every axis, so any coordinate can be sampled.
+#
+# Octaves are baked at lacunarity 2: the lattice of each octave must fit a
+# whole number of times into the period for the volume to tile.
+
+VOLUME_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "terminal-animation-engine"
+)
+_VOLUME_VERSION = 1
+
+_volumes = {}
+_volumes_lock = threading.Lock()
+
+
+def _periodic_value_octave(size, cells):
+    """
+    One octave of value noise on a size^3 grid spanning `cells` lattice
+    cells per axis, with the lattice wrapped so the result tiles. Matches
+    value3 at the same lattice coordinates (cells <= 256).
+    """
+    pos = np.arange(size) * (cells / size)
+    c0 = np.floor(pos).astype(np.int32)
+    c1 = (c0 + 1) % cells
+    frac = (pos - c0).astype(np.float32)
+    u = _hermite(frac, np.empty_like(frac))
+    ux, uy, uz = u[:, None, None], u[None, :, None], u[None, None, :]
+
+    planes = []
+    for cx in (c0, c1):
+        for cy in (c0, c1):
+            base = PERM[PERM[cx][:, None] + cy[None, :]][:, :, None]
+            near = VALUE_PERM[base + c0[None, None, :]]
+            far = VALUE_PERM[base + c1[None, None, :]]
+            planes.append(_lerp(near, far, uz))
+    x0 = _lerp(planes[0], planes[1], uy)
+    x1 = _lerp(planes[2], planes[3], uy)
+    return _lerp(x0, x1, ux)
+
+
+def bake_fbm_volume(size=128, period=8, octaves=5, gain=0.5, amplitude=0.5):
+    """
+    Bake a tileable 3D value-noise fBm into a (size, size, size) float32
+    array covering `period` noise units per axis. size must be a power of
+    two; period * 2**(octaves - 1) must not exceed 256.
+    """
+    if size & (size - 1):
+        raise ValueError("volume size must be a power of two")
+    if period * 2 ** (octaves - 1) > 256:
+        raise ValueError("period too large for the permutation table")
+
+    volume = np.zeros((size, size, size), dtype=np.float32)
+    amp = amplitude
+    for octave in range(octaves):
+        layer = _periodic_value_octave(size, period * 2 ** octave)
+        layer *= amp
+        volume += layer
+        amp *= gain
+    return volume
+
+
+def _load_or_bake(params):
+    name = "fbm_v%d_%s.npy" % (_VOLUME_VERSION, "_".join("%s%g" % kv for kv in params))
+    path = os.path.join(VOLUME_CACHE_DIR, name)
+    kwargs = dict(params)
+    size = kwargs["size"]
+    try:
+        data = np.load(path)
+        if data.shape == (size, size, size) and data.dtype == np.float32:
+            return data
+    except (OSError, ValueError):
+        pass
+
+    data = bake_fbm_volume(**kwargs)
+    try:
+        os.makedirs(VOLUME_CACHE_DIR, exist_ok=True)
+        # Write-then-rename so concurrent workers never read a partial file
+        tmp = "%s.%d.tmp" % (path, os.getpid())
+        with open(tmp, "wb") as f:
+            np.save(f, data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return data
+
+
+class NoiseVolume:
+    """A baked, tileable 3D scalar field with trilinear sampling."""
+
+    def __init__(self, data, period):
+        self.data = data
+        self.size = data.shape[0]
+        self.period = period
+        self.scale = self.size / period
+        self._flat = data.ravel()
+
+    def sample(self, x, y, z, out=None):
+        """Trilinearly sample the volume at noise-space coordinates."""
+        shape = _shape(x, y, z)
+        n = self.size
+        mask = n - 1
+
+        # Voxel coordinates, then cells and fractions
+        axes = []
+        for name, coord in (("vx", x), ("vy", y), ("vz", z)):
+            coord = np.asarray(coord)
+            voxel = _scratch(name, shape, _coord_dtype(coord))
+            np.multiply(coord, self.scale, out=voxel)
+            axes.append(_split(voxel, name, shape, mask))
+        (ix, fx), (iy, fy), (iz, fz) = axes
+
+        # Flat offsets of both neighbouring slabs along each axis
+        offsets = []
+        for name, cell, stride in (("vx", ix, n * n), ("vy", iy, n), ("vz", iz, 1)):
+            hi = _scratch(name + "_hi", shape, np.int32)
+            np.add(cell, 1, out=hi)
+            hi &= mask
+            if stride != 1:
+                hi *= stride
+                cell *= stride
+            offsets.append((cell, hi))
+        (x0, x1), (y0, y1), (z0, z1) = offsets
+
+        index = _scratch("v_index", shape, np.int32)
+        xy = _scratch("v_xy", shape, np.int32)
+
+        def corner(ox, oy, oz, dst):
+            np.add(ox, oy, out=xy)
+            np.add(xy, oz, out=index)
+            return _take(self._flat, index, dst)
+
+        res = _result(out, shape)
+        c0 = _scratch("c0", shape)
+        c1 = _scratch("c1", shape)
+        y_far = _scratch("y1", shape)
+
+        # Near z slab
+        corner(x0, y0, z0, res)
+        corner(x1, y0, z0, c1)
+        _lerp(res, c1, fx)
+        corner(x0, y1, z0, c0)
+        corner(x1, y1, z0, c1)
+        _lerp(res, _lerp(c0, c1, fx), fy)
+
+        # Far z slab
+        corner(x0, y0, z1, y_far)
+        corner(x1, y0, z1, c1)
+        _lerp(y_far, c1, fx)
+        corner(x0, y1, z1, c0)
+        corner(x1, y1, z1, c1)
+        _lerp(y_far, _lerp(c0, c1, fx), fy)
+
+        return _lerp(res, y_far, fz)
+
+
+def fbm_volume(size=128, period=8, octaves=5, gain=0.5, amplitude=0.5, cache=True):
+    """
+    Shared baked fBm volume (see bake_fbm_volume). Baked at most once per
+    process; with cache=True the array is also stored in VOLUME_CACHE_DIR
+    so later sessions and pipeline workers just load it.
+    """
+    params = (("size", size), ("period", period), ("octaves", octaves),
+              ("gain", gain), ("amplitude", amplitude))
+    volume = _volumes.get(params)
+    if volume is None:
+        with _volumes_lock:
+            volume = _volumes.get(params)
+            if volume is None:
+                data = _load_or_bake(params) if cache else bake_fbm_volume(**dict(params))
+                volume = _volumes[params] = NoiseVolume(data, period)
+    return volume
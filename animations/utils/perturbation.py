@@ -0,0 +1,219 @@
+"""
+Perturbation Deep Zoom
+Mandelbrot rendering past the precision of float64 coordinates.
+
+One reference orbit Z(n) at the view centre is iterated in high precision
+(decimal). Every pixel then only iterates its float64 offset from that
+orbit, which stays small enough to represent at any zoom:
+
+    delta(n+1) = (2 Z(n) + delta(n)) * delta(n) + dc
+
+Where the reference stops being a good approximation for a pixel (a
+"glitch": |Z + delta| < |delta|) or the reference orbit runs out, the pixel
+is rebased: delta becomes its full value Z + delta and it continues from
+the start of the reference orbit, which begins at 0.
+"""
+
+import math
+from decimal import Decimal, localcontext
+
+import numpy as np
+
+# Digits of precision beyond log10(zoom) for the reference orbit
+GUARD_DIGITS = 20
+
+# Distance estimates are taken with a large bailout for accuracy
+DE_BAILOUT = 1e3
+
+# Reference orbits are computed in multiples of this many iterations
+ORBIT_BLOCK = 1024
+
+
+def digits_for_zoom(zoom):
+    """Decimal precision needed for a reference orbit at this zoom."""
+    # Rounded up to tens so the orbit is not recomputed every frame
+    digits = int(math.log10(max(zoom, 1.0))) + GUARD_DIGITS
+    return -(-digits // 10) * 10
+
+
+def reference_orbit(cx, cy, max_iter, digits, bailout=2.0):
+    """
+    Iterate z = z^2 + c at (cx, cy) in decimal arithmetic.
+
+    Returns the orbit Z(0) = 0, Z(1), ... as complex128, up to max_iter or
+    the first value beyond the bailout (included).
+    """
+    orbit = np.zeros(max_iter + 1, dtype=np.complex128)
+    with localcontext() as ctx:
+        ctx.prec = digits
+        cx, cy = Decimal(cx), Decimal(cy)
+        x = y = Decimal(0)
+        limit = Decimal(bailout * bailout)
+        for n in range(1, max_iter + 1):
+            x, y = x * x - y * y + cx, 2 * x * y + cy
+            orbit[n] = complex(float(x), float(y))
+            if x * x + y * y > limit:
+                return orbit[:n + 1]
+    return orbit
+
+
+def distance_estimate(cx, cy, max_iter, digits):
+    """
+    Exterior distance estimate to the Mandelbrot set at (cx, cy).
+
+    Returns (distance, direction): direction is the unit complex step that
+    moves c towards the set. Points that do not escape within max_iter
+    return (0.0, 0j).
+    """
+    with localcontext() as ctx:
+        ctx.prec = digits
+        cx, cy = Decimal(cx), Decimal(cy)
+        x = y = Decimal(0)
+        dz = 0j
+        limit = Decimal(DE_BAILOUT * DE_BAILOUT)
+        for n in range(max_iter):
+            # dz/dc only needs float precision
+            dz = 2.0 * complex(float(x), float(y)) * dz + 1.0
+            x, y = x * x - y * y + cx, 2 * x * y + cy
+            if x * x + y * y > limit:
+                z = complex(float(x), float(y))
+                distance = 2.0 * abs(z) * math.log(abs(z)) / abs(dz)
+                # The potential grows along conj(dz/z)
+                gradient = (dz / z).conjugate()
+                return distance, -gradient / abs(gradient)
+    return 0.0, 0j
+
+
+def refine_target(cx, cy, depth, digits, max_iter=100000):
+    """
+    Move (cx, cy) onto the boundary of the set, to within depth.
+
+    An exterior point only looks like the set down to its own distance from
+    it; past that zoom the view is a flat field. Stepping a quarter of the
+    distance estimate towards the set at a time converges on a nearby
+    boundary point without crossing into the interior.
+
+    Returns (cx, cy) as Decimals.
+    """
+    with localcontext() as ctx:
+        ctx.prec = digits
+        cx, cy = Decimal(cx), Decimal(cy)
+        while True:
+            distance, direction = distance_estimate(cx, cy, max_iter, digits)
+            if distance < depth:
+                return cx, cy
+            cx += Decimal(0.25 * distance * direction.real)
+            cy += Decimal(0.25 * distance * direction.imag)
+
+
+def perturbed_escape(orbit, dc, max_iter, bailout=2.0, compact_ratio=0.25):
+    """
+    Escape-time iteration of c = C + dc via perturbation of a reference orbit.
+
+    Args:
+        orbit: Reference orbit from reference_orbit (starts at 0)
+        dc: Complex offsets of each pixel from the reference point
+        max_iter: Iteration budget per pixel
+        bailout: Escape radius
+        compact_ratio: Compact the live set once this fraction of it is done
+
+    Returns:
+        (iterations, escaped), shaped like dc. iterations counts the steps
+        before |z| > bailout (max_iter where it never did).
+    """
+    dc = np.asarray(dc, dtype=np.complex128)
+    shape = dc.shape
+    size = dc.size
+    last = orbit.size - 1
+    bailout_sq = bailout * bailout
+
+    iterations = np.full(size, max_iter, dtype=np.int32)
+    escaped = np.zeros(size, dtype=bool)
+
+    index = np.arange(size)
+    ldc = dc.reshape(-1).copy()
+    delta = np.zeros(size, dtype=np.complex128)
+    ref = np.zeros(size, dtype=np.intp)
+    alive = np.ones(size, dtype=bool)
+
+    # Finished pixels keep iterating until the next compaction; their
+    # results are already recorded, so overflow there is harmless
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            if index.size == 0:
+                break
+
+            # delta = (2 Z + delta) * delta + dc
+            z_ref = orbit[ref]
+            z_ref *= 2.0
+            z_ref += delta
+            delta *= z_ref
+            delta += ldc
+            ref += 1
+
+            # Escape test on the full value Z + delta
+            full = orbit[ref]
+            full += delta
+            magnitude = full.real * full.real + full.imag * full.imag
+            gone = alive & (magnitude > bailout_sq)
+            if gone.any():
+                rec = index[gone]
+                iterations[rec] = i + 1
+                escaped[rec] = True
+                alive &= ~gone
+
+            # Rebase glitched pixels and those at the end of the reference
+            rebase = magnitude < delta.real * delta.real + delta.imag * delta.imag
+            rebase |= ref == last
+            if rebase.any():
+                delta[rebase] = full[rebase]
+                ref[rebase] = 0
+
+            # Compact once enough of the live set has finished
+            live = np.count_nonzero(alive)
+            if live <= (1.0 - compact_ratio) * index.size:
+                keep = np.flatnonzero(alive)
+                index = index[keep]
+                ldc = ldc[keep]
+                delta = delta[keep]
+                ref = ref[keep]
+                alive = np.ones(index.size, dtype=bool)
+
+    return iterations.reshape(shape), escaped.reshape(shape)
+
+
+class DeepZoom:
+    """
+    Perturbation renderer state for zooming into one target.
+
+    Keeps the target refined onto the boundary as far as the current zoom
+    needs, and caches the reference orbit until the zoom needs more digits
+    or a longer orbit.
+    """
+
+    def __init__(self, target_x, target_y):
+        self.cx = Decimal(target_x)
+        self.cy = Decimal(target_y)
+        self.depth = math.inf
+        self.orbit = None
+        self.orbit_key = None
+
+    def escape(self, dc, zoom, max_iter):
+        """Iterations and escaped mask for pixel offsets dc at this zoom."""
+        digits = digits_for_zoom(zoom)
+
+        # Keep the target well inside a pixel of the boundary, refining a
+        # decade of zoom at a time
+        depth = 10.0 ** -(math.ceil(math.log10(max(zoom, 1.0))) + 3)
+        if depth < self.depth:
+            self.cx, self.cy = refine_target(self.cx, self.cy, depth, digits)
+            self.depth = depth
+
+        # Orbit length rounded up so a slowly growing budget reuses it
+        length = -(-max_iter // ORBIT_BLOCK) * ORBIT_BLOCK
+        key = (self.cx, self.cy, digits, length)
+        if key != self.orbit_key:
+            self.orbit = reference_orbit(self.cx, self.cy, length, digits)
+            self.orbit_key = key
+
+        return perturbed_escape(self.orbit, dc, max_iter)
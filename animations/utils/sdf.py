@@ -0,0 +1,305 @@
+"""
+Signed Distance Field Scenes
+Vectorised SDF primitives and operators for ray-marched shaders.
+
+A scene is a small tree of nodes. Calling a node with arrays of point
+coordinates returns their signed distances, with the shape and dtype of
+the points, so a scene can be passed straight to shader_engine.march.
+
+Every node also knows a bounding sphere. The distance to it is a lower
+bound on the node's own distance, which operators use to skip their second
+operand wherever it cannot change the result: a small primitive in a large
+scene only costs work for the points that come near it.
+"""
+
+import math
+
+import numpy as np
+
+
+class SDF:
+    """Base node: a bounding sphere (center, radius) and the operators."""
+
+    center = (0.0, 0.0, 0.0)
+    radius = math.inf
+
+    # The bound is the distance itself: culling this node saves nothing
+    exact_bound = False
+
+    def __call__(self, px, py, pz):
+        raise NotImplementedError
+
+    def bound(self, px, py, pz):
+        """Lower bound on the distance: distance to the bounding sphere."""
+        cx, cy, cz = self.center
+        dx, dy, dz = px - cx, py - cy, pz - cz
+        return np.sqrt(dx * dx + dy * dy + dz * dz) - self.radius
+
+    def ray_interval(self, origin, direction):
+        """
+        Where rays cross the bounding sphere (unit directions).
+
+        Returns (crosses, t_enter, t_exit): rays with crosses False miss the
+        node entirely; the others only need marching from t_enter (0 if
+        they start inside) to t_exit.
+        """
+        ox, oy, oz = (o - c for o, c in zip(origin, self.center))
+        dx, dy, dz = direction
+        if math.isinf(self.radius):
+            zero = np.zeros(np.broadcast(ox, dx).shape, dtype=np.result_type(dx, 0.5))
+            return zero == 0.0, zero, zero + np.inf
+        t_mid = -(ox * dx + oy * dy + oz * dz)
+        half = t_mid * t_mid + (self.radius * self.radius - ox * ox - oy * oy - oz * oz)
+        crosses = half > 0.0
+        half = np.sqrt(np.maximum(half, 0.0))
+        t_exit = t_mid + half
+        crosses &= t_exit > 0.0
+        return crosses, np.maximum(t_mid - half, 0.0), t_exit
+
+    def __or__(self, other):
+        return Union(self, other)
+
+    def __and__(self, other):
+        return Intersection(self, other)
+
+    def __sub__(self, other):
+        return Difference(self, other)
+
+    def smooth_union(self, other, k=0.5):
+        return SmoothUnion(self, other, k)
+
+
+# ============================================================================
+# Primitives
+# ============================================================================
+
+class Sphere(SDF):
+    exact_bound = True
+
+    def __init__(self, center, radius):
+        self.center = tuple(center)
+        self.radius = radius
+
+    def __call__(self, px, py, pz):
+        return self.bound(px, py, pz)
+
+
+class Box(SDF):
+    """Axis-aligned box; size holds the half extents."""
+
+    def __init__(self, center, size):
+        self.center = tuple(center)
+        self.size = tuple(size)
+        self.radius = math.sqrt(sum(s * s for s in self.size))
+
+    def __call__(self, px, py, pz):
+        cx, cy, cz = self.center
+        sx, sy, sz = self.size
+        qx = np.abs(px - cx) - sx
+        qy = np.abs(py - cy) - sy
+        qz = np.abs(pz - cz) - sz
+
+        # Outside distance plus (negative) inside distance
+        inside = np.minimum(np.maximum(np.maximum(qx, qy), qz), 0.0)
+        np.maximum(qx, 0.0, out=qx)
+        np.maximum(qy, 0.0, out=qy)
+        np.maximum(qz, 0.0, out=qz)
+        return np.sqrt(qx * qx + qy * qy + qz * qz) + inside
+
+
+class Torus(SDF):
+    """Torus around the y axis through center."""
+
+    def __init__(self, center, major_r, minor_r):
+        self.center = tuple(center)
+        self.major_r = major_r
+        self.minor_r = minor_r
+        self.radius = major_r + minor_r
+
+    def __call__(self, px, py, pz):
+        cx, cy, cz = self.center
+        dx, dy, dz = px - cx, py - cy, pz - cz
+        q = np.sqrt(dx * dx + dz * dz) - self.major_r
+        return np.sqrt(q * q + dy * dy) - self.minor_r
+
+
+class Plane(SDF):
+    """Horizontal ground plane y = height (unbounded: never culled)."""
+
+    def __init__(self, height=0.0):
+        self.height = height
+
+    def __call__(self, px, py, pz):
+        return py - self.height
+
+
+# ============================================================================
+# Operators
+# ============================================================================
+
+def _enclose(a, b, margin=0.0):
+    """Bounding sphere (center, radius) around the spheres of a and b."""
+    if math.isinf(a.radius) or math.isinf(b.radius):
+        return (0.0, 0.0, 0.0), math.inf
+    offset = [cb - ca for ca, cb in zip(a.center, b.center)]
+    d = math.sqrt(sum(o * o for o in offset))
+    if d + b.radius <= a.radius:
+        return a.center, a.radius + margin
+    if d + a.radius <= b.radius:
+        return b.center, b.radius + margin
+    radius = 0.5 * (d + a.radius + b.radius)
+    shift = (radius - a.radius) / d
+    center = tuple(ca + o * shift for ca, o in zip(a.center, offset))
+    return center, radius + margin
+
+
+class _Binary(SDF):
+    """
+    Operator on two nodes. The second operand is only evaluated where its
+    bound is below reach(da), the level under which it could change the
+    result; elsewhere the result is da.
+    """
+
+    def __init__(self, a, b):
+        self.a = a
+        self.b = b
+
+    def reach(self, da):
+        return None
+
+    def combine(self, da, db):
+        raise NotImplementedError
+
+    def __call__(self, px, py, pz):
+        da = self.a(px, py, pz)
+        reach = None if self.b.exact_bound else self.reach(da)
+        if reach is None:
+            return self.combine(da, self.b(px, py, pz))
+
+        near = self.b.bound(px, py, pz) < reach
+        if near.all():
+            return self.combine(da, self.b(px, py, pz))
+        if near.any():
+            da[near] = self.combine(da[near], self.b(px[near], py[near], pz[near]))
+        return da
+
+
+class Union(_Binary):
+    def __init__(self, a, b):
+        super().__init__(a, b)
+        self.center, self.radius = _enclose(a, b)
+
+    def reach(self, da):
+        return da
+
+    def combine(self, da, db):
+        return np.minimum(da, db)
+
+
+class SmoothUnion(_Binary):
+    """Union blended over a distance of k (polynomial smooth minimum)."""
+
+    def __init__(self, a, b, k=0.5):
+        super().__init__(a, b)
+        self.k = k
+        # The blend pulls the surface out by at most k / 4
+        self.center, self.radius = _enclose(a, b, 0.25 * k)
+
+    def reach(self, da):
+        return da + self.k
+
+    def combine(self, da, db):
+        h = np.maximum(self.k - np.abs(da - db), 0.0) * (1.0 / self.k)
+        return np.minimum(da, db) - h * h * (self.k * 0.25)
+
+
+class Difference(_Binary):
+    """a with b cut out of it."""
+
+    def __init__(self, a, b):
+        super().__init__(a, b)
+        self.center, self.radius = a.center, a.radius
+
+    def reach(self, da):
+        # b only matters where -db > da
+        return -da
+
+    def combine(self, da, db):
+        return np.maximum(da, -db)
+
+
+class Intersection(_Binary):
+    """Both a and b (no culling: either operand can decide the result)."""
+
+    def __init__(self, a, b):
+        super().__init__(a, b)
+        smaller = a if a.radius <= b.radius else b
+        self.center, self.radius = smaller.center, smaller.radius
+
+    def combine(self, da, db):
+        return np.maximum(da, db)
+
+
+# ============================================================================
+# Shading
+# ============================================================================
+
+# Tetrahedron corners for normals: four samples instead of six
+_TETRAHEDRON = ((1.0, -1.0, -1.0), (-1.0, -1.0, 1.0), (-1.0, 1.0, -1.0), (1.0, 1.0, 1.0))
+
+
+def normals(scene, px, py, pz, epsilon=1e-3):
+    """
+    Unit surface normals at arrays of points.
+
+    The gradient is taken from four samples around each point (the
+    corners of a tetrahedron), all evaluated in a single scene call.
+    """
+    shape = np.shape(px)
+    px, py, pz = (np.ravel(c) for c in (px, py, pz))
+    samples = scene(np.concatenate([px + kx * epsilon for kx, _, _ in _TETRAHEDRON]),
+                    np.concatenate([py + ky * epsilon for _, ky, _ in _TETRAHEDRON]),
+                    np.concatenate([pz + kz * epsilon for _, _, kz in _TETRAHEDRON]))
+    samples = samples.reshape(len(_TETRAHEDRON), -1)
+
+    nx, ny, nz = (sum(k[axis] * d for k, d in zip(_TETRAHEDRON, samples)) for axis in range(3))
+    inv_len = 1.0 / np.maximum(np.sqrt(nx * nx + ny * ny + nz * nz), 1e-9)
+    return tuple((n * inv_len).reshape(shape) for n in (nx, ny, nz))
+
+
+def soft_shadow(scene, px, py, pz, light, k=8.0, t_min=0.02, max_steps=32,
+                min_step=0.02, max_step=0.5, hit_dist=1e-3):
+    """
+    Penumbra factor towards a point light for arrays of surface points.
+
+    Marches from each point to the light and keeps the smallest k * h / t
+    (distance over travelled, the narrowest cone that still sees the
+    light). Rays stop when they reach the light or hit something; only
+    rays still in flight are evaluated.
+
+    Returns:
+        Factor from 0 (in shadow) to 1 (fully lit), shaped like px.
+    """
+    shape = np.shape(px)
+    px, py, pz = (np.ravel(c) for c in (px, py, pz))
+    lx, ly, lz = light
+    dx, dy, dz = lx - px, ly - py, lz - pz
+    limit = np.sqrt(dx * dx + dy * dy + dz * dz)
+    inv_len = 1.0 / np.maximum(limit, 1e-9)
+    dx, dy, dz = dx * inv_len, dy * inv_len, dz * inv_len
+
+    shade = np.ones_like(px)
+    t = np.full_like(px, t_min)
+    index = np.flatnonzero(t < limit)
+    for step in range(max_steps):
+        if index.size == 0:
+            break
+        ti = t[index]
+        h = scene(px[index] + dx[index] * ti, py[index] + dy[index] * ti,
+                  pz[index] + dz[index] * ti)
+        shade[index] = np.minimum(shade[index], k * h / ti)
+        ti += np.clip(h, min_step, max_step)
+        t[index] = ti
+        index = index[(h > hit_dist) & (ti < limit[index])]
+
+    return np.clip(shade, 0.0, 1.0).reshape(shape)
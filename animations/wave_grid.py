@@ -9,7 +9,38 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from engine import rotate_y, rotate_x, project_point
+import numpy as np
+
+from geometry import Transform, depth_colors, palette, project_points, ramp_index, scatter
+from heightfield import WaveField, grid_detail, surface_points
+
+
+# Grid parameters - LARGER (grid cells at detail 1)
+GRID_SIZE = 35
+GRID_SPACING = 0.28
+WAVE_AMPLITUDE = 0.8
+WAVE_FREQUENCY = 1.8
+
+# Wave sources (x, y, amplitude, phase) that stay put
+FIXED_SOURCES = [
+    (0, 0, 1.0, 0),               # Center
+    (-3, -3, 0.5, math.pi / 2),   # Corner
+]
+SOURCE_COUNT = 3
+
+# Wave fields by grid detail
+_FIELDS = {}
+
+
+def get_field(detail):
+    """The wave field over the grid for a detail, fixed sources folded in."""
+    if detail not in _FIELDS:
+        size = GRID_SIZE * detail
+        # Grid position (centered)
+        axis = (np.arange(size) - size / 2) * (GRID_SPACING / detail)
+        gx, gy = np.meshgrid(axis, axis, indexing="ij")
+        _FIELDS[detail] = WaveField(gx, gy, WAVE_FREQUENCY, FIXED_SOURCES)
+    return _FIELDS[detail]
 
 
 def render_wave_grid(buffer, width, height, time, theme_manager):
@@ -21,84 +52,41 @@ def render_wave_grid(buffer, width, height, time, theme_manager):
     - Continuous wave animation
     - Rotating view
     """
-    # Grid parameters - LARGER
-    grid_size = 35
-    grid_spacing = 0.28
-    wave_amplitude = 0.8
-    wave_frequency = 1.8
+    # Finer grid on larger screens, same extent
+    field = get_field(grid_detail(width, height))
     
     # Rotation for 3D view (tilted view of the surface)
     rot_x = 0.85  # Tilt to see the surface
     rot_y = time * 0.25  # Slow continuous rotation
+    view = Transform().rotate_x(rot_x).rotate_y(rot_y)
     
-    all_z = []
-    points_to_draw = []
-    
-    # Wave sources (animated positions for dynamic effect)
-    sources = [
-        (0, 0, 1.0, 0),                                    # Center
-        (3 * math.sin(time * 0.3), 3 * math.cos(time * 0.3), 0.6, math.pi/4),  # Orbiting
-        (-3, -3, 0.5, math.pi/2),                          # Corner
-    ]
+    # Orbiting source (animated position for dynamic effect)
+    orbiting = (3 * math.sin(time * 0.3), 3 * math.cos(time * 0.3), 0.6, math.pi / 4)
+    gz = field.heights(time * 2.5, [orbiting])
+    gz *= WAVE_AMPLITUDE / SOURCE_COUNT
     
-    for i in range(grid_size):
-        for j in range(grid_size):
-            # Grid position (centered)
-            gx = (i - grid_size / 2) * grid_spacing
-            gy = (j - grid_size / 2) * grid_spacing
-            
-            # Calculate height from multiple wave sources
-            gz = 0
-            for sx, sy, amp, phase in sources:
-                distance = math.sqrt((gx - sx) ** 2 + (gy - sy) ** 2)
-                gz += amp * math.sin(distance * wave_frequency - time * 2.5 + phase)
-            
-            gz *= wave_amplitude / len(sources)
-            
-            # Swap y and z for proper visualization (grid is horizontal)
-            x = gx
-            y = gz  # Height becomes y
-            z = gy  # Depth
-            
-            # Apply rotations
-            point = rotate_x((x, y, z), rot_x)
-            point = rotate_y(point, rot_y)
-            x, y, z = point
-            
-            projected = project_point(x, y, z, width, height, distance=5.0)
-            if projected:
-                all_z.append(z)
-                # Store original height for character selection
-                points_to_draw.append((projected[0], projected[1], z, gz))
+    # Swap y and z for proper visualization (grid is horizontal):
+    # height becomes y, grid y becomes depth
+    points = surface_points(field.x, gz, field.y)
     
-    if not all_z:
+    screen_x, screen_y, z, valid = project_points(view.apply(points), width, height, distance=5.0)
+    if not valid.any():
         return (0, 1)
+    screen_x, screen_y, z, heights = screen_x[valid], screen_y[valid], z[valid], gz[valid]
     
-    z_min, z_max = min(all_z), max(all_z)
+    z_min, z_max = float(z.min()), float(z.max())
     
     # Height-based characters
     wave_chars = "~-=+*#@"
     
-    # Get height range for character selection
-    heights = [p[3] for p in points_to_draw]
-    if heights:
-        h_min, h_max = min(heights), max(heights)
+    # Character based on wave height
+    h_min, h_max = heights.min(), heights.max()
+    if h_max != h_min:
+        h_normalized = (heights - h_min) / (h_max - h_min)
     else:
-        h_min, h_max = -1, 1
+        h_normalized = np.full(len(heights), 0.5)
     
-    for screen_x, screen_y, z, gz in points_to_draw:
-        # Character based on wave height
-        if h_max != h_min:
-            h_normalized = (gz - h_min) / (h_max - h_min)
-        else:
-            h_normalized = 0.5
-        
-        char_idx = int(h_normalized * (len(wave_chars) - 1))
-        char = wave_chars[max(0, min(len(wave_chars) - 1, char_idx))]
-        
-        # Color based on depth
-        color = theme_manager.get_color_for_depth(z, z_min, z_max)
-        
-        buffer.set_pixel(screen_x, screen_y, char, z, color)
+    chars = palette(wave_chars)[ramp_index(h_normalized, len(wave_chars))]
+    scatter(buffer, screen_x, screen_y, z, chars, depth_colors(theme_manager, z, z_min, z_max))
     
     return (z_min, z_max)
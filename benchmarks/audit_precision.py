@@ -0,0 +1,91 @@
+"""
+Shader Precision Audit
+Renders every screensaver with the default float32 policy and with float64
+grids side by side (shader_engine's precision audit mode). For each shader
+it reports the largest per-cell output difference, the largest share of
+cells that differ visibly in any one frame, and the frame time for both
+dtypes.
+
+A difference under 1/255 cannot show up in 8-bit colour. Hard-edged
+shaders always have some cells at the maximum where an edge shifts by a
+sub-pixel; that is harmless as long as only a small share of cells is
+affected. Shaders that differ broadly should pass dtype=np.float64 to
+run_shader_animation.
+
+Times include late values (t = 1000+) because several shaders feed raw
+time into trigonometry, where float32 loses precision first.
+
+Usage:
+    python benchmarks/audit_precision.py [width] [height]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+import shader_engine
+from animations import SCREENSAVERS_REGULAR, SCREENSAVERS_ULTRAWIDE, load_render
+from colors import ThemeManager
+from engine import ScreenBuffer
+
+TIMES = [0.0, 1.3, 17.9, 240.5, 1000.25, 3600.7]
+
+# Share of visibly different cells above which a shader should stay float64
+BROAD = 0.01
+
+
+def time_frames(render, width, height, theme_manager):
+    """Average seconds per frame over TIMES."""
+    buffer = ScreenBuffer(width, height)
+    render(buffer, width, height, TIMES[0], theme_manager)  # Warm up
+    start = time.perf_counter()
+    for t in TIMES:
+        render(buffer, width, height, t, theme_manager)
+    return (time.perf_counter() - start) / len(TIMES)
+
+
+def main():
+    width = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    height = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    np.seterr(all="ignore")
+
+    theme_manager = ThemeManager()
+    screensavers = {**SCREENSAVERS_ULTRAWIDE, **SCREENSAVERS_REGULAR}
+
+    print(f"Precision audit ({width}x{height}, t in {TIMES})")
+    print(f"  {'screensaver':<18} {'dtype':<8} {'max diff':>9} {'cells':>7} "
+          f"{'float64':>10} {'policy':>10}  verdict")
+    default = shader_engine.SHADER_DTYPE
+    for key, anim in screensavers.items():
+        render = load_render(anim)
+
+        shader_engine.SHADER_DTYPE = np.dtype(np.float64)
+        t64 = time_frames(render, width, height, theme_manager)
+        shader_engine.SHADER_DTYPE = default
+        t32 = time_frames(render, width, height, theme_manager)
+
+        shader_engine.enable_precision_audit()
+        buffer = ScreenBuffer(width, height)
+        for t in TIMES:
+            render(buffer, width, height, t, theme_manager)
+        report = shader_engine.precision_report()
+        shader_engine.disable_precision_audit()
+
+        for name, (dtype, frames, worst, spread) in report.items():
+            if worst < shader_engine.AUDIT_VISIBLE:
+                verdict = "identical"
+            elif spread < BROAD:
+                verdict = "edges only"
+            else:
+                verdict = "keep float64"
+            print(f"  {key:<18} {dtype:<8} {worst:9.4f} {spread:6.2%} "
+                  f"{t64 * 1000:8.1f}ms {t32 * 1000:8.1f}ms  {verdict}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Shader Scratch Arena Benchmark
+Shows what ShaderContext reuse saves in allocations for the shaders that
+use it.
+
+Each shader runs twice on the same grid:
+  - fresh: a new ShaderContext every frame, so every scratch array is
+    allocated (and page-faulted in) again, as before the arena existed
+  - reused: one context for all frames, the way ShaderRenderer runs it
+
+Per frame it reports wall time, new NumPy memory traced by tracemalloc
+(peak over the frame minus what was live before it), and minor page faults.
+
+Usage:
+    python benchmarks/bench_arena.py [frames] [width] [height]
+"""
+
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from shader_engine import ShaderContext, build_uv_grid
+from animations.screensavers import ss_clouds, ss_gerstner, ss_mandelbulb
+
+import numpy as np
+
+SHADERS = [
+    ("clouds", ss_clouds.shader_clouds),
+    ("gerstner", ss_gerstner.shader_gerstner),
+    ("mandelbulb", ss_mandelbulb.shader_mandelbulb),
+]
+
+
+def measure(shader, u, v, frames, reuse):
+    """Average (seconds, traced bytes, minor faults) per frame."""
+    ctx = ShaderContext(u.shape)
+    shader(u, v, 0.0, ctx)  # Warm up (noise volumes, first-touch of ctx)
+
+    elapsed = traced = faults = 0
+    for i in range(frames):
+        if not reuse:
+            ctx = ShaderContext(u.shape)
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        faults_before = resource.getrusage(resource.RUSAGE_SELF).ru_minflt
+        start = time.perf_counter()
+
+        shader(u, v, 0.1 * (i + 1), ctx)
+
+        elapsed += time.perf_counter() - start
+        faults += resource.getrusage(resource.RUSAGE_SELF).ru_minflt - faults_before
+        _, peak = tracemalloc.get_traced_memory()
+        traced += peak - base
+        tracemalloc.stop()
+    return elapsed / frames, traced / frames, faults / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 160
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 45
+    u, v = build_uv_grid(width, height, use_braille=True)
+    np.seterr(all="ignore")
+
+    print(f"Scratch arena benchmark ({u.shape[1]}x{u.shape[0]} braille grid, "
+          f"{frames} frames, per-frame averages; time includes tracing)")
+    print(f"  {'shader':<12} {'context':<8} {'time':>10} {'new memory':>12} {'minor faults':>13}")
+    for name, shader in SHADERS:
+        for reuse in (False, True):
+            seconds, traced, faults = measure(shader, u, v, frames, reuse)
+            label = "reused" if reuse else "fresh"
+            print(f"  {name:<12} {label:<8} {seconds * 1000:8.1f} ms "
+                  f"{traced / 1e6:9.2f} MB {faults:13.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Expression Shader Benchmark
+Compares the screensavers ported to expression shaders (animations/utils/
+expr.py) with the eager NumPy versions they replaced. The eager versions
+are kept below (comments stripped, otherwise unchanged) so the comparison
+stays reproducible.
+
+Per frame it reports wall time and new NumPy memory traced by tracemalloc
+(peak over the frame minus what was live before it; for the expression
+shaders that is the result array). For each expression shader it also shows
+the graph: nodes traced, per-pixel steps left after folding uniforms and
+merging common subexpressions, and the scratch buffers they share.
+
+Usage:
+    python benchmarks/bench_expr.py [frames] [width] [height]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from shader_engine import build_uv_grid
+from animations.screensavers import ss_jellyfish, ss_potential
+
+
+# ============================================================================
+# Legacy: eager NumPy shaders
+# ============================================================================
+
+def eager_jellyfish(u, v, t):
+    x = u * 1.5
+    y = v * 1.5 + 0.3
+
+    density = np.zeros_like(x)
+
+    s_limit = 25
+
+    for s in range(1, s_limit + 1):
+        k1 = (23.0**s) * (20.0**(-s)) * 10.0
+
+        k2 = 1.0 + np.cos(10.0 * s)
+
+        speed = 1.0
+        t_anim = t * speed
+
+        phi = 7.0 * s + t_anim * 0.5
+
+        term_x = np.cos(phi) * x + np.sin(phi) * y
+        term_static = 2.0 * np.cos(5.0 * s - t_anim)
+
+        inner = k1 * k2 * term_x + term_static
+
+        val = np.cos(inner)
+
+        phi_detail = 8.0 * s
+        term_detail = np.cos(phi_detail) * x + np.sin(phi_detail) * y
+        val += 4.0 * np.cos(k1 * k2 * term_detail)
+
+        decay = np.exp(-4.0 * (x**2 + (y + 0.4)**2))
+
+        density += decay * (val + 1.0) * 0.8
+
+    dist_sq = x**2 + (y - 0.3)**2
+    bell_mask = np.exp(-15.0 * (dist_sq - 0.25)**2)
+
+    ripple_phase = 5.0 * t_anim
+    ripple_arg = x * (np.cos(ripple_phase)**2) + y * (np.sin(ripple_phase)**2)
+    ripple = np.cos(15.0 * ripple_arg)
+
+    bell_mask *= (1.0 + 0.1 * ripple)
+
+    density += bell_mask * 1.0
+
+    return density * 0.3
+
+
+def eager_potential(u, v, t):
+    x = u * 1.5
+    y = v * 1.5
+
+    bodies = [
+        (np.sin(t)*0.8, np.sin(2*t)*0.4, 1.0),
+        (np.sin(t+2.09)*0.8, np.sin(2*(t+2.09))*0.4, 1.0),
+        (np.sin(t+4.18)*0.8, np.sin(2*(t+4.18))*0.4, 1.0)
+    ]
+
+    V = np.zeros_like(x)
+
+    for bx, by, m in bodies:
+        dx = x - bx
+        dy = y - by
+        dist = np.sqrt(dx**2 + dy**2)
+        dist = np.maximum(dist, 0.05)
+
+        V += 0.5 * m / dist
+
+    topo = np.sin(V * 40.0 - t*5.0)
+    col = (topo + 1.0) * 0.5
+    col += V * 0.1
+
+    return np.clip(col, 0.0, 1.0)
+
+
+SHADERS = [
+    ("jellyfish", eager_jellyfish, ss_jellyfish.shader_jellyfish),
+    ("potential", eager_potential, ss_potential.shader_potential),
+]
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def measure(shader, u, v, frames):
+    """Average (seconds, traced bytes) per frame, and the last frame."""
+    result = shader(u, v, 0.0)  # Warm up (and compile)
+    elapsed = 0.0
+    for i in range(frames):
+        start = time.perf_counter()
+        result = shader(u, v, 0.1 * (i + 1))
+        elapsed += time.perf_counter() - start
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    shader(u, v, 0.05)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / frames, peak - base, result
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 160
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 45
+    u, v = build_uv_grid(width, height, use_braille=True, dtype=np.float32)
+    np.seterr(all="ignore")
+
+    print(f"Expression shader benchmark ({u.shape[1]}x{u.shape[0]} braille grid, "
+          f"{frames} frames, per-frame averages)")
+    print(f"  {'shader':<10} {'version':<8} {'time':>10} {'new memory':>12} {'max diff':>9}  graph")
+    for name, eager, compiled in SHADERS:
+        eager_time, eager_bytes, eager_result = measure(eager, u, v, frames)
+        expr_time, expr_bytes, expr_result = measure(compiled, u, v, frames)
+        program = compiled.program
+        diff = float(np.abs(expr_result - eager_result).max())
+
+        print(f"  {name:<10} {'eager':<8} {eager_time * 1000:8.1f} ms "
+              f"{eager_bytes / 1e6:9.2f} MB")
+        print(f"  {name:<10} {'expr':<8} {expr_time * 1000:8.1f} ms "
+              f"{expr_bytes / 1e6:9.2f} MB {diff:9.2e}  {program.traced} nodes -> "
+              f"{len(program.steps)} steps, {len(program.uniforms)} uniforms, "
+              f"{program.buffers} buffers")
+
+
+if __name__ == "__main__":
+    main()
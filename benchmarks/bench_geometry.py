@@ -0,0 +1,135 @@
+"""
+Classic 3D Benchmark
+Times the classic 3D animations on the batched geometry pipeline
+(geometry.py) at a few terminal sizes. The per-point torus the pipeline
+replaced is kept below (comments stripped, otherwise unchanged) as the
+reference for the old cost of a tuple-helper surface.
+
+Per animation and size it reports the average frame time, excluding the
+ScreenBuffer allocation the engine does anyway.
+
+Usage:
+    python benchmarks/bench_geometry.py [frames] [sizes...]   (sizes as WxH)
+"""
+
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from colors import ThemeManager
+from engine import ScreenBuffer, rotate_x, rotate_z, project_point
+from animations.torus import render_torus
+from animations.klein import render_klein
+from animations.mobius import render_mobius
+from animations.superformula import render_superformula
+from animations.sphere import render_sphere
+from animations.rose import render_rose
+from animations.lissajous import render_lissajous
+from animations.helix import render_helix
+
+SIZES = [(80, 24), (160, 45), (320, 90)]
+
+
+# ============================================================================
+# Legacy: animations/torus.py (tuple helpers, one point at a time)
+# ============================================================================
+
+def legacy_torus(buffer, width, height, time, theme_manager):
+    R = 2.2
+    r = 0.9
+    A = time * 1.2
+    B = time * 0.7
+    theta_steps = 80
+    phi_steps = 50
+    chars = ".,-~:;=!*#$@"
+    all_z = []
+
+    for i in range(theta_steps):
+        theta = 2 * math.pi * i / theta_steps
+        cos_theta = math.cos(theta)
+        sin_theta = math.sin(theta)
+
+        for j in range(phi_steps):
+            phi = 2 * math.pi * j / phi_steps
+            cos_phi = math.cos(phi)
+            sin_phi = math.sin(phi)
+
+            circle_x = R + r * cos_theta
+            circle_y = r * sin_theta
+            x = circle_x * cos_phi
+            y = circle_y
+            z = circle_x * sin_phi
+
+            nx = cos_theta * cos_phi
+            ny = sin_theta
+            nz = cos_theta * sin_phi
+
+            x, y, z = rotate_x((x, y, z), A)
+            nx, ny, nz = rotate_x((nx, ny, nz), A)
+            x, y, z = rotate_z((x, y, z), B)
+            nx, ny, nz = rotate_z((nx, ny, nz), B)
+
+            luminance = ny * 0.7071 - nz * 0.7071
+
+            if luminance > 0:
+                projected = project_point(x, y, z, width, height)
+                if projected:
+                    screen_x, screen_y = projected
+                    all_z.append(z)
+                    char_idx = int(luminance * (len(chars) - 1))
+                    char_idx = max(0, min(len(chars) - 1, char_idx))
+                    color = theme_manager.get_color_for_depth(z, -3, 3)
+                    buffer.set_pixel(screen_x, screen_y, chars[char_idx], z, color)
+
+    if not all_z:
+        return (0, 1)
+    return (min(all_z), max(all_z))
+
+
+ANIMATIONS = [
+    ("torus (legacy)", legacy_torus),
+    ("torus", render_torus),
+    ("klein", render_klein),
+    ("mobius", render_mobius),
+    ("superformula", render_superformula),
+    ("sphere", render_sphere),
+    ("rose", render_rose),
+    ("lissajous", render_lissajous),
+    ("helix", render_helix),
+]
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def measure(render, width, height, frames, theme_manager):
+    """Average seconds per frame."""
+    render(ScreenBuffer(width, height), width, height, 0.0, theme_manager)  # Warm up
+    elapsed = 0.0
+    for i in range(frames):
+        buffer = ScreenBuffer(width, height)
+        start = time.perf_counter()
+        render(buffer, width, height, 0.37 * (i + 1), theme_manager)
+        elapsed += time.perf_counter() - start
+    return elapsed / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    sizes = [tuple(int(n) for n in s.split("x")) for s in sys.argv[2:]] or SIZES
+    theme_manager = ThemeManager("matrix")
+
+    print(f"Classic 3D benchmark ({frames} frames per size, ms per frame)")
+    print(f"  {'animation':<16}" + "".join(f"{f'{w}x{h}':>10}" for w, h in sizes))
+    for name, render in ANIMATIONS:
+        times = [measure(render, width, height, frames, theme_manager) for width, height in sizes]
+        print(f"  {name:<16}" + "".join(f"{t * 1000:10.2f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
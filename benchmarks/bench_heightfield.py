@@ -0,0 +1,226 @@
+"""
+Heightfield Benchmark
+Compares the terrain and wave grid animations, now built on heightfield.py,
+with the per-point versions they replaced. The legacy versions are kept
+below (comments stripped, otherwise unchanged) so the comparison stays
+reproducible. They use the fixed 40x25 and 35x35 grids at every size; the
+new ones subdivide the grid on larger screens (grid_detail).
+
+Per size it reports the grid detail, points per frame, average frame time
+(excluding the ScreenBuffer allocation) and, for the terrain, the noise
+rows generated per frame once the ring buffer is warm.
+
+Usage:
+    python benchmarks/bench_heightfield.py [frames] [sizes...]   (sizes as WxH)
+"""
+
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from colors import ThemeManager
+from engine import ScreenBuffer, project_point, rotate_x, rotate_y
+from heightfield import grid_detail
+from animations import terrain, wave_grid
+from animations.utils.noise import fbm, perlin2
+
+SIZES = [(80, 24), (160, 45), (320, 90)]
+
+# Frame step in seconds (30 fps)
+FRAME_TIME = 1 / 30
+
+
+# ============================================================================
+# Legacy: per-point renderers
+# ============================================================================
+
+def legacy_terrain(buffer, width, height, time, theme_manager):
+    terrain_width = 40
+    terrain_depth = 25
+    height_scale = 3.0
+    noise_scale = 0.12
+    scroll_speed = 0.6
+
+    rot_x = 0.75
+    rot_y = math.sin(time * 0.15) * 0.15
+
+    all_z = []
+    points_to_draw = []
+
+    scroll_offset = time * scroll_speed
+
+    noise_x = np.arange(terrain_width) * noise_scale
+    noise_y = (np.arange(terrain_depth) + scroll_offset * 2) * noise_scale
+    grid_x, grid_y = np.meshgrid(noise_x, noise_y)
+
+    height_field = fbm(grid_x, grid_y, noise=perlin2, octaves=terrain.OCTAVES, amplitude=1.0)
+    height_field /= terrain.OCTAVE_NORM
+
+    for i in range(terrain_depth):
+        z_pos = i * 0.45
+
+        for j in range(terrain_width):
+            x_pos = (j - terrain_width / 2) * 0.28
+
+            height_val = float(height_field[i, j])
+
+            y_pos = height_val * height_scale
+
+            point = rotate_x((x_pos, y_pos, z_pos), rot_x)
+            point = rotate_y(point, rot_y)
+            x, y, z = point
+
+            y -= 0.8
+
+            projected = project_point(x, y, z, width, height, distance=5.0)
+            if projected:
+                all_z.append(z)
+                points_to_draw.append((projected[0], projected[1], z, height_val))
+
+    if not all_z:
+        return (0, 1)
+
+    z_min, z_max = min(all_z), max(all_z)
+
+    terrain_chars = "_.,-~:;!^*#A"
+
+    heights = [p[3] for p in points_to_draw]
+    h_min, h_max = min(heights), max(heights)
+
+    for screen_x, screen_y, z, h in points_to_draw:
+        if h_max != h_min:
+            h_normalized = (h - h_min) / (h_max - h_min)
+        else:
+            h_normalized = 0.5
+
+        char_idx = int(h_normalized * (len(terrain_chars) - 1))
+        char = terrain_chars[max(0, min(len(terrain_chars) - 1, char_idx))]
+
+        color = theme_manager.get_color_for_depth(z, z_min, z_max)
+
+        buffer.set_pixel(screen_x, screen_y, char, z, color)
+
+    return (z_min, z_max)
+
+
+def legacy_wave_grid(buffer, width, height, time, theme_manager):
+    grid_size = 35
+    grid_spacing = 0.28
+    wave_amplitude = 0.8
+    wave_frequency = 1.8
+
+    rot_x = 0.85
+    rot_y = time * 0.25
+
+    all_z = []
+    points_to_draw = []
+
+    sources = [
+        (0, 0, 1.0, 0),
+        (3 * math.sin(time * 0.3), 3 * math.cos(time * 0.3), 0.6, math.pi/4),
+        (-3, -3, 0.5, math.pi/2),
+    ]
+
+    for i in range(grid_size):
+        for j in range(grid_size):
+            gx = (i - grid_size / 2) * grid_spacing
+            gy = (j - grid_size / 2) * grid_spacing
+
+            gz = 0
+            for sx, sy, amp, phase in sources:
+                distance = math.sqrt((gx - sx) ** 2 + (gy - sy) ** 2)
+                gz += amp * math.sin(distance * wave_frequency - time * 2.5 + phase)
+
+            gz *= wave_amplitude / len(sources)
+
+            point = rotate_x((gx, gz, gy), rot_x)
+            point = rotate_y(point, rot_y)
+            x, y, z = point
+
+            projected = project_point(x, y, z, width, height, distance=5.0)
+            if projected:
+                all_z.append(z)
+                points_to_draw.append((projected[0], projected[1], z, gz))
+
+    if not all_z:
+        return (0, 1)
+
+    z_min, z_max = min(all_z), max(all_z)
+
+    wave_chars = "~-=+*#@"
+
+    heights = [p[3] for p in points_to_draw]
+    h_min, h_max = min(heights), max(heights)
+
+    for screen_x, screen_y, z, gz in points_to_draw:
+        if h_max != h_min:
+            h_normalized = (gz - h_min) / (h_max - h_min)
+        else:
+            h_normalized = 0.5
+
+        char_idx = int(h_normalized * (len(wave_chars) - 1))
+        char = wave_chars[max(0, min(len(wave_chars) - 1, char_idx))]
+
+        color = theme_manager.get_color_for_depth(z, z_min, z_max)
+
+        buffer.set_pixel(screen_x, screen_y, char, z, color)
+
+    return (z_min, z_max)
+
+
+# (name, legacy, heightfield version, grid cells at detail 1)
+ANIMATIONS = [
+    ("terrain", legacy_terrain, terrain.render_terrain,
+     terrain.TERRAIN_WIDTH * terrain.TERRAIN_DEPTH),
+    ("wave_grid", legacy_wave_grid, wave_grid.render_wave_grid, wave_grid.GRID_SIZE ** 2),
+]
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def measure(render, width, height, frames, theme_manager):
+    """Average seconds per frame over consecutive 30 fps frames."""
+    render(ScreenBuffer(width, height), width, height, 0.0, theme_manager)  # Warm up
+    elapsed = 0.0
+    for i in range(frames):
+        buffer = ScreenBuffer(width, height)
+        start = time.perf_counter()
+        render(buffer, width, height, (i + 1) * FRAME_TIME, theme_manager)
+        elapsed += time.perf_counter() - start
+    return elapsed / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+    sizes = [tuple(int(n) for n in s.split("x")) for s in sys.argv[2:]] or SIZES
+    theme_manager = ThemeManager("ocean")
+
+    print(f"Heightfield benchmark ({frames} frames per size at 30 fps, ms per frame)")
+    print(f"  {'animation':<10} {'size':>8} {'detail':>6} {'points':>7} {'legacy':>9} "
+          f"{'new':>9} {'rows/frame':>10}")
+    for name, legacy, render, cells in ANIMATIONS:
+        for width, height in sizes:
+            detail = grid_detail(width, height)
+            legacy_time = measure(legacy, width, height, frames, theme_manager)
+
+            # Fill the ring buffer first so only scrolling is counted
+            render(ScreenBuffer(width, height), width, height, 0.0, theme_manager)
+            field = terrain.get_field(detail) if render is terrain.render_terrain else None
+            generated = field.generated if field else 0
+            new_time = measure(render, width, height, frames, theme_manager)
+            rows = f"{(field.generated - generated) / frames:10.2f}" if field else ""
+
+            print(f"  {name:<10} {f'{width}x{height}':>8} {detail:6d} {cells * detail ** 2:7d} "
+                  f"{legacy_time * 1000:9.2f} {new_time * 1000:9.2f} {rows}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Ray March Compaction Benchmark
+Counts distance-function evaluations (per ray sample) and frame time for
+the marched screensavers, with and without active-ray compaction.
+
+  - dense: no active mask and compact_ratio=1.0, so every ray of the grid
+    is evaluated at every step until all are done, as the marchers did
+    before shader_engine.march (and without cone pre-passes)
+  - compacted: as the shaders run, rays outside their bounds never start,
+    finished rays drop out of the live set, and shaders with a cone
+    pre-pass (cone_block) start rays past the empty space it found
+
+Usage:
+    python benchmarks/bench_march.py [frames] [width] [height]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+import shader_engine
+from shader_engine import ShaderContext, build_uv_grid
+from animations.screensavers import ss_clouds, ss_gyroid, ss_mandelbulb
+
+SHADERS = [
+    ("mandelbulb", ss_mandelbulb, ss_mandelbulb.shader_mandelbulb, True),
+    ("gyroid", ss_gyroid, ss_gyroid.shader_gyroid, False),
+    ("clouds", ss_clouds, ss_clouds.shader_clouds, True),
+]
+
+
+def counting_march(counter, compact_ratio):
+    """shader_engine.march with a fixed compact_ratio that counts samples."""
+    def march(distance_func, *args, **kwargs):
+        def counted(px, py, pz):
+            counter[0] += px.size
+            return distance_func(px, py, pz)
+        if compact_ratio >= 1.0:
+            kwargs.pop("active", None)
+            kwargs.pop("cone_block", None)
+        kwargs["compact_ratio"] = compact_ratio
+        return shader_engine.march(counted, *args, **kwargs)
+    return march
+
+
+def measure(module, shader, use_context, u, v, frames, compact_ratio):
+    """Average (seconds, distance samples) per frame."""
+    counter = [0]
+    module.march = counting_march(counter, compact_ratio)
+    ctx = ShaderContext(u.shape, u.dtype)
+    args = (ctx,) if use_context else ()
+    try:
+        shader(u, v, 0.0, *args)  # Warm up (noise volumes)
+        counter[0] = 0
+        start = time.perf_counter()
+        for i in range(frames):
+            shader(u, v, 1.7 * (i + 1), *args)
+        elapsed = time.perf_counter() - start
+    finally:
+        module.march = shader_engine.march
+    return elapsed / frames, counter[0] / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    width = int(sys.argv[2]) if len(sys.argv) > 2 else 160
+    height = int(sys.argv[3]) if len(sys.argv) > 3 else 45
+    u, v = build_uv_grid(width, height, use_braille=True, dtype=shader_engine.SHADER_DTYPE)
+    np.seterr(all="ignore")
+
+    print(f"Ray march compaction ({u.shape[1]}x{u.shape[0]} braille grid, "
+          f"{u.size} rays, {frames} frames, per-frame averages)")
+    print(f"  {'shader':<12} {'dense evals':>12} {'compacted':>12} "
+          f"{'dense':>10} {'compacted':>10}")
+    for name, module, shader, use_context in SHADERS:
+        t_dense, n_dense = measure(module, shader, use_context, u, v, frames, 1.0)
+        t_live, n_live = measure(module, shader, use_context, u, v, frames, 0.25)
+        print(f"  {name:<12} {n_dense:12.0f} {n_live:12.0f} "
+              f"{t_dense * 1000:8.1f}ms {t_live * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
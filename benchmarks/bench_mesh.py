@@ -0,0 +1,80 @@
+"""
+Triangle Mesh Benchmark
+Times the mesh subsystem (mesh.py) on trefoil knot meshes of increasing
+size: writing each one out as a Wavefront OBJ file and loading it back
+with load_obj, then rendering it with flat and Gouraud shading at a few
+terminal sizes.
+
+Per mesh it reports the load time and the average frame time per size,
+excluding the ScreenBuffer allocation the engine does anyway.
+
+Usage:
+    python benchmarks/bench_mesh.py [frames] [sizes...]   (sizes as WxH)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from colors import ThemeManager
+from engine import ScreenBuffer
+from geometry import Transform
+from mesh import Mesh, load_obj, render_mesh
+from animations.model import TREFOIL
+
+SIZES = [(80, 24), (160, 45), (320, 90)]
+
+# (u, v) quads around and across the knot: 2 triangles each
+TESSELLATIONS = [(64, 12), (256, 24), (1024, 48)]
+
+
+def write_obj(mesh, path):
+    """Save a mesh as a minimal OBJ file (1-based face indices)."""
+    with open(path, "w") as obj:
+        obj.writelines(f"v {x:.6f} {y:.6f} {z:.6f}\n" for x, y, z in mesh.vertices.tolist())
+        obj.writelines(f"f {a} {b} {c}\n" for a, b, c in (mesh.faces + 1).tolist())
+
+
+def measure(mesh, width, height, frames, shading, theme_manager):
+    """Average seconds per frame."""
+    render_mesh(ScreenBuffer(width, height), mesh, Transform(), width, height, theme_manager,
+                shading=shading)  # Warm up
+    elapsed = 0.0
+    for i in range(frames):
+        buffer = ScreenBuffer(width, height)
+        rotation = Transform().rotate_y(0.37 * i).rotate_x(0.21 * i)
+        start = time.perf_counter()
+        render_mesh(buffer, mesh, rotation, width, height, theme_manager, shading=shading)
+        elapsed += time.perf_counter() - start
+    return elapsed / frames
+
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    sizes = [tuple(int(n) for n in s.split("x")) for s in sys.argv[2:]] or SIZES
+    theme_manager = ThemeManager("gold")
+
+    print(f"Triangle mesh benchmark ({frames} frames per size, ms per frame)")
+    print(f"  {'triangles':>9} {'load':>9} {'shading':<8}"
+          + "".join(f"{f'{w}x{h}':>10}" for w, h in sizes))
+    with tempfile.TemporaryDirectory() as directory:
+        for u_steps, v_steps in TESSELLATIONS:
+            path = os.path.join(directory, "knot.obj")
+            write_obj(Mesh.from_surface(TREFOIL, u_steps, v_steps, tube=0.6), path)
+            start = time.perf_counter()
+            mesh = load_obj(path).normalized(radius=2.8)
+            load = time.perf_counter() - start
+
+            for shading in ("flat", "gouraud"):
+                times = [measure(mesh, width, height, frames, shading, theme_manager)
+                         for width, height in sizes]
+                print(f"  {len(mesh.faces):9d} {load * 1000:6.1f} ms {shading:<8}"
+                      + "".join(f"{t * 1000:10.2f}" for t in times))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Noise Microbenchmark
+Compares animations/utils/noise.py against the per-animation noise
+implementations it replaced. The legacy versions are kept below (comments
+stripped, otherwise unchanged) so the comparison stays reproducible.
+
+Usage:
+    python benchmarks/bench_noise.py [grid_size] [repeats]
+"""
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from animations.utils import noise
+
+
+# ============================================================================
+# Legacy: ss_clouds (IQ sin-hash value noise)
+# ============================================================================
+
+def _clouds_hash(n):
+    x = np.sin(n) * 753.5453123
+    return x - np.floor(x)
+
+
+def _mix(a, b, t):
+    return a * (1.0 - t) + b * t
+
+
+def clouds_noise(x, y, z):
+    px, py, pz = np.floor(x), np.floor(y), np.floor(z)
+    fx, fy, fz = x - px, y - py, z - pz
+    fx = fx * fx * (3.0 - 2.0 * fx)
+    fy = fy * fy * (3.0 - 2.0 * fy)
+    fz = fz * fz * (3.0 - 2.0 * fz)
+    n = px + py * 157.0 + pz * 113.0
+    h00 = _mix(_clouds_hash(n), _clouds_hash(n + 1.0), fx)
+    h10 = _mix(_clouds_hash(n + 157.0), _clouds_hash(n + 158.0), fx)
+    h01 = _mix(_clouds_hash(n + 113.0), _clouds_hash(n + 114.0), fx)
+    h11 = _mix(_clouds_hash(n + 270.0), _clouds_hash(n + 271.0), fx)
+    return _mix(_mix(h00, h10, fy), _mix(h01, h11, fy), fz)
+
+
+def clouds_fbm(x, y, z, octaves=5, lacunarity=2.0276):
+    value = np.zeros_like(x)
+    amplitude, freq = 0.5, 1.0
+    for _ in range(octaves):
+        value = value + amplitude * clouds_noise(x * freq, y * freq, z * freq)
+        freq *= lacunarity
+        amplitude *= 0.5
+    return value
+
+
+# ============================================================================
+# Legacy: ss_isovalues (dot-product sin-hash value noise)
+# ============================================================================
+
+def _iso_hash(px, py, pz):
+    x = np.sin(1e3 * (px + 57.0 * py - 13.7 * pz)) * 4375.5453
+    return x - np.floor(x)
+
+
+def iso_noise3(x, y, z):
+    px, py, pz = np.floor(x), np.floor(y), np.floor(z)
+    fx, fy, fz = x - px, y - py, z - pz
+    fx = fx * fx * (3.0 - 2.0 * fx)
+    fy = fy * fy * (3.0 - 2.0 * fy)
+    fz = fz * fz * (3.0 - 2.0 * fz)
+    h00 = _mix(_iso_hash(px, py, pz), _iso_hash(px + 1, py, pz), fx)
+    h10 = _mix(_iso_hash(px, py + 1, pz), _iso_hash(px + 1, py + 1, pz), fx)
+    h01 = _mix(_iso_hash(px, py, pz + 1), _iso_hash(px + 1, py, pz + 1), fx)
+    h11 = _mix(_iso_hash(px, py + 1, pz + 1), _iso_hash(px + 1, py + 1, pz + 1), fx)
+    return _mix(_mix(h00, h10, fy), _mix(h01, h11, fy), fz)
+
+
+# ============================================================================
+# Legacy: ss_warp (2D sin-hash value noise)
+# ============================================================================
+
+def _warp_hash(x, y):
+    n = (np.floor(x) + np.floor(y) * 57).astype(int)
+    n = (n << 13) ^ n
+    return np.sin(x * 12.9898 + y * 78.233) * 43758.5453 % 1.0
+
+
+def warp_smooth_noise(x, y):
+    ix, iy = np.floor(x), np.floor(y)
+    fx, fy = x - ix, y - iy
+    u = fx * fx * (3.0 - 2.0 * fx)
+    v = fy * fy * (3.0 - 2.0 * fy)
+    a = _warp_hash(ix, iy)
+    b = _warp_hash(ix + 1, iy)
+    c = _warp_hash(ix, iy + 1)
+    d = _warp_hash(ix + 1, iy + 1)
+    return a + (b - a) * u + (c - a) * v + (a - b - c + d) * u * v
+
+
+def warp_fbm(x, y):
+    val, amp, scale = 0.0, 0.5, 1.0
+    for _ in range(4):
+        val += amp * warp_smooth_noise(x * scale, y * scale)
+        amp *= 0.5
+        scale *= 2.0
+    return val
+
+
+# ============================================================================
+# Legacy: terrain.py (pure-Python Perlin)
+# ============================================================================
+
+class LegacyPerlin:
+    def __init__(self):
+        self.p = [int(v) for v in noise.PERM]
+
+    def fade(self, t):
+        return t * t * t * (t * (t * 6 - 15) + 10)
+
+    def lerp(self, a, b, t):
+        return a + t * (b - a)
+
+    def grad(self, h, x, y):
+        h &= 3
+        return (x if h in (0, 2) else -x) + (y if h in (0, 1) else -y)
+
+    def noise2d(self, x, y):
+        X = int(np.floor(x)) & 255
+        Y = int(np.floor(y)) & 255
+        x -= np.floor(x)
+        y -= np.floor(y)
+        u, v = self.fade(x), self.fade(y)
+        p = self.p
+        A, B = p[X] + Y, p[X + 1] + Y
+        return self.lerp(
+            self.lerp(self.grad(p[A], x, y), self.grad(p[B], x - 1, y), u),
+            self.lerp(self.grad(p[A + 1], x, y - 1), self.grad(p[B + 1], x - 1, y - 1), u),
+            v)
+
+    def octave_noise(self, x, y, octaves=4):
+        total, amplitude, frequency, max_value = 0, 1, 1, 0
+        for _ in range(octaves):
+            total += self.noise2d(x * frequency, y * frequency) * amplitude
+            max_value += amplitude
+            amplitude *= 0.5
+            frequency *= 2
+        return total / max_value
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def bench(label, old, new, repeats):
+    t_old = min(timeit.repeat(old, number=1, repeat=repeats))
+    t_new = min(timeit.repeat(new, number=1, repeat=repeats))
+    print(f"  {label:<36} {t_old * 1000:9.2f} ms {t_new * 1000:9.2f} ms {t_old / t_new:7.1f}x")
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 320
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    rng = np.random.default_rng(0)
+    x = rng.uniform(-8, 8, (size // 2, size))
+    y = rng.uniform(-8, 8, (size // 2, size))
+    z = rng.uniform(-8, 8, (size // 2, size))
+
+    print(f"Noise microbenchmark ({x.shape[0]}x{x.shape[1]} grid, best of {repeats})")
+    print(f"  {'case':<36} {'legacy':>12} {'library':>12} {'speedup':>8}")
+
+    bench("clouds: 3D value noise", lambda: clouds_noise(x, y, z),
+          lambda: noise.value3(x, y, z), repeats)
+    bench("clouds: 5-octave 3D fBm", lambda: clouds_fbm(x, y, z),
+          lambda: noise.fbm(x, y, z, octaves=5, lacunarity=2.0276), repeats)
+    bench("isovalues: 3D value noise", lambda: iso_noise3(x, y, z),
+          lambda: noise.value3(x, y, z), repeats)
+    bench("warp: 2D value noise", lambda: warp_smooth_noise(x, y),
+          lambda: noise.value2(x, y), repeats)
+    bench("warp: 4-octave 2D fBm", lambda: warp_fbm(x, y),
+          lambda: noise.fbm(x, y), repeats)
+
+    volume = noise.fbm_volume(octaves=5)
+    bench("clouds terrain: fBm vs baked volume", lambda: clouds_fbm(x, y, z),
+          lambda: volume.sample(x, y, z), repeats)
+
+    # The terrain grid is small; the legacy version is per-sample Python
+    tx, ty = x[:25, :40], y[:25, :40]
+    legacy = LegacyPerlin()
+    bench("terrain: 4-octave Perlin (40x25)",
+          lambda: [[legacy.octave_noise(a, b) for a, b in zip(rx, ry)] for rx, ry in zip(tx, ty)],
+          lambda: noise.fbm(tx, ty, noise=noise.perlin2, amplitude=1.0), repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+SDF Raymarch Benchmark
+Compares the raymarch animation on the SDF scene library (a shader over the
+whole grid) with the per-pixel renderer it replaced. The legacy version is
+kept below (comments stripped, otherwise unchanged) so the comparison stays
+reproducible.
+
+Reports rays per second for both. The legacy renderer traces one ray per
+terminal cell, the shader one per block-mode pixel (two per cell).
+
+Usage:
+    python benchmarks/bench_sdf.py [frames] [sizes...]   (sizes as WxH)
+"""
+
+import math
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import numpy as np
+
+from shader_engine import SHADER_DTYPE, build_uv_grid
+from animations.raymarch import shader_raymarch
+
+SIZES = [(80, 24), (160, 45), (320, 90)]
+
+
+# ============================================================================
+# Legacy: animations/raymarch.py (tuple SDFs, one ray at a time)
+# ============================================================================
+
+def _normalize(v):
+    length = math.sqrt(v[0]**2 + v[1]**2 + v[2]**2)
+    if length == 0:
+        return (0, 0, 0)
+    return (v[0]/length, v[1]/length, v[2]/length)
+
+
+def _sdf_sphere(point, center, radius):
+    dx = point[0] - center[0]
+    dy = point[1] - center[1]
+    dz = point[2] - center[2]
+    return math.sqrt(dx*dx + dy*dy + dz*dz) - radius
+
+
+def _sdf_box(point, center, size):
+    dx = abs(point[0] - center[0]) - size[0]
+    dy = abs(point[1] - center[1]) - size[1]
+    dz = abs(point[2] - center[2]) - size[2]
+    outside = math.sqrt(max(dx, 0)**2 + max(dy, 0)**2 + max(dz, 0)**2)
+    inside = min(max(dx, dy, dz), 0)
+    return outside + inside
+
+
+def _sdf_smooth_union(d1, d2, k=0.5):
+    h = max(k - abs(d1 - d2), 0) / k
+    return min(d1, d2) - h*h*k*0.25
+
+
+def _estimate_normal(point, scene_sdf, epsilon=0.001):
+    dx = scene_sdf((point[0] + epsilon, point[1], point[2])) - \
+         scene_sdf((point[0] - epsilon, point[1], point[2]))
+    dy = scene_sdf((point[0], point[1] + epsilon, point[2])) - \
+         scene_sdf((point[0], point[1] - epsilon, point[2]))
+    dz = scene_sdf((point[0], point[1], point[2] + epsilon)) - \
+         scene_sdf((point[0], point[1], point[2] - epsilon))
+    return _normalize((dx, dy, dz))
+
+
+def _raymarch(origin, direction, scene_sdf, max_steps=64, max_dist=20, epsilon=0.01):
+    total_distance = 0
+    for step in range(max_steps):
+        point = (origin[0] + direction[0] * total_distance,
+                 origin[1] + direction[1] * total_distance,
+                 origin[2] + direction[2] * total_distance)
+        distance = scene_sdf(point)
+        if distance < epsilon:
+            return (True, total_distance, step)
+        total_distance += distance
+        if total_distance > max_dist:
+            break
+    return (False, total_distance, max_steps)
+
+
+def legacy_frame(width, height, time):
+    camera_pos = (0, 0, -5)
+    light_pos = (3 * math.sin(time * 0.5), 2, 3 * math.cos(time * 0.5) - 3)
+    cube_center = (0.5 * math.sin(time * 0.7), 0.5 * math.cos(time * 0.6),
+                   0.5 * math.sin(time * 0.8))
+    sphere2_center = (1.5 * math.sin(time * 0.4), 0, 1.5 * math.cos(time * 0.4))
+
+    def scene_sdf(point):
+        d_main = max(_sdf_sphere(point, (0, 0, 0), 1.5), -_sdf_box(point, cube_center, (0.8, 0.8, 0.8)))
+        return _sdf_smooth_union(d_main, _sdf_sphere(point, sphere2_center, 0.6), 0.5)
+
+    intensity = [[0.0] * width for _ in range(height - 1)]
+    for py in range(height - 1):
+        for px in range(width):
+            aspect = (width / 2) / height
+            ray_dir = _normalize(((px / width * 2 - 1) * aspect, -(py / height * 2 - 1), 1))
+            hit, dist, steps = _raymarch(camera_pos, ray_dir, scene_sdf)
+            if hit:
+                hit_point = tuple(c + d * dist for c, d in zip(camera_pos, ray_dir))
+                normal = _estimate_normal(hit_point, scene_sdf)
+                to_light = _normalize(tuple(l - h for l, h in zip(light_pos, hit_point)))
+                diffuse = max(0, sum(n * l for n, l in zip(normal, to_light)))
+                intensity[py][px] = diffuse * 0.8 + (1 - steps / 64) * 0.2
+    return intensity
+
+
+# ============================================================================
+# Runner
+# ============================================================================
+
+def main():
+    frames = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    sizes = [tuple(int(n) for n in s.split("x")) for s in sys.argv[2:]] or SIZES
+    np.seterr(all="ignore")
+
+    print(f"SDF raymarch benchmark ({frames} frames per size)")
+    print(f"  {'size':<10} {'legacy':>14} {'sdf shader':>14} {'speedup':>8}")
+    for width, height in sizes:
+        start = time.perf_counter()
+        legacy_frame(width, height, 2.0)
+        legacy_rate = width * (height - 1) / (time.perf_counter() - start)
+
+        u, v = build_uv_grid(width, height, use_braille=False, dtype=SHADER_DTYPE)
+        shader_raymarch(u, v, 2.0)  # Warm up
+        start = time.perf_counter()
+        for i in range(frames):
+            shader_raymarch(u, v, 2.0 + 0.05 * i)
+        shader_rate = u.size * frames / (time.perf_counter() - start)
+
+        print(f"  {width}x{height:<7} {legacy_rate:10.0f} r/s {shader_rate:10.0f} r/s "
+              f"{shader_rate / legacy_rate:7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
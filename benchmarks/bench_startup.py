@@ -0,0 +1,95 @@
+"""
+Startup Benchmark
+Measures how long it takes until the main menu can draw.
+
+Each run starts a fresh interpreter with `-X importtime`, imports `main`
+(which pulls in the engine, colors and the animation registries) and
+reports the wall-clock time plus the slowest imports. It also checks that
+NumPy stays unloaded until a shader-based animation is selected.
+
+Usage:
+    python benchmarks/bench_startup.py [runs]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Imports main, then reports menu-ready latency and whether NumPy was loaded.
+# Optionally resolves one animation to show the cost of a lazy load.
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import main
+ready = time.perf_counter() - start
+numpy_at_menu = 'numpy' in sys.modules
+from animations import load_render, ANIMATIONS, SCREENSAVERS_REGULAR
+start = time.perf_counter()
+load_render(ANIMATIONS['torus'])
+classic = time.perf_counter() - start
+numpy_after_classic = 'numpy' in sys.modules
+start = time.perf_counter()
+load_render(SCREENSAVERS_REGULAR['mandelbulb'])
+shader = time.perf_counter() - start
+print(ready, classic, shader, numpy_at_menu, numpy_after_classic)
+"""
+
+
+def run_probe():
+    """Run one cold-start probe. Returns (timings, flags, importtime lines)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    fields = result.stdout.split()
+    timings = [float(f) for f in fields[:3]]
+    flags = [f == "True" for f in fields[3:5]]
+    return timings, flags, result.stderr.splitlines()
+
+
+def slowest_imports(lines, top=10):
+    """Parse `-X importtime` output into the top cumulative imports."""
+    rows = []
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Format: "import time: <self us> | <cumulative us> | <module>"
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), int(self_us), name.rstrip()))
+    rows.sort(reverse=True)
+    return rows[:top]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    samples = []
+    flags = None
+    lines = []
+    for _ in range(runs):
+        timings, flags, lines = run_probe()
+        samples.append(timings)
+
+    ready, classic, shader = (statistics.median(col) for col in zip(*samples))
+
+    print(f"Startup benchmark ({runs} runs, median)")
+    rows = [
+        ("menu-ready (import main)", f"{ready * 1000:.2f} ms"),
+        ("first classic load (torus)", f"{classic * 1000:.2f} ms"),
+        ("first shader load (mandelbulb)", f"{shader * 1000:.2f} ms"),
+        ("numpy loaded at menu", flags[0]),
+        ("numpy loaded after classic", flags[1]),
+    ]
+    for label, value in rows:
+        print(f"  {label:<32} {value}")
+    print()
+    print("Slowest imports (last run, cumulative us):")
+    for cumulative, self_us, name in slowest_imports(lines):
+        print(f"  {cumulative:>9}  {self_us:>9}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -221,7 +221,10 @@ def get_terminal_size():
 
 
 def rotate_x(point, angle):
-    """Rotate a 3D point around the X axis."""
+    """
+    Rotate a 3D point around the X axis.
+    For arrays of points use geometry.Transform (one matrix per frame).
+    """
     x, y, z = point
     cos_a = math.cos(angle)
     sin_a = math.sin(angle)
@@ -250,6 +253,7 @@ def project_point(x, y, z, width, height, scale=None, distance=5):
     Uses perspective projection with proper aspect ratio correction.
     
     Returns (screen_x, screen_y) or None if behind camera.
+    geometry.project_points is the batched version.
     """
     # Improved scaling: use normalized coordinates approach
     if scale is None:
@@ -365,13 +369,21 @@ class AnimationEngine:
         self.show_stats = not self.show_stats
         return self.show_stats
     
-    def run_animation(self, render_func, animation_name="Animation"):
+    def run_animation(self, render_func, animation_name="Animation", stateless=False):
         """
         Main animation loop.
         
         render_func should be a function that takes:
             (buffer, width, height, time, theme_manager) -> (z_min, z_max)
+        
+        stateless marks shader animations whose frames are a pure function of
+        time; those are rendered a few frames ahead in worker processes.
         """
+        if stateless:
+            # Imported here so classic animations never pull in NumPy
+            import shader_engine
+            shader_engine.enable_frame_pipeline()
+        
         self.running = True
         self.time = 0
         self.frame_count = 0
@@ -430,6 +442,8 @@ class AnimationEngine:
                     time.sleep(sleep_time)
         
         finally:
+            if stateless:
+                shader_engine.disable_frame_pipeline()
             show_cursor()
             clear_screen()
     
@@ -507,31 +521,3 @@ def dot_product(v1, v2):
     """Calculate dot product of two 3D vectors."""
     return v1[0]*v2[0] + v1[1]*v2[1] + v1[2]*v2[2]
 
-
-# SDF (Signed Distance Field) functions for raymarching
-def sdf_sphere(point, center, radius):
-    """Signed distance to a sphere."""
-    return distance_3d(point, center) - radius
-
-
-def sdf_box(point, center, size):
-    """Signed distance to a box."""
-    dx = abs(point[0] - center[0]) - size[0]
-    dy = abs(point[1] - center[1]) - size[1]
-    dz = abs(point[2] - center[2]) - size[2]
-    return max(dx, dy, dz)
-
-
-def sdf_union(d1, d2):
-    """Union of two SDFs."""
-    return min(d1, d2)
-
-
-def sdf_intersection(d1, d2):
-    """Intersection of two SDFs."""
-    return max(d1, d2)
-
-
-def sdf_difference(d1, d2):
-    """Difference of two SDFs (d1 - d2)."""
-    return max(d1, -d2)
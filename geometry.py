@@ -0,0 +1,505 @@
+"""
+Batched 3D Geometry
+NumPy counterparts of engine.py's per-point helpers for the classic 3D
+animations: parametric surfaces and curves sampled over cached parameter
+grids, affine transforms composed into one 3x4 matrix per frame,
+perspective projection of whole point arrays, depth shading, and a
+depth-tested scatter that writes the results into a ScreenBuffer.
+
+engine.py keeps its tuple helpers (rotate_x, project_point, ...) for code
+that handles a few points at a time. They follow the same conventions, and
+engine.py stays free of NumPy so the menu starts without loading it.
+"""
+
+import functools
+import math
+
+import numpy as np
+
+
+# ============================================================================
+# Parametric Geometry
+# ============================================================================
+
+# Adaptive tessellation targets: samples per screen cell along a surface's
+# longest u and v lines, and screen cells between consecutive curve samples
+SAMPLES_PER_CELL = 2.0
+CURVE_SPACING = 2.0
+
+# Samples the on-screen lengths are measured with (per surface axis / curve)
+SURFACE_PROBE = 24
+CURVE_PROBE = 512
+
+
+@functools.lru_cache(maxsize=64)
+def parameter_axis(start, stop, steps, endpoint=False):
+    """
+    Read-only array of steps parameter values from start towards stop
+    (start + (stop - start) * i / steps, or / (steps - 1) with endpoint).
+    Cached, so a surface's grid is built once, not every frame.
+    """
+    axis = start + (stop - start) * np.arange(steps) / max(steps - 1 if endpoint else steps, 1)
+    axis.flags.writeable = False
+    return axis
+
+
+def _stack_xyz(components):
+    """(x, y, z) arrays that broadcast together -> (N, 3) points."""
+    return np.stack(np.broadcast_arrays(*components), axis=-1).reshape(-1, 3)
+
+
+def _screen_lengths(components, transform, width, height, distance):
+    """
+    On-screen length, in cells, of each step along the last parameter axis
+    of the (x, y, z) arrays; steps with an end behind the camera count 0.
+    """
+    points = transform.apply(np.stack(np.broadcast_arrays(*components), axis=-1))
+    screen_x, screen_y, _, valid = screen_coordinates(points, width, height, distance=distance)
+    lengths = np.hypot(np.diff(screen_x, axis=-1), np.diff(screen_y, axis=-1))
+    return np.where(valid[..., 1:] & valid[..., :-1], lengths, 0.0)
+
+
+def _steps_for(length, samples_per_cell, limits):
+    """Sample count for an on-screen length, clamped to limits."""
+    low, high = limits
+    return int(min(max(math.ceil(length * samples_per_cell), low), high))
+
+
+class ParametricSurface:
+    """
+    Surface declared as NumPy expressions over a (u, v) parameter grid.
+
+    position(u, v, **params) returns the x, y and z arrays for a u column
+    against a v row; normal(u, v, **params), if given, returns the normal
+    components the same way. Samples are flattened row by row (u major), the
+    order the old nested loops visited them in.
+    """
+
+    def __init__(self, position, u_range, v_range, normal=None, u_endpoint=False, v_endpoint=False):
+        self.position = position
+        self.normal = normal
+        self.u_range = u_range
+        self.v_range = v_range
+        self.u_endpoint = u_endpoint
+        self.v_endpoint = v_endpoint
+
+    def grid(self, u_steps, v_steps):
+        """The (u column, v row) parameter grid."""
+        u = parameter_axis(*self.u_range, u_steps, self.u_endpoint)
+        v = parameter_axis(*self.v_range, v_steps, self.v_endpoint)
+        return u[:, np.newaxis], v
+
+    def sample(self, u_steps, v_steps, **params):
+        """(N, 3) points and (N, 3) normals (None without a normal function)."""
+        u, v = self.grid(u_steps, v_steps)
+        points = _stack_xyz(self.position(u, v, **params))
+        normals = None if self.normal is None else _stack_xyz(self.normal(u, v, **params))
+        return points, normals
+
+    def screen_steps(self, transform, width, height, distance=5, samples_per_cell=SAMPLES_PER_CELL,
+                     limits=(8, 1024), **params):
+        """
+        (u_steps, v_steps) for about samples_per_cell samples per screen
+        cell along the longest u and v lines, measured on a coarse probe
+        grid under this frame's transform. Work then follows the on-screen
+        size instead of being fixed.
+        """
+        u = np.linspace(*self.u_range, SURFACE_PROBE + 1)
+        v = np.linspace(*self.v_range, SURFACE_PROBE + 1)
+        components = self.position(u[:, np.newaxis], v, **params)
+        u_length = _screen_lengths([np.swapaxes(np.broadcast_to(c, (len(u), len(v))), 0, 1)
+                                    for c in components], transform, width, height, distance)
+        v_length = _screen_lengths(components, transform, width, height, distance)
+        return (_steps_for(u_length.sum(axis=-1).max(), samples_per_cell, limits),
+                _steps_for(v_length.sum(axis=-1).max(), samples_per_cell, limits))
+
+
+class ParametricCurve:
+    """Curve declared as NumPy expressions position(t, **params) -> x, y, z."""
+
+    def __init__(self, position, t_range, endpoint=True):
+        self.position = position
+        self.t_range = t_range
+        self.endpoint = endpoint
+
+    def evaluate(self, t, **params):
+        """Points at the parameter values t, shaped (..., len(t), 3)."""
+        return np.stack(np.broadcast_arrays(*self.position(t, **params)), axis=-1)
+
+    def sample(self, steps, **params):
+        """(steps, 3) points along the curve."""
+        t = parameter_axis(*self.t_range, steps, self.endpoint)
+        return _stack_xyz(self.position(t, **params))
+
+    def sample_adaptive(self, transform, width, height, distance=5, spacing=CURVE_SPACING,
+                        limits=(16, 2048), **params):
+        """
+        Points spaced about spacing cells apart on screen under this frame's
+        transform: the curve is probed, and the parameter re-spaced by its
+        on-screen arc length, so tight turns and near parts get more samples
+        and the count follows the curve's on-screen length.
+
+        Parameters may add leading axes for several curves at once (the
+        curve parameter is the last axis); all share the sample count of
+        the longest one. Returns (N, 3) model-space points, curve by curve.
+        """
+        t_probe = np.linspace(*self.t_range, CURVE_PROBE)
+        lengths = _screen_lengths(self.position(t_probe, **params), transform, width, height, distance)
+
+        # Cumulative arc length (with a tiny floor so it is strictly increasing)
+        arc = np.cumsum(lengths + 1e-9, axis=-1)
+        arc = np.concatenate([np.zeros(arc.shape[:-1] + (1,)), arc], axis=-1)
+        steps = _steps_for(arc[..., -1].max() / spacing, 1.0, limits)
+
+        rows = arc.reshape(-1, CURVE_PROBE)
+        t = np.array([np.interp(np.linspace(0.0, row[-1], steps), row, t_probe) for row in rows])
+        t = t.reshape(arc.shape[:-1] + (steps,))
+        return _stack_xyz(self.position(t, **params))
+
+
+# ============================================================================
+# Transforms
+# ============================================================================
+
+class Transform:
+    """
+    Affine transform stored as a 3x4 matrix [linear | offset].
+
+    Methods return a new transform with the step appended, so
+    Transform().rotate_x(a).rotate_z(b) rotates about x first, like
+    rotate_z(rotate_x(p, a), b) with the engine helpers. A frame builds its
+    transform once and applies it to every point in one matmul.
+    """
+
+    __slots__ = ("matrix",)
+
+    def __init__(self, matrix=None):
+        self.matrix = np.eye(3, 4) if matrix is None else np.asarray(matrix, dtype=np.float64)
+
+    @property
+    def linear(self):
+        return self.matrix[:, :3]
+
+    @property
+    def offset(self):
+        return self.matrix[:, 3]
+
+    def then(self, other):
+        """This transform followed by other."""
+        matrix = other.linear @ self.matrix
+        matrix[:, 3] += other.offset
+        return Transform(matrix)
+
+    # Steps
+    def rotate_x(self, angle):
+        c, s = math.cos(angle), math.sin(angle)
+        return self.then(Transform([[1, 0, 0, 0], [0, c, -s, 0], [0, s, c, 0]]))
+
+    def rotate_y(self, angle):
+        c, s = math.cos(angle), math.sin(angle)
+        return self.then(Transform([[c, 0, s, 0], [0, 1, 0, 0], [-s, 0, c, 0]]))
+
+    def rotate_z(self, angle):
+        c, s = math.cos(angle), math.sin(angle)
+        return self.then(Transform([[c, -s, 0, 0], [s, c, 0, 0], [0, 0, 1, 0]]))
+
+    def scale(self, sx, sy=None, sz=None):
+        sy = sx if sy is None else sy
+        sz = sx if sz is None else sz
+        return self.then(Transform([[sx, 0, 0, 0], [0, sy, 0, 0], [0, 0, sz, 0]]))
+
+    def translate(self, dx, dy, dz):
+        return self.then(Transform([[1, 0, 0, dx], [0, 1, 0, dy], [0, 0, 1, dz]]))
+
+    # Application
+    def apply(self, points):
+        """Transform (..., 3) points."""
+        return points @ self.linear.T + self.offset
+
+    def apply_vectors(self, vectors):
+        """Transform (..., 3) directions (no translation)."""
+        return vectors @ self.linear.T
+
+    def apply_normals(self, normals):
+        """Transform (..., 3) surface normals (inverse transpose), unit length."""
+        normals = normals @ np.linalg.inv(self.linear)
+        length = np.sqrt(np.einsum("...i,...i->...", normals, normals))[..., np.newaxis]
+        return normals / np.maximum(length, 1e-12)
+
+    def apply_point(self, point):
+        """Transform one (x, y, z) tuple."""
+        x, y, z = point
+        return tuple(row[0] * x + row[1] * y + row[2] * z + row[3] for row in self.matrix.tolist())
+
+
+# ============================================================================
+# Projection
+# ============================================================================
+
+def default_scale(width, height):
+    """Projection scale used by engine.project_point when none is given."""
+    return min(width, height * 2) * 0.3
+
+
+def project_points(points, width, height, scale=None, distance=5):
+    """
+    Perspective projection of (..., 3) points, as engine.project_point.
+
+    Returns:
+        (screen_x, screen_y, depth, valid): integer screen coordinates
+        (truncated like int()), the z depth of each point and a mask of the
+        points in front of the camera. Coordinates of invalid points are
+        meaningless; on-screen bounds are left to the caller.
+    """
+    screen_x, screen_y, z, valid = screen_coordinates(points, width, height, scale, distance)
+    return screen_x.astype(np.intp), screen_y.astype(np.intp), z, valid
+
+
+def screen_coordinates(points, width, height, scale=None, distance=5):
+    """project_points without the truncation to whole cells."""
+    if scale is None:
+        scale = default_scale(width, height)
+    x, y, z = points[..., 0], points[..., 1], points[..., 2]
+    depth = z + distance
+    valid = depth > 0.1
+    factor = scale / np.where(valid, depth, 1.0)
+
+    # Aspect ratio correction: characters are ~2x taller than wide
+    screen_x = x * factor * 2 + width / 2
+    screen_y = y * factor + height / 2
+    return screen_x, screen_y, z, valid
+
+
+def facing_camera(points, normals, distance=5):
+    """Back-face test: normals pointing towards the camera at z = -distance."""
+    view = points.copy()
+    view[:, 2] += distance
+    return np.einsum("ij,ij->i", normals, view) < 0
+
+
+# ============================================================================
+# Shading
+# ============================================================================
+
+def ramp_index(values, levels):
+    """Map [0, 1] values to indices into a levels-long character ramp."""
+    return np.clip((values * (levels - 1)).astype(np.intp), 0, levels - 1)
+
+
+def depth_index(z, z_min, z_max, levels):
+    """
+    Vectorised ThemeManager.get_color_for_depth / get_char_for_depth index:
+    lower z (closer) maps to higher indices.
+    """
+    if z_max == z_min:
+        normalized = np.full(np.shape(z), 0.5)
+    else:
+        normalized = np.clip(1.0 - (z - z_min) / (z_max - z_min), 0.0, 1.0)
+    return (normalized * (levels - 1)).astype(np.intp)
+
+
+def palette(values):
+    """Object array of strings (chars or color codes) for fancy indexing."""
+    return np.array(list(values), dtype=object)
+
+
+def depth_colors(theme_manager, z, z_min, z_max):
+    """Theme gradient colors for an array of depths."""
+    gradient = theme_manager.gradient
+    return palette(gradient)[depth_index(z, z_min, z_max, len(gradient))]
+
+
+def depth_chars(z, z_min, z_max, chars):
+    """Depth ramp characters for an array of depths."""
+    return palette(chars)[depth_index(z, z_min, z_max, len(chars))]
+
+
+# ============================================================================
+# Scatter
+# ============================================================================
+
+def _per_point(values, pick):
+    """Python list of the picked entries of values, or of one shared value."""
+    if isinstance(values, np.ndarray) and values.ndim:
+        return values[pick].tolist()
+    return [values] * len(pick)
+
+
+def scatter(buffer, screen_x, screen_y, depth, chars, colors=None, intensity=1.0):
+    """
+    Depth-tested batch of ScreenBuffer.set_pixel calls.
+
+    chars, colors and intensity are either one value or an array per point.
+    Points are reduced to the nearest one per cell in NumPy (ties go to the
+    earlier point, as with sequential set_pixel calls); only those winners
+    are written, with the usual z test against what the buffer holds.
+
+    Returns:
+        The number of cells written.
+    """
+    width, height = buffer.width, buffer.height
+    screen_x = np.ravel(screen_x)
+    screen_y = np.ravel(screen_y)
+    depth = np.ravel(depth)
+    on_screen = (screen_x >= 0) & (screen_x < width) & (screen_y >= 0) & (screen_y < height)
+    index = np.flatnonzero(on_screen)
+    if not len(index):
+        return 0
+
+    # Nearest depth per cell, then the earliest point holding it
+    cell = screen_y[index] * width + screen_x[index]
+    z = depth[index]
+    nearest = np.full(width * height, np.inf)
+    np.minimum.at(nearest, cell, z)
+    closest = np.flatnonzero(z == nearest[cell])
+    cells, first = np.unique(cell[closest], return_index=True)
+    pick = index[closest[first]]
+
+    z_buffer, cell_chars, cell_colors = buffer.z_buffer, buffer.chars, buffer.colors
+    cell_intensity = buffer.intensity
+    rows, cols = np.divmod(cells, width)
+    written = 0
+    for y, x, z, char, color, level in zip(rows.tolist(), cols.tolist(), depth[pick].tolist(),
+                                           _per_point(chars, pick), _per_point(colors, pick),
+                                           _per_point(intensity, pick)):
+        if z < z_buffer[y][x]:
+            cell_chars[y][x] = char
+            z_buffer[y][x] = z
+            cell_colors[y][x] = color
+            cell_intensity[y][x] = level
+            written += 1
+    return written
+
+
+def scatter_glow(buffer, screen_x, screen_y, depth, colors, glow_radius=1):
+    """
+    Halos of ScreenBuffer.set_pixel_with_glow around already drawn points.
+
+    As there, a halo cell is only written if it is empty or holds a dimmer
+    halo; overlapping halos keep the brightest.
+    """
+    glow_chars = ".:·"
+    width, height = buffer.width, buffer.height
+    screen_x = np.asarray(screen_x)
+    screen_y = np.asarray(screen_y)
+    depth = np.asarray(depth, dtype=np.float64)
+    count = len(screen_x)
+
+    xs, ys, owners, levels = [], [], [], []
+    for dy in range(-glow_radius, glow_radius + 1):
+        for dx in range(-glow_radius, glow_radius + 1):
+            dist_sq = dx * dx + dy * dy
+            if dist_sq == 0 or dist_sq > glow_radius * glow_radius:
+                continue
+            xs.append(screen_x + dx)
+            ys.append(screen_y + dy)
+            owners.append(np.arange(count))
+            levels.append(np.full(count, 1.0 / (dist_sq + 1)))
+    if not xs or not count:
+        return
+    x, y = np.concatenate(xs), np.concatenate(ys)
+    owner, level = np.concatenate(owners), np.concatenate(levels)
+    keep = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+    x, y, owner, level = x[keep], y[keep], owner[keep], level[keep]
+
+    # Brightest halo per cell
+    cell = y * width + x
+    order = np.lexsort((-level, cell))
+    cell, owner, level = cell[order], owner[order], level[order]
+    first = np.ones(len(cell), dtype=bool)
+    first[1:] = cell[1:] != cell[:-1]
+
+    rows, cols = np.divmod(cell[first], width)
+    glow_z = (depth[owner[first]] + 0.1).tolist()
+    for y, x, z, color, glow in zip(rows.tolist(), cols.tolist(), glow_z,
+                                    _per_point(colors, owner[first]), level[first].tolist()):
+        if buffer.chars[y][x] == ' ' or buffer.intensity[y][x] < glow:
+            buffer.chars[y][x] = glow_chars[min(len(glow_chars) - 1, int((1 - glow) * len(glow_chars)))]
+            buffer.z_buffer[y][x] = z
+            buffer.colors[y][x] = color
+            buffer.intensity[y][x] = glow
+
+
+# ============================================================================
+# Segments
+# ============================================================================
+
+def segment_samples(x0, y0, x1, y1, density=1.0):
+    """
+    Evenly spaced samples along screen-space segments, endpoints included:
+    int(length * density) steps per segment, length being the larger of
+    |dx| and |dy| (at least 1).
+
+    Returns:
+        (x, y, owner): float sample positions and the segment index of each.
+    """
+    x0, y0, x1, y1 = (np.asarray(a, dtype=np.float64) for a in (x0, y0, x1, y1))
+    dx, dy = x1 - x0, y1 - y0
+    length = np.maximum(np.maximum(np.abs(dx), np.abs(dy)), 1.0)
+    steps = np.maximum((length * density).astype(np.intp), 1)
+    counts = steps + 1
+    owner = np.repeat(np.arange(len(x0)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = k / steps[owner]
+    return x0[owner] + dx[owner] * t, y0[owner] + dy[owner] * t, owner
+
+
+def polyline_segments(screen_x, screen_y, depth, valid):
+    """
+    Segments joining consecutive points of projected (strips, n) polylines,
+    kept where both ends are in front of the camera.
+
+    Returns:
+        (x0, y0, x1, y1, z, start): endpoints, average depth and the flat
+        index of each segment's first point.
+    """
+    keep = valid[:, :-1] & valid[:, 1:]
+    start = np.flatnonzero(keep.reshape(-1))
+    start += start // (valid.shape[1] - 1)  # Segment index -> point index
+    x, y, z = screen_x.reshape(-1), screen_y.reshape(-1), depth.reshape(-1)
+    return x[start], y[start], x[start + 1], y[start + 1], (z[start] + z[start + 1]) / 2, start
+
+
+def draw_segments(buffer, x0, y0, x1, y1, depth, chars, colors=None, thickness=1):
+    """
+    Batched ScreenBuffer.draw_thick_line over integer screen segments.
+
+    depth, chars, colors and thickness are one value or an array per
+    segment. Thickness 2 adds a copy one cell right, 3 also one below and
+    diagonally, each 0.01 behind, as draw_thick_line does.
+    """
+    x, y, owner = segment_samples(x0, y0, x1, y1)
+    x = np.rint(x).astype(np.intp)
+    y = np.rint(y).astype(np.intp)
+    depth = np.broadcast_to(np.asarray(depth, dtype=np.float64), (len(np.atleast_1d(x0)),))
+    thickness = np.broadcast_to(np.asarray(thickness), depth.shape)[owner]
+
+    xs, ys, owners, zs = [x], [y], [owner], [depth[owner]]
+    for ox, oy, min_thickness in ((1, 0, 2), (0, 1, 3), (1, 1, 3)):
+        extra = thickness >= min_thickness
+        if extra.any():
+            xs.append(x[extra] + ox)
+            ys.append(y[extra] + oy)
+            owners.append(owner[extra])
+            zs.append(depth[owner[extra]] + 0.01)
+    owner = np.concatenate(owners)
+    order = np.argsort(owner, kind="stable")  # Segment by segment, like the loop
+    owner = owner[order]
+    scatter(buffer, np.concatenate(xs)[order], np.concatenate(ys)[order],
+            np.concatenate(zs)[order], _by_owner(chars, owner), _by_owner(colors, owner))
+
+
+def draw_segments_subpixel(buffer, x0, y0, x1, y1, depth, colors=None):
+    """Batched ScreenBuffer.draw_line_subpixel (half-block characters)."""
+    x, y, owner = segment_samples(x0, y0, x1, y1, density=2.0)
+    iy = y.astype(np.intp)
+    chars = np.where(y - iy > 0.5, "▄", "▀").astype(object)
+    scatter(buffer, x.astype(np.intp), iy, _by_owner(np.asarray(depth, dtype=np.float64), owner),
+            chars, _by_owner(colors, owner))
+
+
+def _by_owner(values, owner):
+    """Per-segment values expanded to per-sample values."""
+    if isinstance(values, np.ndarray) and values.ndim:
+        return values[owner]
+    return values
@@ -0,0 +1,140 @@
+"""
+Heightfields
+Height grids for the classic 3D surface animations: a scrolling noise
+heightfield that keeps its rows in a ring buffer and only generates the
+rows a scroll step exposes, and a wave-interference field that folds its
+fixed sources into lookup tables once. Both produce a (rows, columns)
+array per frame that surface_points turns into points for geometry's
+batched pipeline.
+"""
+
+import math
+
+import numpy as np
+
+
+# Grid resolution at an 80x24 terminal; larger screens subdivide each cell
+BASE_SCREEN = (80, 24)
+MAX_DETAIL = 4
+
+
+def grid_detail(width, height, limit=MAX_DETAIL):
+    """
+    Subdivisions per grid cell for a screen size: the smaller of its
+    width and height ratios to BASE_SCREEN, rounded, from 1 to limit.
+    """
+    ratio = min(width / BASE_SCREEN[0], height / BASE_SCREEN[1])
+    return int(min(max(round(ratio), 1), limit))
+
+
+def surface_points(x, heights, z):
+    """
+    (..., 3) points of a heightfield lying flat: heights become the vertical
+    axis, with x and z broadcast against them.
+    """
+    points = np.empty(np.shape(heights) + (3,))
+    points[..., 0] = x
+    points[..., 1] = heights
+    points[..., 2] = z
+    return points
+
+
+# ============================================================================
+# Scrolling Heightfield
+# ============================================================================
+
+class ScrollingHeightfield:
+    """
+    Window of `rows` consecutive lattice rows of a heightfield that scrolls
+    along its rows.
+
+    generate(indices) returns the (len(indices), columns) heights of the
+    given integer row indices. Rows live in a ring buffer slot indices %
+    rows, so moving the window forward (or back) only generates the rows it
+    newly covers; a jump of a whole window regenerates everything.
+    """
+
+    __slots__ = ("rows", "generate", "first", "generated", "_ring")
+
+    def __init__(self, rows, generate):
+        self.rows = rows
+        self.generate = generate
+        self.first = None     # Row index at the start of the window
+        self.generated = 0    # Rows generated so far
+        self._ring = None
+
+    def window(self, first):
+        """Heights of rows first .. first + rows - 1, in order."""
+        first = int(first)
+        if self.first is None or abs(first - self.first) >= self.rows:
+            fresh = np.arange(first, first + self.rows)
+        elif first > self.first:
+            fresh = np.arange(self.first + self.rows, first + self.rows)
+        else:
+            fresh = np.arange(first, self.first)
+
+        if len(fresh):
+            heights = self.generate(fresh)
+            if self._ring is None:
+                self._ring = np.empty((self.rows,) + heights.shape[1:], dtype=heights.dtype)
+            self._ring[fresh % self.rows] = heights
+            self.generated += len(fresh)
+        self.first = first
+
+        start = first % self.rows
+        return np.concatenate((self._ring[start:], self._ring[:start]))
+
+    def scroll(self, offset):
+        """
+        Window for a fractional scroll offset, in rows.
+
+        Returns:
+            (heights, rows): the window starting at the first whole row at or
+            past offset, and each row's position relative to offset (in
+            [0, 1) for the first row, rising by 1 per row). Placing rows at
+            those positions moves the surface smoothly between whole rows.
+        """
+        first = math.ceil(offset)
+        return self.window(first), np.arange(self.rows) + (first - offset)
+
+
+# ============================================================================
+# Wave Interference
+# ============================================================================
+
+class WaveField:
+    """
+    Circular waves on a fixed grid of (x, y) positions: the sum over
+    sources (sx, sy, amplitude, phase) of
+
+        amplitude * sin(distance * frequency - shift + phase)
+
+    Fixed sources share the per-frame shift, so their sum is folded once
+    into a sine and a cosine table (sin(a - s) = sin a cos s - cos a sin s)
+    and costs two multiply-adds per point per frame. Moving sources get a
+    distance grid and a sine each frame.
+    """
+
+    __slots__ = ("x", "y", "frequency", "_sin", "_cos")
+
+    def __init__(self, x, y, frequency, fixed_sources=()):
+        self.x, self.y = np.broadcast_arrays(np.asarray(x, dtype=np.float64),
+                                             np.asarray(y, dtype=np.float64))
+        self.frequency = frequency
+        self._sin = np.zeros(self.x.shape)
+        self._cos = np.zeros(self.x.shape)
+        for sx, sy, amplitude, phase in fixed_sources:
+            angle = self.distance(sx, sy) * frequency + phase
+            self._sin += amplitude * np.sin(angle)
+            self._cos += amplitude * np.cos(angle)
+
+    def distance(self, sx, sy):
+        """Distance grid from (sx, sy)."""
+        return np.hypot(self.x - sx, self.y - sy)
+
+    def heights(self, shift, moving_sources=()):
+        """Summed wave heights for a phase shift, plus any moving sources."""
+        total = self._sin * math.cos(shift) - self._cos * math.sin(shift)
+        for sx, sy, amplitude, phase in moving_sources:
+            total += amplitude * np.sin(self.distance(sx, sy) * self.frequency - shift + phase)
+        return total
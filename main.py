@@ -12,7 +12,7 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from engine import AnimationEngine, check_key, clear_screen, set_title, show_cursor, move_cursor
 from colors import RESET, CYAN, YELLOW, GREEN, MAGENTA, RED, WHITE, BLUE
-from animations import ANIMATIONS, ANIMATION_LIST, SCREENSAVERS_REGULAR, SCREENSAVERS_ULTRAWIDE, TIME_APPS
+from animations import ANIMATIONS, ANIMATION_LIST, SCREENSAVERS_REGULAR, SCREENSAVERS_ULTRAWIDE, TIME_APPS, load_render
 
 
 def print_header():
@@ -155,7 +155,8 @@ def run_animation_from_dict(engine, anim_key, anim_dict):
     # Set recommended theme for this animation
     engine.theme_manager.set_theme(anim.get("recommended_theme", "matrix"))
     
-    engine.run_animation(anim["render"], anim["name"])
+    # Imports the animation module on first selection
+    engine.run_animation(load_render(anim), anim["name"], stateless=anim.get("stateless", False))
 
 
 def handle_selection_screen(engine, title, anim_dict):
@@ -6,7 +6,14 @@ Supports two rendering modes:
   - Braille Mode: Uses Unicode Braille patterns U+2800-U+28FF (2x4 = 8 sub-pixels per cell)
 """
 
+import os
 import sys
+import multiprocessing
+import threading
+from collections import OrderedDict, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
 import numpy as np
 
 # ============================================================================
@@ -38,8 +45,807 @@ BRAILLE_PIXEL_MAP = np.array([
 ], dtype=np.uint8)
 
 
+# ============================================================================
+# Precision Policy
+# ============================================================================
+# Shader output ends up as an 8-bit colour or a 1-bit Braille dot, so the UV
+# grids (and with them nearly every shader temporary) are float32 by
+# default: half the memory traffic of float64 for the same picture. Shaders
+# that need more precision pass dtype=np.float64 to run_shader_animation.
+# The SHADER_DTYPE environment variable changes the default for all others.
+# The precision audit (enable_precision_audit) shows which shaders need it.
+
+SHADER_DTYPE = np.dtype(os.environ.get("SHADER_DTYPE", "float32"))
+
+
+def resolve_dtype(dtype=None):
+    """Compute dtype for a shader: its own override, else the policy default."""
+    return SHADER_DTYPE if dtype is None else np.dtype(dtype)
+
+
+# ============================================================================
+# Tiled Evaluation
+# ============================================================================
+# Shaders are evaluated in horizontal bands of rows. NumPy releases the GIL
+# inside large ufuncs, so bands run concurrently on a shared thread pool.
+# Bands are sized so that one input tile is ~128 KB: a shader's dozen or so
+# live temporaries per tile then stay resident in L2.
+
+TILE_TARGET_BYTES = 128 * 1024
+
+_thread_pool = None
+
+
+def get_thread_pool():
+    """Return the process-wide shader thread pool, creating it on first use."""
+    global _thread_pool
+    if _thread_pool is None:
+        _thread_pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1,
+                                          thread_name_prefix="shader")
+    return _thread_pool
+
+
+def compute_row_tiles(virt_height, virt_width, itemsize=8, target_bytes=TILE_TARGET_BYTES):
+    """
+    Split the virtual grid into row slices of roughly target_bytes each.
+    Tile heights are multiples of 4 so bands line up with Braille cells.
+    """
+    rows = target_bytes // (max(virt_width, 1) * itemsize)
+    rows = max(4, rows - rows % 4)
+    return [slice(y, min(y + rows, virt_height)) for y in range(0, virt_height, rows)]
+
+
+def virtual_size(width, height, use_braille):
+    """Virtual pixel resolution (virt_width, virt_height) for a terminal size and mode."""
+    if use_braille:
+        # Braille: 2 horizontal x 4 vertical sub-pixels per cell
+        return width * 2, height * 4
+    # Block: 1 horizontal x 2 vertical sub-pixels per cell
+    return width, height * 2
+
+
+def build_uv_grid(width, height, use_braille, dtype=np.float64):
+    """
+    Build the U, V coordinate grids for every virtual pixel.
+    V runs from 1.0 (top) to -1.0 (bottom); U is scaled by the terminal aspect.
+    """
+    virt_width, virt_height = virtual_size(width, height, use_braille)
+    aspect = width / height
+    
+    # Y coordinates: y=0 -> 1.0 (top), y=virt_height -> -1.0 (bottom)
+    y_indices = np.arange(virt_height)
+    v = 1.0 - (y_indices / virt_height) * 2.0
+    
+    # X coordinates
+    x_indices = np.arange(virt_width)
+    u = (x_indices / virt_width) * 2.0 - 1.0
+    u = u * aspect
+    
+    # Create Meshgrid (coordinates are computed in float64, then cast)
+    u_grid, v_grid = np.meshgrid(u, v)
+    return u_grid.astype(dtype, copy=False), v_grid.astype(dtype, copy=False)
+
+
+# ============================================================================
+# Shader Context (scratch arena)
+# ============================================================================
+# Shaders run once per frame on a grid whose size only changes on resize, so
+# their temporaries can live in named arrays that are allocated on the first
+# frame and reused afterwards. Shaders opt in with use_context=True and then
+# receive a ShaderContext as a fourth argument: shader(u, v, t, ctx).
+# Every row tile owns its own context, so a context is only ever used by one
+# thread at a time.
+
+class ShaderContext:
+    """
+    Named scratch arrays for one evaluation grid. Contents persist between
+    frames but carry no meaning: shaders must overwrite what they read.
+    An array returned by a shader may be a context array; the engine
+    consumes it before the next frame.
+    """
+    
+    def __init__(self, shape, dtype=np.float64):
+        self.shape = shape
+        self.dtype = np.dtype(dtype)
+        self._arrays = {}
+    
+    def array(self, name, shape=None, dtype=None):
+        """Uninitialised array `name` (default: grid shape and dtype)."""
+        shape = self.shape if shape is None else shape
+        dtype = self.dtype if dtype is None else dtype
+        key = (name, shape, np.dtype(dtype))
+        arr = self._arrays.get(key)
+        if arr is None:
+            arr = self._arrays[key] = np.empty(shape, dtype=dtype)
+        return arr
+    
+    def zeros(self, name, shape=None, dtype=None):
+        """Array `name` filled with zeros."""
+        arr = self.array(name, shape, dtype)
+        arr.fill(0)
+        return arr
+    
+    def full(self, name, value, shape=None, dtype=None):
+        """Array `name` filled with `value`."""
+        arr = self.array(name, shape, dtype)
+        arr.fill(value)
+        return arr
+    
+    def apply(self, name, ufunc, *args, dtype=None):
+        """
+        ufunc(*args) written into array `name`. Shape comes from
+        broadcasting the arguments, dtype from promoting them.
+        """
+        shape = np.broadcast_shapes(*(np.shape(a) for a in args))
+        out = self.array(name, shape, np.result_type(*args) if dtype is None else dtype)
+        return ufunc(*args, out=out)
+    
+    def mix(self, name, a, b, t):
+        """GLSL mix, a + (b - a) * t, written into array `name`."""
+        out = self.array(name, np.broadcast_shapes(np.shape(a), np.shape(b), np.shape(t)),
+                         np.result_type(a, b, t))
+        np.subtract(b, a, out=out)
+        out *= t
+        out += a
+        return out
+    
+    def smoothstep(self, name, edge0, edge1, x):
+        """GLSL smoothstep, written into array `name`."""
+        shape = np.shape(x)
+        dtype = np.result_type(x, 0.5)
+        s = self.array(name + ".t", shape, dtype)
+        np.subtract(x, edge0, out=s)
+        s *= 1.0 / (edge1 - edge0)
+        np.clip(s, 0.0, 1.0, out=s)
+        out = self.array(name, shape, dtype)
+        np.multiply(s, -2.0, out=out)
+        out += 3.0
+        out *= s
+        out *= s
+        return out
+    
+    @property
+    def nbytes(self):
+        """Total size of all arrays held by the context."""
+        return sum(arr.nbytes for arr in self._arrays.values())
+    
+    def clear(self):
+        """Release every array."""
+        self._arrays.clear()
+
+
+# ============================================================================
+# Static Fields
+# ============================================================================
+# Much of a shader's work is often a function of the coordinates alone
+# (a coordinate transform, a mask, a static texture) with time entering
+# only at the end. static_field computes such fields once per grid and
+# hands out the same arrays on later frames. The key is the field's name,
+# its parameters and the grid itself (shape, dtype and corner coordinates),
+# so every resolution, row tile, interlaced field and region gets its own.
+
+# Bytes of fields kept; past this the least recently used go first, so
+# the grids of earlier terminal sizes make way on resize
+STATIC_FIELD_BYTES = 64 * 1024 * 1024
+
+_static_fields = OrderedDict()  # key -> (field, nbytes)
+_static_fields_bytes = 0
+_static_fields_lock = threading.Lock()  # Row tiles look fields up concurrently
+
+
+def static_field(name, u, v, compute, *params):
+    """
+    Memoised compute(u, v, *params) for a field that does not depend on time.
+    
+    Args:
+        name: Field name, unique per shader (e.g. "blackhole.base")
+        u, v: Coordinate grids of this evaluation
+        compute: Function of (u, v, *params) returning an array or a tuple
+                 of arrays
+        params: Hashable parameters the field depends on
+    
+    Returns:
+        The field(s), shared between frames: read-only.
+    """
+    corners = (u.flat[0], u.flat[-1], v.flat[0], v.flat[-1]) if u.size else ()
+    key = (name, u.shape, u.dtype.str) + corners + params
+    global _static_fields_bytes
+    with _static_fields_lock:
+        entry = _static_fields.get(key)
+        if entry is not None:
+            _static_fields.move_to_end(key)
+            return entry[0]
+    
+    field = compute(u, v, *params)
+    arrays = field if isinstance(field, tuple) else (field,)
+    for arr in arrays:
+        arr.setflags(write=False)
+    nbytes = sum(arr.nbytes for arr in arrays)
+    with _static_fields_lock:
+        previous = _static_fields.pop(key, None)
+        if previous is not None:
+            _static_fields_bytes -= previous[1]
+        _static_fields[key] = (field, nbytes)
+        _static_fields_bytes += nbytes
+        # The newest entry always stays, even on its own over the budget
+        while _static_fields_bytes > STATIC_FIELD_BYTES and len(_static_fields) > 1:
+            _, (_, dropped) = _static_fields.popitem(last=False)
+            _static_fields_bytes -= dropped
+    return field
+
+
+def clear_static_fields():
+    """Drop every memoised static field."""
+    global _static_fields_bytes
+    with _static_fields_lock:
+        _static_fields.clear()
+        _static_fields_bytes = 0
+
+
+# ============================================================================
+# Separable Coordinates
+# ============================================================================
+# On a full grid or a row tile, u only varies along columns and v only along
+# rows. Terms that depend on one coordinate alone then need one value per
+# column or per row instead of one per pixel: grid_axes hands out u as a
+# (1, W) row and v as a (H, 1) column, and NumPy broadcasting expands them
+# where they meet. Interlaced fields and regions of interest are not
+# separable; there the full arrays come back and the same code still works.
+
+
+def _split_axes(u, v):
+    u_axis = u[:1] if (u == u[:1]).all() else u
+    v_axis = v[:, :1] if (v == v[:, :1]).all() else v
+    return u_axis.copy(), v_axis.copy()
+
+
+def grid_axes(u, v):
+    """
+    The coordinates as broadcastable axes where the grid allows it.
+
+    Returns:
+        (u_axis, v_axis): u as a (1, W) row if it is the same in every row,
+        v as a (H, 1) column if it is the same in every column, otherwise
+        the full arrays. Memoised per grid like static_field: read-only.
+    """
+    return static_field("grid_axes", u, v, _split_axes)
+
+
+def stack_rgb(r, g, b):
+    """Stack colour channels of broadcastable shapes into (H, W, 3)."""
+    return np.stack(np.broadcast_arrays(r, g, b), axis=-1)
+
+
+# ============================================================================
+# Ray Marching
+# ============================================================================
+# Vectorised sphere tracing that only spends work on rays still in flight.
+# Live rays are kept as an index array into the flattened grid together with
+# their gathered origin, direction and distance. Rays that hit or leave the
+# scene are recorded straight away and stop advancing; once enough of them
+# have finished, the live set is compacted so later distance evaluations
+# only see the remaining rays.
+
+MarchResult = namedtuple("MarchResult", "t steps hit values")
+
+
+def _blocks(a, shape, block):
+    """(H, W) array (or scalar) -> (H/block, W/block, block*block) tiles, edges repeated."""
+    a = np.broadcast_to(a, shape)
+    a = np.pad(a, ((0, -shape[0] % block), (0, -shape[1] % block)), mode="edge")
+    rows, cols = a.shape[0] // block, a.shape[1] // block
+    return a.reshape(rows, block, cols, block).swapaxes(1, 2).reshape(rows, cols, block * block)
+
+
+def cone_prepass(distance_func, origin, direction, block, max_steps=64, hit_dist=1e-3,
+                 max_dist=20.0, step_scale=1.0, active=None, distance_scale=1.0):
+    """
+    Conservative start distances for a 2-D grid of rays from a coarse pass.
+    
+    One cone is marched per block x block tile of rays, wide enough to
+    contain every ray of the tile (half-angle from the tile's actual ray
+    directions, plus the spread of its origins). The cone advances by the
+    distance minus its radius and stops once the radius reaches the
+    distance, so everything in front of its final depth is empty for all
+    rays of the tile. distance_scale < 1 makes the cone trust only that
+    fraction of the distance, for fields that overestimate it. Returns
+    per-ray start distances shaped like the grid.
+    """
+    components = tuple(origin) + tuple(direction)
+    shape = np.broadcast_shapes(*(np.shape(c) for c in components))
+    dtype = np.result_type(*components, 0.5)
+    tiles = [_blocks(np.asarray(c, dtype=dtype), shape, block) for c in components]
+    
+    # Cone axis: mean origin and mean direction of each tile
+    axis = [c.mean(axis=-1) for c in tiles]
+    norm = np.sqrt(axis[3] ** 2 + axis[4] ** 2 + axis[5] ** 2)
+    for c in axis[3:]:
+        c /= norm
+    spread = np.sqrt(sum((c - a[..., np.newaxis]) ** 2 for c, a in zip(tiles[:3], axis[:3]))).max(axis=-1)
+    cos = sum(c * a[..., np.newaxis] for c, a in zip(tiles[3:], axis[3:])).min(axis=-1)
+    cos = np.clip(cos, 1e-3, 1.0)
+    slope = np.sqrt(1.0 - cos * cos) / cos  # tan of the half-angle
+    
+    limit = np.asarray(max_dist, dtype=dtype)
+    limit = np.broadcast_to(limit, axis[0].shape) if limit.ndim == 0 else _blocks(limit, shape, block).min(axis=-1)
+    live = np.ones(axis[0].shape, dtype=bool) if active is None else _blocks(active, shape, block).any(axis=-1)
+    
+    depth = np.zeros(axis[0].shape, dtype=dtype)
+    index = np.flatnonzero(live)
+    flat = [c.reshape(-1) for c in axis]
+    spread, slope, limit = spread.reshape(-1), slope.reshape(-1), limit.reshape(-1)
+    travelled = depth.reshape(-1)
+    for step in range(max_steps):
+        if index.size == 0:
+            break
+        t = travelled[index]
+        ox, oy, oz, dx, dy, dz = (c[index] for c in flat)
+        result = distance_func(ox + dx * t, oy + dy * t, oz + dz * t)
+        dist = (result[0] if isinstance(result, tuple) else result) * distance_scale
+        radius = spread[index] + slope[index] * t
+        
+        # The cone touches something: stop short of it
+        advance = (dist - radius - hit_dist) * step_scale
+        moving = advance > 0.0
+        t = np.minimum(t + np.where(moving, advance, 0.0), limit[index])
+        travelled[index] = t
+        index = index[moving & (t < limit[index])]
+    
+    # Back to rays; origins off the cone axis lose their offset
+    start = np.repeat(np.repeat(depth, block, axis=0), block, axis=1)[:shape[0], :shape[1]]
+    spread = np.repeat(np.repeat(spread.reshape(depth.shape), block, axis=0), block, axis=1)[:shape[0], :shape[1]]
+    return np.maximum(start - spread, 0.0)
+
+
+def march(distance_func, origin, direction, max_steps=64, hit_dist=1e-3, max_dist=20.0,
+          step_scale=1.0, min_step=0.0, active=None, compact_ratio=0.25, t_start=None,
+          cone_block=0, cone_scale=1.0):
+    """
+    Sphere-trace a grid of rays.
+    
+    Args:
+        distance_func: f(px, py, pz) -> distance, for 1-D arrays of live ray
+                       positions. May return (distance, value, ...) to record
+                       extra per-ray values at the hit point.
+        origin: (x, y, z) ray origins, arrays or scalars broadcastable to the grid
+        direction: (x, y, z) ray directions, arrays broadcastable to the grid
+        max_steps: Distance evaluations per ray at most
+        hit_dist: A ray hits where the distance drops below this
+        max_dist: A ray misses once it has travelled further than this
+                  (scalar or per-ray array)
+        step_scale: Fraction of the distance to advance (< 1 for unsafe SDFs)
+        min_step: Smallest advance per step
+        active: Optional boolean mask of rays to march (others stay at t = 0)
+        compact_ratio: Compact the live set once this fraction of it is done
+        t_start: Optional per-ray distance to start marching from (e.g.
+                 where a ray enters the scene bounds). A ray that starts
+                 inside the surface (distance < 0) falls back to marching
+                 from 0, or from the cone pre-pass depth.
+        cone_block: For 2-D grids, first march one cone per cone_block x
+                    cone_block tile (cone_prepass) and start every ray at
+                    its tile's conservative depth; 0 disables
+        cone_scale: Fraction of the distance the cone pass trusts
+    
+    Returns:
+        MarchResult(t, steps, hit, values), all shaped like the grid. steps
+        counts the distance evaluations each ray took; values holds the
+        extra distance_func outputs at hits (zero elsewhere).
+    """
+    components = tuple(origin) + tuple(direction)
+    shape = np.broadcast_shapes(*(np.shape(c) for c in components))
+    dtype = np.result_type(*components, 0.5)
+    size = int(np.prod(shape))
+    
+    t = np.zeros(size, dtype=dtype)
+    steps = np.zeros(size, dtype=np.int32)
+    hit = np.zeros(size, dtype=bool)
+    values = None
+    
+    index = np.arange(size) if active is None else np.flatnonzero(active)
+    rays = [np.broadcast_to(np.asarray(c, dtype=dtype), shape).reshape(-1)[index] for c in components]
+    
+    # Lowest start: 0, or what the cone pre-pass proved empty
+    if cone_block > 1 and len(shape) == 2:
+        floor = cone_prepass(distance_func, origin, direction, cone_block, max_steps=max_steps,
+                             hit_dist=hit_dist, max_dist=max_dist, step_scale=step_scale,
+                             active=active, distance_scale=cone_scale).reshape(-1)[index].astype(dtype)
+    else:
+        floor = np.zeros(index.size, dtype=dtype)
+    travelled = floor.copy()
+    if t_start is not None:
+        np.maximum(travelled, np.broadcast_to(t_start, shape).reshape(-1)[index], out=travelled)
+    limit = max_dist if np.ndim(max_dist) == 0 else np.broadcast_to(max_dist, shape).reshape(-1)[index]
+    alive = np.ones(index.size, dtype=bool)
+    
+    # Rays that start beyond their range miss without being evaluated
+    gone = travelled > limit
+    if gone.any():
+        t[index[gone]] = travelled[gone]
+        alive &= ~gone
+    
+    for step in range(max_steps):
+        if index.size == 0:
+            break
+        ox, oy, oz, dx, dy, dz = rays
+        result = distance_func(ox + dx * travelled, oy + dy * travelled, oz + dz * travelled)
+        dist, extra = (result[0], result[1:]) if isinstance(result, tuple) else (result, ())
+        if values is None:
+            values = [np.zeros(size, dtype=np.result_type(e)) for e in extra]
+        
+        # Rays whose start lies inside the surface skipped past it, so
+        # these march from the start (no hit and no advance this step)
+        restart = None
+        if step == 0 and t_start is not None:
+            restart = (dist < 0.0) & (travelled > floor)
+            travelled[restart] = floor[restart]
+        
+        # Hits are recorded where they stand
+        hit_now = (dist < hit_dist) & alive
+        if restart is not None:
+            hit_now &= ~restart
+        if hit_now.any():
+            rec = index[hit_now]
+            hit[rec] = True
+            t[rec] = travelled[hit_now]
+            steps[rec] = step + 1
+            for value, e in zip(values, extra):
+                value[rec] = e[hit_now]
+            alive &= ~hit_now
+        
+        # Advance the rest; misses leave through max_dist
+        advance = np.maximum(dist, min_step)
+        advance *= step_scale
+        advance[~alive] = 0.0
+        if restart is not None:
+            advance[restart] = 0.0
+        travelled += advance
+        gone = alive & (travelled > limit)
+        if gone.any():
+            rec = index[gone]
+            t[rec] = travelled[gone]
+            steps[rec] = step + 1
+            alive &= ~gone
+        
+        # Compact once enough of the live set has finished
+        live = np.count_nonzero(alive)
+        if live <= (1.0 - compact_ratio) * index.size:
+            keep = np.flatnonzero(alive)
+            index = index[keep]
+            rays = [c[keep] for c in rays]
+            travelled = travelled[keep]
+            if np.ndim(limit):
+                limit = limit[keep]
+            alive = np.ones(index.size, dtype=bool)
+    
+    # Rays still marching after max_steps
+    rec = index[alive]
+    t[rec] = travelled[alive]
+    steps[rec] = max_steps
+    
+    # Nothing was evaluated: ask for the shape of the extra values
+    if values is None:
+        empty = np.zeros(0, dtype=dtype)
+        result = distance_func(empty, empty, empty)
+        extra = result[1:] if isinstance(result, tuple) else ()
+        values = [np.zeros(size, dtype=np.result_type(e)) for e in extra]
+    
+    return MarchResult(t.reshape(shape), steps.reshape(shape), hit.reshape(shape),
+                       [value.reshape(shape) for value in values])
+
+
+# ============================================================================
+# Escape-Time Iteration
+# ============================================================================
+# Vectorised iteration of complex maps (Julia/Mandelbrot, Kleinian
+# inversions) with per-point early exit. Like march(), points that escape or
+# settle are recorded immediately and the live set is compacted once enough
+# of it has finished, so deep iteration budgets only cost work where the
+# orbit is still going.
+
+EscapeResult = namedtuple("EscapeResult", "iterations z escaped smooth")
+
+
+def escape_time(step_func, z, c=None, max_iter=64, bailout=2.0, active=None, compact_ratio=0.25):
+    """
+    Iterate z <- step_func(z, c) per point until it escapes or settles.
+    
+    Args:
+        step_func: f(z, c) -> new z, for 1-D arrays of live points (c is
+                   None if not given). May return (new z, moving) where a
+                   False in moving means the point has settled; settled
+                   points must be returned unchanged.
+        z: Complex starting values (array)
+        c: Optional per-point parameter, broadcastable to z
+        max_iter: Iteration budget per point
+        bailout: A point escapes once |z| > bailout (None to disable)
+        active: Optional boolean mask of points to iterate
+        compact_ratio: Compact the live set once this fraction of it is done
+    
+    Returns:
+        EscapeResult(iterations, z, escaped, smooth), shaped like z.
+        iterations counts the steps applied before each point stopped
+        (max_iter if it never did); smooth is the continuous iteration
+        count n + 1 - log2(log2|z|) for escaped points and iterations
+        elsewhere.
+    """
+    z = np.asarray(z)
+    shape = z.shape
+    size = z.size
+    real_dtype = np.empty(0, dtype=z.dtype).real.dtype
+    
+    iterations = np.full(size, max_iter, dtype=np.int32)
+    final_z = z.reshape(-1).copy()
+    escaped = np.zeros(size, dtype=bool)
+    
+    index = np.arange(size) if active is None else np.flatnonzero(active)
+    if active is not None:
+        iterations[~np.asarray(active).reshape(-1)] = 0
+    lz = final_z[index]
+    lc = None if c is None else np.broadcast_to(np.asarray(c, dtype=z.dtype), shape).reshape(-1)[index]
+    alive = np.ones(index.size, dtype=bool)
+    bailout_sq = None if bailout is None else bailout * bailout
+    
+    # Finished points keep iterating until the next compaction; their
+    # values are already recorded, so overflow there is harmless
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            if index.size == 0:
+                break
+            
+            # Escape test before each step, so iterations = steps applied
+            if bailout_sq is not None:
+                gone = alive & (lz.real * lz.real + lz.imag * lz.imag > bailout_sq)
+                if gone.any():
+                    rec = index[gone]
+                    iterations[rec] = i
+                    final_z[rec] = lz[gone]
+                    escaped[rec] = True
+                    alive &= ~gone
+            
+            result = step_func(lz, lc)
+            if isinstance(result, tuple):
+                lz, moving = result
+                settled = alive & ~moving
+                if settled.any():
+                    rec = index[settled]
+                    iterations[rec] = i
+                    final_z[rec] = lz[settled]
+                    alive &= ~settled
+            else:
+                lz = result
+            
+            # Compact once enough of the live set has finished
+            live = np.count_nonzero(alive)
+            if live <= (1.0 - compact_ratio) * index.size:
+                keep = np.flatnonzero(alive)
+                index = index[keep]
+                lz = lz[keep]
+                if lc is not None:
+                    lc = lc[keep]
+                alive = np.ones(index.size, dtype=bool)
+    
+    # Points still live after max_iter
+    final_z[index[alive]] = lz[alive]
+    
+    # Continuous (smooth) iteration count for escaped points
+    smooth = iterations.astype(real_dtype)
+    modulus = np.abs(final_z[escaped])
+    smooth[escaped] += 1.0 - np.log2(np.log2(np.maximum(modulus, 1.0 + 1e-6)))
+    
+    return EscapeResult(iterations.reshape(shape), final_z.reshape(shape),
+                        escaped.reshape(shape), smooth.reshape(shape))
+
+
+def quadratic_step(z, c):
+    """The Julia/Mandelbrot map z^2 + c."""
+    z *= z
+    z += c
+    return z
+
+
+# ============================================================================
+# Regions of Interest
+# ============================================================================
+# Many shaders only draw inside a disk or a box and leave the rest of the
+# grid black. A shader declares that region with the roi decorator; the
+# renderer then evaluates it only on the selected pixels, passed as (1, N)
+# arrays, and fills the rest with a constant (or a cheap background shader).
+# A region depends on the coordinates only, so each grid is selected once.
+
+RegionSelection = namedtuple("RegionSelection", "shape index u v rest")
+
+
+def roi_disk(radius, center=(0.0, 0.0)):
+    """Region: UV points closer than radius to center."""
+    cu, cv = center
+    radius_sq = radius * radius
+    return lambda u, v: (u - cu) ** 2 + (v - cv) ** 2 < radius_sq
+
+
+def roi_box(u_min, u_max, v_min, v_max):
+    """Region: UV points inside an axis-aligned box."""
+    return lambda u, v: (u >= u_min) & (u <= u_max) & (v >= v_min) & (v <= v_max)
+
+
+def roi(region, fill=0.0):
+    """
+    Decorator declaring a shader's region of interest.
+    
+    Args:
+        region: region(u, v) -> boolean mask of the pixels the shader may
+                draw (roi_disk, roi_box or any cheap mask function). It
+                must not depend on time.
+        fill: Value of every other pixel, or a background shader
+              fill(u, v, t) evaluated on them instead
+    """
+    def declare(shader_func):
+        shader_func.roi = (region, fill)
+        return shader_func
+    return declare
+
+
+def select_region(shader_func, u, v):
+    """RegionSelection of a (H, W) grid for shader_func, or None without an ROI."""
+    roi_spec = getattr(shader_func, "roi", None)
+    if roi_spec is None:
+        return None
+    region, fill = roi_spec
+    mask = np.asarray(region(u, v), dtype=bool).reshape(-1)
+    flat_u, flat_v = u.reshape(-1), v.reshape(-1)
+    index = np.flatnonzero(mask)
+    rest = None
+    if callable(fill):
+        others = np.flatnonzero(~mask)
+        rest = (others, flat_u[others][np.newaxis], flat_v[others][np.newaxis])
+    return RegionSelection(u.shape, index, flat_u[index][np.newaxis],
+                           flat_v[index][np.newaxis], rest)
+
+
+def fill_region(shader_func, selection, result, time):
+    """Scatter a shader result for selection back into a full grid, filling the rest."""
+    fill = shader_func.roi[1]
+    result = np.asarray(result)
+    channels = result.shape[2:]
+    out = np.empty(selection.shape + channels, dtype=result.dtype)
+    flat = out.reshape((-1,) + channels)
+    if selection.rest is None:
+        flat[...] = fill
+    else:
+        others, rest_u, rest_v = selection.rest
+        flat[others] = np.broadcast_to(fill(rest_u, rest_v, time),
+                                       (1, others.size) + channels)[0]
+    flat[selection.index] = result.reshape((-1,) + channels)
+    return out
+
+
+# ============================================================================
+# Splatting
+# ============================================================================
+# Line-art shaders (Yeganeh-style drawings made of thousands of segments)
+# draw into the image rather than evaluating per pixel. Samples are
+# accumulated with np.bincount on flat pixel (and channel) indices, a
+# buffered scatter that is far faster than np.add.at. Coordinates are in
+# pixels: x is the column, y the row, and pixel (i, j) covers [i, i+1) x
+# [j, j+1). Shaders that splat need the whole frame (tiled=False).
+
+
+# Samples outside the image are clamped into a border this wide, which is
+# cropped off afterwards (cheaper than masking them out)
+SPLAT_BORDER = 2
+
+
+def _accumulate(shape, x, y, channels, antialias, dtype):
+    """Sum per-sample channel weights into an image (see splat_points)."""
+    height, width = shape
+    border = SPLAT_BORDER
+    stride = width + 2 * border
+    if antialias:
+        # Pixel centres around the sample, weighted by the opposite areas
+        x = x - 0.5
+        y = y - 0.5
+    fx, fy = np.floor(x), np.floor(y)
+    ix = np.clip(fx, -border, width, out=np.empty_like(fx)).astype(np.intp)
+    iy = np.clip(fy, -border, height, out=np.empty_like(fy)).astype(np.intp)
+    index = (iy + border) * stride + (ix + border)
+
+    if antialias:
+        fx = np.subtract(x, fx, out=fx)
+        fy = np.subtract(y, fy, out=fy)
+        gx, gy = 1.0 - fx, 1.0 - fy
+        corners = ((index, gx * gy), (index + 1, fx * gy),
+                   (index + stride, gx * fy), (index + stride + 1, fx * fy))
+    else:
+        corners = ((index, None),)
+
+    size = (height + 2 * border) * stride
+    planes = []
+    for weights in channels:
+        plane = 0.0
+        for corner, area in corners:
+            plane = plane + np.bincount(corner, weights if area is None else weights * area,
+                                        minlength=size)
+        plane = plane.reshape(height + 2 * border, stride)
+        planes.append(plane[border:border + height, border:border + width])
+    if len(planes) == 1:
+        return planes[0].astype(dtype)
+    return np.stack(planes, axis=-1).astype(dtype)
+
+
+def splat_points(shape, x, y, values=None, weights=None, antialias=False, dtype=np.float32):
+    """
+    Accumulate weighted point samples into an image.
+
+    Args:
+        shape: (H, W) of the image
+        x, y: Sample positions in pixels (1-D)
+        values: Per-sample value (N,) or colour (N, C); default 1
+        weights: Per-sample weight multiplied into values; default 1
+        antialias: Spread each sample bilinearly over the four nearest
+                   pixel centres instead of dropping it into one pixel
+
+    Returns:
+        (H, W) image, or (H, W, C) for (N, C) values.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    weights = np.ones_like(x) if weights is None else np.broadcast_to(weights, x.shape)
+    if values is None:
+        channels = [weights]
+    else:
+        values = np.asarray(values)
+        columns = [values] if values.ndim == 1 else values.T
+        channels = [weights * column for column in columns]
+    return _accumulate(shape, x, y, channels, antialias, dtype)
+
+
+def splat_segments(shape, x0, y0, x1, y1, values=None, alpha=1.0, density=1.0,
+                   antialias=False, dtype=np.float32):
+    """
+    Accumulate line segments into an image.
+
+    Each segment is sampled in proportion to its length on screen (density
+    samples per pixel, at least one), and every sample carries the length
+    it stands for: a segment adds alpha per pixel it crosses whatever its
+    length, and one shorter than a pixel only adds its share.
+
+    Args:
+        shape: (H, W) of the image
+        x0, y0, x1, y1: Segment end points in pixels (1-D)
+        values: Per-segment value (N,) or colour (N, C); default 1
+        alpha: Coverage per pixel of length, scalar or per segment
+        density: Samples per pixel of length
+        antialias: Bilinear coverage (see splat_points)
+
+    Returns:
+        (H, W) image, or (H, W, C) for (N, C) values.
+    """
+    x0, y0, x1, y1 = (np.asarray(c, dtype=np.float64) for c in (x0, y0, x1, y1))
+    dx, dy = x1 - x0, y1 - y0
+    length = np.hypot(dx, dy)
+    counts = np.maximum(np.ceil(length * density).astype(np.intp), 1)
+
+    # Sample k of segment i sits at (k + 0.5) / counts[i] along it
+    total = int(counts.sum())
+    starts = np.cumsum(counts) - counts
+    along = np.arange(total, dtype=np.float64)
+    along -= np.repeat(starts - 0.5, counts)
+    along *= np.repeat(1.0 / counts, counts)
+
+    # Per-segment quantities are spread to the samples with np.repeat
+    weights = np.broadcast_to(alpha, length.shape) * length / counts
+    if values is None:
+        channels = [np.repeat(weights, counts)]
+    else:
+        values = np.asarray(values)
+        columns = [values] if values.ndim == 1 else values.T
+        channels = [np.repeat(weights * column, counts) for column in columns]
+    x = np.repeat(x0, counts) + np.repeat(dx, counts) * along
+    y = np.repeat(y0, counts) + np.repeat(dy, counts) * along
+    return _accumulate(shape, x, y, channels, antialias, dtype)
+
+
 class ShaderRenderer:
-    def __init__(self, width, height, theme_manager, use_braille=False):
+    def __init__(self, width, height, theme_manager, use_braille=False, tiled=True, dtype=None):
         """
         Initialize the shader renderer.
         
@@ -49,21 +855,20 @@ class ShaderRenderer:
             theme_manager: Theme manager for color gradients
             use_braille: If True, use Braille mode (2x4 sub-pixels per cell)
                          If False, use Block mode (1x2 sub-pixels per cell)
+            tiled: If True, evaluate the shader in row tiles on the thread pool.
+                   Disable for shaders that need the whole frame at once
+                   (np.gradient, image-space splatting, shape-derived coordinates).
+            dtype: Compute dtype of the UV grids (None: SHADER_DTYPE policy)
         """
         self.width = width
         self.height = height
         self.theme_manager = theme_manager
         self.use_braille = use_braille
+        self.tiled = tiled
+        self.dtype = resolve_dtype(dtype)
         
         # Virtual resolution depends on mode
-        if use_braille:
-            # Braille: 2 horizontal x 4 vertical sub-pixels per cell
-            self.virt_width = width * 2
-            self.virt_height = height * 4
-        else:
-            # Block: 1 horizontal x 2 vertical sub-pixels per cell
-            self.virt_width = width
-            self.virt_height = height * 2
+        self.virt_width, self.virt_height = virtual_size(width, height, use_braille)
         
         # Precompute Bayer Matrix for dithering (4x4)
         self.bayer = np.array([
@@ -74,32 +879,113 @@ class ShaderRenderer:
         ]) * (1.0/16.0) - 0.5  # Center around 0
         
         # Precompute UV coordinates for all virtual pixels
-        aspect = width / height
-        
-        # Y coordinates: y=0 -> 1.0 (top), y=virt_height -> -1.0 (bottom)
-        y_indices = np.arange(self.virt_height)
-        v = 1.0 - (y_indices / self.virt_height) * 2.0
-        
-        # X coordinates
-        x_indices = np.arange(self.virt_width)
-        u = (x_indices / self.virt_width) * 2.0 - 1.0
-        u = u * aspect
-        
-        # Create Meshgrid
-        self.U, self.V = np.meshgrid(u, v)
+        self.U, self.V = build_uv_grid(width, height, use_braille, self.dtype)
         
         # Tile bayer to match virtual size
         self.dither_map = np.tile(self.bayer, (self.virt_height // 4 + 1, self.virt_width // 4 + 1))
         self.dither_map = self.dither_map[:self.virt_height, :self.virt_width]
         self.dither_magnitude = 0.15  # Strength of dithering
+        
+        # Row bands for tiled evaluation
+        self.tiles = compute_row_tiles(self.virt_height, self.virt_width, self.dtype.itemsize)
+        
+        # Scratch contexts and region selections (per evaluated grid and
+        # tile), reset per shader
+        self.contexts = {}
+        self.selections = {}
+        self.context_owner = None
+        
+        # Temporal interlacing state (see Interlacer)
+        self.interlacer = None
 
-    def render(self, buffer, time, shader_func):
+    def get_context(self, shader_func, key=None, shape=None):
+        """
+        Scratch context for `shader_func`, one per evaluated grid or tile
+        (`key`; default: the whole frame). Contexts are dropped when a
+        different shader asks.
+        """
+        self._claim(shader_func)
+        shape = self.U.shape if shape is None else shape
+        ctx = self.contexts.get(key)
+        if ctx is None or ctx.shape != shape:
+            ctx = self.contexts[key] = ShaderContext(shape, self.dtype)
+        return ctx
+
+    def _claim(self, shader_func):
+        """Drop the per-grid state of the previous shader."""
+        if self.context_owner is not shader_func:
+            self.contexts = {}
+            self.selections = {}
+            self.context_owner = shader_func
+    
+    def get_selection(self, shader_func, key, u, v):
+        """Region selection of grid `key` for a shader with an ROI."""
+        self._claim(shader_func)
+        selection = self.selections.get(key)
+        if selection is None:
+            selection = self.selections[key] = select_region(shader_func, u, v)
+        return selection
+    
+    def call(self, shader_func, u, v, time, use_context=False, key=None):
+        """
+        shader_func on one grid or tile (`key`), restricted to its region
+        of interest if it declares one.
+        """
+        selection = None
+        if getattr(shader_func, "roi", None) is not None:
+            selection = self.get_selection(shader_func, key, u, v)
+            u, v = selection.u, selection.v
+        args = (u, v, time)
+        if use_context:
+            args += (self.get_context(shader_func, key, u.shape),)
+        result = shader_func(*args)
+        if selection is None:
+            return result
+        return fill_region(shader_func, selection, result, time)
+    
+    def evaluate(self, shader_func, time, use_context=False):
+        """
+        Evaluate the shader over the full virtual grid.
+        Uses row tiles on the thread pool when enabled and worthwhile.
+        With use_context, the shader is called as shader(u, v, t, ctx).
+        """
+        return self.evaluate_grid(shader_func, time, self.U, self.V, self.tiles, use_context)
+
+    def evaluate_grid(self, shader_func, time, U, V, tiles, use_context=False, key=None):
+        """
+        Evaluate the shader on an arbitrary (H, W) coordinate grid split
+        into `tiles` row slices. `key` tells this grid's contexts apart.
+        """
+        if not self.tiled or len(tiles) == 1 or (os.cpu_count() or 1) == 1:
+            return self.call(shader_func, U, V, time, use_context, key)
+        
+        self._claim(shader_func)  # Before the tiles share the state
+        pool = get_thread_pool()
+        futures = [pool.submit(self.call, shader_func, U[rows], V[rows], time, use_context,
+                               (key, rows.start, rows.stop))
+                   for rows in tiles]
+        return np.concatenate([f.result() for f in futures], axis=0)
+
+    def get_interlacer(self, mode, motion_threshold=None):
+        """Interlacer for this grid, rebuilt when the mode changes."""
+        if (self.interlacer is None or self.interlacer.mode != mode or
+                self.interlacer.motion_threshold != motion_threshold):
+            self.interlacer = Interlacer(self, mode, motion_threshold)
+        return self.interlacer
+
+    def render(self, buffer, time, shader_func, use_context=False):
         """
         Renders a frame using the provided shader function via Numpy.
         """
         # Call shader function with U, V arrays
-        intensity = shader_func(self.U, self.V, time)
-        
+        intensity = self.evaluate(shader_func, time, use_context)
+        self.present(buffer, intensity)
+
+    def present(self, buffer, intensity):
+        """
+        Dither, quantize and write an evaluated shader result to the buffer.
+        intensity is either (H, W) monochrome or (H, W, 3) RGB.
+        """
         is_rgb = (intensity.ndim == 3 and intensity.shape[-1] == 3)
         
         if is_rgb:
@@ -270,7 +1156,422 @@ class ShaderRenderer:
                 buffer.z_buffer[y][x] = 1.0
 
 
-def run_shader_animation(buffer, width, height, time, theme_manager, shader_func, use_braille=False):
+# ============================================================================
+# Temporal Interlacing
+# ============================================================================
+# Expensive shaders change little between ticks. In temporal mode only half
+# the virtual pixels are evaluated each frame, alternating rows or a
+# checkerboard, and the other half is kept from the previous frame. The two
+# halves swap every frame, so every pixel is at most one frame old and the
+# shader cost per frame halves.
+#
+# With a motion threshold, a kept pixel is replaced by the mean of its
+# freshly evaluated neighbours when any of them changed by more than the
+# threshold. Moving areas then lose some resolution instead of showing
+# comb artifacts.
+
+TEMPORAL_MODES = ("rows", "checkerboard")
+
+# A time jump larger than this (seek, pause) renders a full frame
+TEMPORAL_MAX_GAP = 1.0
+
+
+class Interlacer:
+    """
+    Holds the two interlaced fields of a renderer's grid and the history
+    frame they are merged into.
+    """
+    
+    def __init__(self, renderer, mode, motion_threshold=None):
+        if mode not in TEMPORAL_MODES:
+            raise ValueError("unknown temporal mode: %r" % (mode,))
+        self.renderer = renderer
+        self.mode = mode
+        self.motion_threshold = motion_threshold
+        self.fields = [self._build_field(parity) for parity in (0, 1)]
+        self.history = None
+        self.parity = 0
+        self.owner = None
+        self.last_time = None
+    
+    def _build_field(self, parity):
+        """
+        Index arrays, coordinates and tiles for one field. A checkerboard
+        field has ceil(W / 2) columns per row; on odd widths the last column
+        of every other row repeats the final pixel.
+        """
+        renderer = self.renderer
+        H, W = renderer.U.shape
+        if self.mode == "rows":
+            rows = np.arange(parity, H, 2)[:, np.newaxis]
+            cols = np.arange(W)[np.newaxis, :]
+        else:
+            rows = np.arange(H)[:, np.newaxis]
+            cols = np.arange((W + 1) // 2)[np.newaxis, :] * 2 + (rows + parity) % 2
+            np.minimum(cols, W - 1, out=cols)
+        rows, cols = np.broadcast_arrays(rows, cols)
+        
+        fresh = np.zeros((H, W), dtype=bool)
+        fresh[rows, cols] = True
+        u = renderer.U[rows, cols]
+        v = renderer.V[rows, cols]
+        tiles = compute_row_tiles(u.shape[0], u.shape[1], renderer.dtype.itemsize)
+        return rows, cols, u, v, fresh, tiles
+    
+    def _needs_full_frame(self, shader_func, time):
+        return (self.history is None or self.owner is not shader_func or
+                self.last_time is None or not 0 <= time - self.last_time <= TEMPORAL_MAX_GAP)
+    
+    def store(self, shader_func, time, frame):
+        """Adopt a full frame rendered elsewhere (e.g. the frame pipeline)."""
+        if self.history is None or self.history.shape != frame.shape:
+            self.history = np.array(frame, copy=True)
+        else:
+            np.copyto(self.history, frame)
+        self.owner = shader_func
+        self.last_time = time
+    
+    def step(self, shader_func, time, use_context=False):
+        """Render the next frame: one fresh field merged into the history."""
+        renderer = self.renderer
+        if self._needs_full_frame(shader_func, time):
+            self.store(shader_func, time, renderer.evaluate(shader_func, time, use_context))
+            return self.history
+        
+        parity = self.parity
+        self.parity ^= 1
+        self.last_time = time
+        rows, cols, u, v, fresh, tiles = self.fields[parity]
+        result = renderer.evaluate_grid(shader_func, time, u, v, tiles, use_context,
+                                        key=("field", parity))
+        
+        history = self.history
+        if result.shape[2:] != history.shape[2:]:
+            # Channel count changed (e.g. the shader switched to RGB)
+            self.history = None
+            return self.step(shader_func, time, use_context)
+        
+        if self.motion_threshold is None:
+            history[rows, cols] = result
+        else:
+            previous = history[rows, cols]
+            history[rows, cols] = result
+            self._reject_motion(rows, cols, fresh, np.abs(result - previous))
+        return history
+    
+    def _reject_motion(self, rows, cols, fresh, delta):
+        """Re-interpolate kept pixels next to fresh pixels that moved."""
+        history = self.history
+        if delta.ndim == 3:
+            delta = delta.max(axis=-1)
+        motion = np.zeros(fresh.shape, dtype=delta.dtype)
+        motion[rows, cols] = delta
+        
+        # Largest change among the 4-neighbours of each pixel
+        padded = np.pad(motion, 1, mode="edge")
+        near = np.maximum(np.maximum(padded[:-2, 1:-1], padded[2:, 1:-1]),
+                          np.maximum(padded[1:-1, :-2], padded[1:-1, 2:]))
+        moving = (near > self.motion_threshold) & ~fresh
+        if not moving.any():
+            return
+        
+        # Mean of the fresh 4-neighbours
+        extra = ((0, 0),) * (history.ndim - 2)
+        values = np.pad(history, ((1, 1), (1, 1)) + extra, mode="edge")
+        weights = np.pad(fresh, 1, mode="edge").astype(history.dtype)
+        if history.ndim == 3:
+            weights = weights[..., np.newaxis]
+        total = np.zeros_like(history)
+        count = np.zeros(weights[1:-1, 1:-1].shape, dtype=history.dtype)
+        for dy, dx in ((0, 1), (2, 1), (1, 0), (1, 2)):
+            w = weights[dy:dy + fresh.shape[0], dx:dx + fresh.shape[1]]
+            total += w * values[dy:dy + fresh.shape[0], dx:dx + fresh.shape[1]]
+            count += w
+        np.maximum(count, 1.0, out=count)
+        total /= count
+        history[moving] = total[moving]
+
+
+# ============================================================================
+# Frame Pipeline (stateless shaders)
+# ============================================================================
+# A stateless shader is a pure function of (u, v, t): frame t + dt does not
+# depend on frame t. Such shaders can be rendered a few frames ahead in a
+# process pool, which scales across cores independently of the GIL. Each
+# in-flight frame owns a shared-memory slot that the worker writes into, so
+# results reach the main process without pickling large arrays.
+
+# Per-process UV grid and scratch context cache for pipeline workers
+_worker_grids = {}
+
+
+def _render_frame_worker(shader_func, width, height, use_braille, use_context, dtype, time, shm_name):
+    """
+    Pipeline worker: evaluate one frame into a shared-memory slot.
+    Returns (shape, dtype) of the written result.
+    """
+    key = (shader_func, width, height, use_braille, dtype)
+    grid = _worker_grids.get(key)
+    if grid is None:
+        _worker_grids.clear()
+        u, v = build_uv_grid(width, height, use_braille, dtype)
+        selection = select_region(shader_func, u, v)
+        if selection is not None:
+            u, v = selection.u, selection.v
+        grid = _worker_grids[key] = (u, v, ShaderContext(u.shape, dtype), selection)
+    
+    u, v, ctx, selection = grid
+    result = shader_func(u, v, time, ctx) if use_context else shader_func(u, v, time)
+    if selection is not None:
+        result = fill_region(shader_func, selection, result, time)
+    result = np.asarray(result)
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray(result.shape, dtype=result.dtype, buffer=shm.buf)
+        out[...] = result
+        del out
+    finally:
+        shm.close()
+    return result.shape, result.dtype.str
+
+
+class FramePipeline:
+    """
+    Renders frames t, t+dt, t+2dt... ahead of time in a process pool and
+    hands them back in order. dt is inferred from successive requests; if
+    the requested time stops matching the prediction (speed change, seek)
+    the queue is flushed and refilled.
+    """
+    
+    def __init__(self, shader_func, width, height, use_braille, use_context=False, dtype=None,
+                 workers=None):
+        self.shader_func = shader_func
+        self.width = width
+        self.height = height
+        self.use_braille = use_braille
+        self.use_context = use_context
+        self.dtype = resolve_dtype(dtype)
+        self.workers = workers or max(1, (os.cpu_count() or 1) - 1)
+        self.depth = self.workers + 1
+        
+        # Largest possible result: (H, W, 3) float64 (even for float32 grids,
+        # a shader may promote its result)
+        virt_width, virt_height = virtual_size(width, height, use_braille)
+        slot_bytes = virt_width * virt_height * 3 * 8
+        self.slots = [shared_memory.SharedMemory(create=True, size=slot_bytes)
+                      for _ in range(self.depth + 1)]
+        self.free_slots = list(self.slots)
+        
+        # spawn: forking a process that owns the shader thread pool is unsafe
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        self.pending = deque()  # (time, future, slot)
+        self.last_time = None
+        self.held_slot = None
+    
+    def matches(self, shader_func, width, height, use_braille):
+        """Whether this pipeline was built for the given shader and size."""
+        return (self.shader_func is shader_func and self.width == width and
+                self.height == height and self.use_braille == use_braille)
+    
+    def _submit(self, time):
+        slot = self.free_slots.pop()
+        future = self.executor.submit(_render_frame_worker, self.shader_func, self.width,
+                                      self.height, self.use_braille, self.use_context,
+                                      self.dtype, time, slot.name)
+        self.pending.append((time, future, slot))
+    
+    def _flush(self):
+        """Drop queued frames, waiting for any that are already running."""
+        while self.pending:
+            _, future, slot = self.pending.popleft()
+            if not future.cancel():
+                try:
+                    future.result()
+                except Exception:
+                    pass
+            self.free_slots.append(slot)
+    
+    def fetch(self, time):
+        """
+        Return the frame for `time` as an array, or None when no prefetched
+        frame matches (the caller then renders it in-process). The returned
+        array views a shared slot and stays valid until the next fetch.
+        """
+        if self.held_slot is not None:
+            self.free_slots.append(self.held_slot)
+            self.held_slot = None
+        
+        dt = None if self.last_time is None else time - self.last_time
+        self.last_time = time
+        
+        frame = None
+        if self.pending and abs(self.pending[0][0] - time) < 1e-6:
+            _, future, slot = self.pending.popleft()
+            shape, dtype = future.result()
+            frame = np.ndarray(shape, dtype=np.dtype(dtype), buffer=slot.buf)
+            self.held_slot = slot
+        else:
+            self._flush()
+        
+        # Keep the queue topped up with predicted future frames
+        if dt is not None and dt > 0:
+            next_time = self.pending[-1][0] if self.pending else time
+            while len(self.pending) < self.depth and self.free_slots:
+                next_time += dt
+                self._submit(next_time)
+        
+        return frame
+    
+    def close(self):
+        """Stop the workers and release all shared memory."""
+        # _flush cancels every queued frame (shutdown's cancel_futures
+        # needs Python 3.9)
+        self._flush()
+        self.executor.shutdown(wait=True)
+        for slot in self.slots:
+            slot.close()
+            slot.unlink()
+        self.slots = []
+        self.free_slots = []
+        self.held_slot = None
+
+
+_pipeline_enabled = False
+_frame_pipeline = None
+
+
+def enable_frame_pipeline():
+    """
+    Allow run_shader_animation to render frames ahead in worker processes.
+    Only call this for stateless shaders (pure functions of u, v, t).
+    Has no effect on single-core machines.
+    """
+    global _pipeline_enabled
+    _pipeline_enabled = (os.cpu_count() or 1) > 1
+
+
+def disable_frame_pipeline():
+    """Turn the frame pipeline off and release its workers and shared memory."""
+    global _pipeline_enabled, _frame_pipeline
+    _pipeline_enabled = False
+    if _frame_pipeline is not None:
+        _frame_pipeline.close()
+        _frame_pipeline = None
+
+
+def _get_frame_pipeline(shader_func, width, height, use_braille, use_context, dtype):
+    global _frame_pipeline
+    if _frame_pipeline is not None and not _frame_pipeline.matches(shader_func, width, height, use_braille):
+        _frame_pipeline.close()
+        _frame_pipeline = None
+    if _frame_pipeline is None:
+        _frame_pipeline = FramePipeline(shader_func, width, height, use_braille, use_context, dtype)
+    return _frame_pipeline
+
+
+# ============================================================================
+# Precision Audit
+# ============================================================================
+# While enabled, run_shader_animation evaluates every frame twice: with the
+# shader's normal dtype and with float64 grids. Both results are averaged per
+# terminal cell (what is actually drawn) and compared. Per shader, the audit
+# records the largest cell difference and the largest fraction of cells in
+# one frame that differ visibly (by more than one 8-bit level). Hard-edged
+# shaders (grid lines, thresholds) always show a large maximum where an edge
+# moves by a pixel; the fraction says whether that happens at a few edges
+# or across the picture. Shaders that differ broadly should pass
+# dtype=np.float64.
+
+AUDIT_VISIBLE = 1.0 / 255.0
+
+_precision_audit = None
+_audit_renderers = {}
+
+
+def enable_precision_audit():
+    """Start recording float64-vs-policy differences for every shader frame."""
+    global _precision_audit
+    _precision_audit = {}
+
+
+def disable_precision_audit():
+    """Stop auditing and drop the reference renderers."""
+    global _precision_audit
+    _precision_audit = None
+    _audit_renderers.clear()
+
+
+def precision_report():
+    """
+    Audit results so far, as {shader name: (dtype, frames, max cell
+    difference, max fraction of visibly different cells)}. Differences are
+    in output units (0..1 intensity or RGB channel).
+    """
+    return dict(_precision_audit or {})
+
+
+def cell_difference(a, b, use_braille):
+    """
+    Per-cell absolute difference (H, W) between two shader results once
+    clipped to 0..1 and averaged over each cell's sub-pixels. RGB results
+    report their largest channel difference.
+    """
+    sub_y, sub_x = (4, 2) if use_braille else (2, 1)
+    cells = []
+    for result in (a, b):
+        result = np.clip(np.nan_to_num(np.asarray(result, dtype=np.float64)), 0.0, 1.0)
+        if result.ndim == 2:
+            result = result[..., np.newaxis]
+        h, w, c = result.shape
+        cells.append(result.reshape(h // sub_y, sub_y, w // sub_x, sub_x, c).mean(axis=(1, 3)))
+    return np.abs(cells[0] - cells[1]).max(axis=-1)
+
+
+def _audit_frame(renderer, shader_func, time, use_context, intensity):
+    key = (renderer.width, renderer.height, renderer.use_braille, renderer.tiled)
+    reference = _audit_renderers.get(key)
+    if reference is None:
+        _audit_renderers.clear()
+        reference = _audit_renderers[key] = ShaderRenderer(
+            renderer.width, renderer.height, renderer.theme_manager,
+            use_braille=renderer.use_braille, tiled=renderer.tiled, dtype=np.float64)
+    
+    expected = reference.evaluate(shader_func, time, use_context)
+    diff = cell_difference(intensity, expected, renderer.use_braille)
+    visible = float(np.mean(diff > AUDIT_VISIBLE))
+    
+    name = "%s.%s" % (shader_func.__module__, shader_func.__name__)
+    _, frames, worst, spread = _precision_audit.get(name, (None, 0, 0.0, 0.0))
+    _precision_audit[name] = (renderer.dtype.name, frames + 1,
+                              max(worst, float(diff.max())), max(spread, visible))
+
+
+# Renderer reused across frames while the terminal size and mode are stable
+_renderer_cache = {}
+
+
+def get_renderer(width, height, theme_manager, use_braille=False, tiled=True, dtype=None):
+    """
+    Return a ShaderRenderer for this size and mode, reusing the previous one
+    when nothing changed so the UV grids and tile layout are built once.
+    """
+    dtype = resolve_dtype(dtype)
+    key = (width, height, use_braille, tiled, dtype)
+    renderer = _renderer_cache.get(key)
+    if renderer is None:
+        _renderer_cache.clear()
+        renderer = ShaderRenderer(width, height, theme_manager,
+                                  use_braille=use_braille, tiled=tiled, dtype=dtype)
+        _renderer_cache[key] = renderer
+    renderer.theme_manager = theme_manager
+    return renderer
+
+
+def run_shader_animation(buffer, width, height, time, theme_manager, shader_func, use_braille=False,
+                         tiled=True, use_context=False, dtype=None, temporal=None,
+                         motion_threshold=None):
     """
     Convenience function to run a shader animation.
     
@@ -281,10 +1582,43 @@ def run_shader_animation(buffer, width, height, time, theme_manager, shader_func
         theme_manager: Theme manager for colors
         shader_func: Function(U, V, time) -> intensity array
         use_braille: Enable Braille rendering mode for 4x resolution
+        tiled: Evaluate in row tiles on the thread pool (set False for
+               shaders that operate on the whole frame)
+        use_context: Pass a ShaderContext scratch arena as a fourth
+                     argument, shader_func(U, V, time, ctx)
+        dtype: Compute dtype override (e.g. np.float64 for shaders that
+               fail the precision audit); None uses SHADER_DTYPE
+        temporal: "rows" or "checkerboard" to evaluate half the pixels per
+                  frame and keep the rest from the previous frame
+        motion_threshold: With temporal, re-interpolate kept pixels whose
+                          fresh neighbours changed by more than this
     
     Returns:
         Tuple for engine compatibility (rotation_x, rotation_y)
     """
-    renderer = ShaderRenderer(width, height, theme_manager, use_braille=use_braille)
-    renderer.render(buffer, time, shader_func)
+    renderer = get_renderer(width, height, theme_manager, use_braille=use_braille, tiled=tiled,
+                            dtype=dtype)
+    
+    if _precision_audit is not None:
+        intensity = renderer.evaluate(shader_func, time, use_context)
+        _audit_frame(renderer, shader_func, time, use_context, intensity)
+        renderer.present(buffer, intensity)
+        return (0, 1)
+    
+    if _pipeline_enabled:
+        frame = _get_frame_pipeline(shader_func, width, height, use_braille, use_context,
+                                    renderer.dtype).fetch(time)
+        if frame is not None:
+            if temporal:
+                # Keep the history current so a pipeline miss can resume
+                renderer.get_interlacer(temporal, motion_threshold).store(shader_func, time, frame)
+            renderer.present(buffer, frame)
+            return (0, 1)
+    
+    if temporal:
+        interlacer = renderer.get_interlacer(temporal, motion_threshold)
+        renderer.present(buffer, interlacer.step(shader_func, time, use_context))
+        return (0, 1)
+    
+    renderer.render(buffer, time, shader_func, use_context)
     return (0, 1)